@@ -1,4 +1,5 @@
 from .pbx import pbx_probe
 from .batch import BatchConfig
+from .references import ReferenceIndex
 
-__all__ = ['pbx_probe', 'BatchConfig']
+__all__ = ['pbx_probe', 'BatchConfig', 'ReferenceIndex']
@@ -0,0 +1,185 @@
+############################################################################
+
+# pyBibX - Affiliation matching.
+#
+# Country detection in affiliation strings. An affiliation is lowercased
+# and its aliases (the WoS abbreviations such as 'peoples r china' or
+# 'u arab emirates') are rewritten to country names, in order. Every
+# country name is compiled into one character trie, built once per
+# process for a given name list, so a single walk of the text finds all
+# the names it contains; of those the one listed first wins, as in the
+# legacy per-name loop. Names and aliases match whole words only, so
+# 'oman' is not read in 'Roman' nor 'usa' in 'Sousa'; words glued by the
+# export ('FluminenseBrazil', 'IBMECBrazil') are split where a
+# capitalized word starts.
+#
+# Institution detection picks, in each affiliation segment, the comma-
+# separated part holding the highest-priority institution keyword
+# ('university', 'inst', ...). The keywords are compiled into a single
+# regex and results are memoized per segment, since the same
+# affiliation strings recur across a corpus.
+
+############################################################################
+
+import re
+
+from functools import lru_cache
+
+############################################################################
+
+# (text, replacement) whole-word rewrites applied in order to the
+# lowercased affiliation before names are matched; the first two fold
+# the long USA spellings into 'usa' so that the last but one expands
+# every form alike.
+COUNTRY_ALIASES = [
+                   ('united states of america', 'usa'),
+                   ('united states',            'usa'),
+                   ('england',                  'united kingdom'),
+                   ('antigua & barbu',          'antigua and barbuda'),
+                   ('bosnia & herceg',          'bosnia and herzegovina'),
+                   ('cent afr republ',          'central african republic'),
+                   ('czech republic',           'czechia'),
+                   ('dominican rep',            'dominican republic'),
+                   ('equat guinea',             'equatorial guinea'),
+                   ('fr austr lands',           'french southern territories'),
+                   ('fr polynesia',             'french polynesia'),
+                   ('malagasy republ',          'madagascar'),
+                   ('mongol peo rep',           'mongolia'),
+                   ('neth antilles',            'saint martin'),
+                   ('north ireland',            'ireland'),
+                   ('peoples r china',          'china'),
+                   ('rep of georgia',           'georgia'),
+                   ('russia',                   'russian federation'),
+                   ('sao tome e prin',          'sao tome and principe'),
+                   ('scotland',                 'united kingdom'),
+                   ('st kitts & nevi',          'saint kitts and nevis'),
+                   ('trinid & tobago',          'trinidad and tobago'),
+                   ('u arab emirates',          'united arab emirates'),
+                   ('usa',                      'united states of america'),
+                   ('vietnam',                  'viet nam'),
+                  ]
+
+_CAMEL = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+############################################################################
+
+def _is_word(ch):
+    return ch.isalnum() or ch == '_'
+
+
+class CountryMatcher:
+    """Character trie of country names.
+
+    ``normalize`` splits glued words, lowercases an affiliation and
+    applies the ``aliases`` rewrites; ``find`` returns, of the ``names``
+    occurring as whole words in an affiliation, the one listed first.
+    Use ``country_matcher`` to share one instance per process.
+    """
+
+    _END = ''
+
+    def __init__(self, names, aliases = None):
+        # The ordered rewrites are folded into one alternation: each alias
+        # maps to what the whole sequence makes of it.
+        rewrites     = [(re.compile(r'(?<!\w)' + re.escape(old) + r'(?!\w)'), new) for old, new in (aliases or [])]
+        self.aliases = {}
+        for old, _ in (aliases or []):
+            text = old
+            for pattern, new in rewrites:
+                text = pattern.sub(new, text)
+            self.aliases.setdefault(old, text)
+        alternation  = '|'.join(re.escape(old) for old in sorted(self.aliases, key = len, reverse = True))
+        self.pattern = re.compile(r'(?<!\w)(?:' + alternation + r')(?!\w)') if self.aliases else None
+        self.root    = {}
+        for rank, name in enumerate(names):
+            key  = name.lower()
+            node = self.root
+            for ch in key:
+                node = node.setdefault(ch, {})
+            if (self._END not in node):
+                node[self._END] = (rank, name, _is_word(key[-1:]))
+
+    def normalize(self, text):
+        """Lowercased ``text`` with glued words split and aliases rewritten."""
+        text = _CAMEL.sub(' ', text).lower()
+        if (self.pattern is not None):
+            text = self.pattern.sub(lambda match: self.aliases[match.group()], text)
+        return text
+
+    def find(self, text):
+        """First listed country named in ``text`` (or None)."""
+        text = self.normalize(text)
+        best = None
+        for i in range(0, len(text)):
+            node = self.root.get(text[i])
+            if (node is None or (i > 0 and _is_word(text[i - 1]) and _is_word(text[i]))):
+                continue
+            j = i + 1
+            while (node is not None):
+                hit = node.get(self._END)
+                if (hit is not None and (best is None or hit[0] < best[0]) and not (hit[2] and j < len(text) and _is_word(text[j]))):
+                    best = hit
+                node = node.get(text[j]) if j < len(text) else None
+                j    = j + 1
+        return best[1] if best else None
+
+
+@lru_cache(maxsize = 8)
+def _country_matcher(names, aliases):
+    return CountryMatcher(names, aliases)
+
+
+def country_matcher(names, aliases = COUNTRY_ALIASES):
+    """Shared ``CountryMatcher`` for ``names`` and ``aliases`` (built once)."""
+    return _country_matcher(tuple(names), tuple(aliases))
+
+
+############################################################################
+
+class InstitutionMatcher:
+    """Institution part of affiliation segments, by keyword priority.
+
+    A comma-separated part of a segment scores the highest ``priority``
+    of the keywords it contains (as substrings); the best part wins, the
+    longer one on ties and then the first, and 'UNKNOWN' when no part
+    holds a keyword. The keywords form one lookahead alternation ordered
+    by priority, so a single scan of a part finds its score. ``top``
+    keeps an LRU memo of the last ``memo_size`` segments.
+    """
+
+    def __init__(self, priority, memo_size = 65536):
+        self.priority = dict(priority)
+        keywords      = sorted(self.priority, key = lambda keyword: (-self.priority[keyword], -len(keyword)))
+        self.pattern  = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))') if keywords else None
+        self.top      = lru_cache(maxsize = memo_size)(self._top)
+
+    def score(self, part):
+        """Highest keyword priority in ``part`` (None without keywords)."""
+        if (self.pattern is None):
+            return None
+        return max((self.priority[match.group(1)] for match in self.pattern.finditer(part)), default = None)
+
+    def _top(self, segment):
+        best, best_key = 'UNKNOWN', None
+        for part in segment.strip().lower().split(','):
+            score = self.score(part)
+            if (score is None):
+                continue
+            key = (score, len(part.strip()))
+            if (best_key is None or key > best_key):
+                best, best_key = part.strip(), key
+        return best
+
+    def extract(self, text):
+        """Institution of every ';'-separated segment of ``text``."""
+        return [self.top(segment) for segment in text.split(';')]
+
+
+@lru_cache(maxsize = 8)
+def _institution_matcher(priority):
+    return InstitutionMatcher(dict(priority))
+
+
+def institution_matcher(priority):
+    """Shared ``InstitutionMatcher`` for a keyword -> priority map (built once)."""
+    return _institution_matcher(tuple(sorted(priority.items())))
@@ -1467,20 +1467,10 @@ def hindex():
     if not STATE['pbx']:
         return jsonify({'ok': False, 'error': 'No dataset loaded'})
     d = request.json or {}
-    import pandas as pd
     pbx = STATE['pbx']
     year = _safe_int(d.get('year'), None)
     try:
-        data = {
-            'Author': pbx.u_aut,
-            'H-index': pbx.h_index(),
-            'G-index': pbx.g_index(),
-            'E-index': pbx.e_index(),
-            'J-index': pbx.j_index(),
-        }
-        if year is not None:
-            data['M-index'] = pbx.m_index(current_year=year)
-        df = pd.DataFrame(data)
+        df = pbx.author_indices(current_year=year)
         df = df.sort_values(['H-index', 'G-index', 'E-index', 'J-index'], ascending=False).reset_index(drop=True)
         return jsonify(run_fn(lambda: df))
     except Exception as e:
@@ -10,7 +10,12 @@
 
 ############################################################################
 
-from dataclasses import dataclass
+import glob
+import os
+
+from collections         import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses        import dataclass
 
 import numpy as np
 import pandas as pd
@@ -47,6 +52,13 @@ class BatchConfig:
     tfidf_dense_limit_rows : int
         Above this corpus size, ``dtm_tf_idf`` returns sparse output
         when called with ``return_type='auto'``.
+    ingest_workers : int or None
+        Process-pool size used when several export files are parsed
+        at once. None uses ``os.cpu_count()``; 1 parses serially.
+    workers : int or None
+        Process-pool size used by the batch ``__make_bib`` to parse
+        chunks in parallel. 1 (default) parses serially; None uses
+        ``os.cpu_count()``. The output does not depend on it.
     verbose : bool
         Toggle progress messages emitted by batch helpers.
     """
@@ -60,6 +72,8 @@ class BatchConfig:
     embedding_text_chunk_size: int = 2000
     embedding_batch_size: int = 128
     tfidf_dense_limit_rows: int = 5000
+    ingest_workers: int = None
+    workers: int = 1
     verbose: bool = False
 
 ############################################################################
@@ -106,6 +120,75 @@ def should_batch_df(df, config):
         return True
     return False
 
+
+def should_batch_file(path, config):
+    """Decide whether the export at ``path`` should be parsed in batch mode.
+
+    Returns True when the file on disk is at least the
+    ``auto_batch_memory_mb`` threshold from ``config``; the parsed frame
+    is never smaller than its source text.
+    """
+    try:
+        size_mb = os.path.getsize(path) / (1024.0 * 1024.0)
+    except (OSError, TypeError):
+        return False
+    return size_mb >= float(getattr(config, 'auto_batch_memory_mb', 256))
+
+############################################################################
+
+def expand_file_list(files):
+    """Resolve ``files`` into an ordered list of paths.
+
+    ``files`` may be a single path, a glob pattern (``*``, ``?`` or
+    ``[``) or a list/tuple mixing both. Glob matches are sorted so the
+    resulting order is reproducible across runs and platforms.
+    """
+    if isinstance(files, (str, os.PathLike)):
+        files = [files]
+    paths = []
+    for item in files:
+        item = os.fspath(item)
+        if any(ch in item for ch in '*?['):
+            matches = sorted(glob.glob(item))
+            if not matches:
+                raise FileNotFoundError(f"No files match pattern: {item}")
+            paths.extend(matches)
+        else:
+            paths.append(item)
+    return paths
+
+
+def resolve_workers(workers, n_jobs):
+    """Clamp a requested pool size to ``[1, n_jobs]``.
+
+    ``None`` (or a value <= 0) means one worker per CPU.
+    """
+    if workers is None or int(workers) <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(int(workers), int(n_jobs)))
+
+def ordered_pool_map(func, jobs, workers = 1, window = None):
+    """Yield ``func(job)`` for every job, in job order.
+
+    With ``workers`` > 1 the jobs run in a process pool; at most
+    ``window`` (default ``2 * workers``) are in flight, so a lazy
+    ``jobs`` iterable (e.g. ``chunk_dataframe``) is never materialized
+    in full. ``func`` must be picklable (module-level or staticmethod).
+    """
+    if workers is None or int(workers) <= 1:
+        for job in jobs:
+            yield func(job)
+        return
+    window = int(window) if window else 2 * int(workers)
+    with ProcessPoolExecutor(max_workers = int(workers)) as executor:
+        pending = deque()
+        for job in jobs:
+            pending.append(executor.submit(func, job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
 ############################################################################
 
 def chunk_dataframe(df, chunk_size):
@@ -0,0 +1,247 @@
+############################################################################
+
+# pyBibX - Content-addressed cache of parsed exports.
+#
+# Opt-in on-disk cache used by pbx_probe when ``cache_dir`` is given.
+# A parsed export is stored as an Arrow IPC (Feather v2) file next to
+# a small JSON sidecar holding the reader's side outputs (entries and
+# verbose lines). Entries are keyed on the SHA-256 of the file content,
+# the reader version and the reading options, so editing the export or
+# upgrading the parser simply misses the cache.
+#
+# The same Arrow helpers back the columnar (Parquet / Feather) formats
+# of save_database and load_database.
+
+############################################################################
+
+import csv
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .reader import PARSER_VERSION
+
+############################################################################
+
+_DIGEST_MEMO = {}
+
+def file_digest(path, block_size = 1 << 20):
+    """SHA-256 hex digest of the content of ``path``.
+
+    The file is hashed in blocks of ``block_size`` bytes. Digests are
+    memoized per process on (path, size, mtime) so re-opening an
+    unchanged file in the same session does not hash it again.
+    """
+    stat = os.stat(path)
+    memo = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if memo in _DIGEST_MEMO:
+        return _DIGEST_MEMO[memo]
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f_file:
+        for block in iter(lambda: f_file.read(block_size), b''):
+            digest.update(block)
+    _DIGEST_MEMO[memo] = digest.hexdigest()
+    return _DIGEST_MEMO[memo]
+
+
+def export_cache_key(path, db, del_duplicated = True):
+    """Cache key for ``path`` read as ``db`` with the given options."""
+    payload = {
+               'digest':         file_digest(path),
+               'parser':         PARSER_VERSION,
+               'db':             str(db).lower(),
+               'ext':            os.path.splitext(str(path))[1].lower(),
+               'del_duplicated': bool(del_duplicated),
+              }
+    text    = json.dumps(payload, sort_keys = True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
+
+def _require_pyarrow(feature = 'cache_dir or save_state'):
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError('Install pyarrow to use ' + feature + ' (data is stored in Arrow formats).') from exc
+    return pyarrow
+
+
+def _cache_paths(cache_dir, key):
+    return os.path.join(cache_dir, key + '.arrow'), os.path.join(cache_dir, key + '.json')
+
+
+def write_frame(path, data):
+    """Write ``data`` to ``path`` as Arrow IPC; return its ``object`` columns.
+
+    Cells are stored as strings. The returned column list is what
+    ``read_frame`` needs to restore the original dtypes.
+    """
+    _require_pyarrow()
+    frame          = data.reset_index(drop = True)
+    frame.columns  = [str(col) for col in frame.columns]
+    object_columns = [col for col in frame.columns if frame[col].dtype == object]
+    frame.astype(str).to_feather(path)
+    return object_columns
+
+
+def read_frame(path, object_columns = None, columns = None):
+    """Read an Arrow IPC frame written by ``write_frame``.
+
+    ``object_columns`` are cast back to ``object`` dtype; ``columns``
+    optionally restricts which columns are read from disk.
+    """
+    _require_pyarrow()
+    data           = pd.read_feather(path, columns = columns)
+    object_columns = [col for col in (object_columns or []) if col in data.columns]
+    if object_columns:
+        data[object_columns] = data[object_columns].astype(object)
+    return data
+
+
+def load_export_cache(cache_dir, key):
+    """Return ``(data, meta)`` for ``key`` or ``None`` on a cache miss.
+
+    Columns that were ``object`` when stored are restored as ``object``
+    so the frame matches the one the readers produce. A corrupt or
+    half-written entry is treated as a miss.
+    """
+    data_path, meta_path = _cache_paths(cache_dir, key)
+    if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+        return None
+    _require_pyarrow()
+    try:
+        with open(meta_path, 'r', encoding = 'utf-8') as f_file:
+            meta = json.load(f_file)
+        if (meta.get('parser') != PARSER_VERSION):
+            return None
+        data = read_frame(data_path, meta.get('object_columns', []))
+    except Exception:
+        return None
+    return data, meta
+
+
+def save_export_cache(cache_dir, key, data, **meta):
+    """Store ``data`` (plus JSON-serializable ``meta``) under ``key``.
+
+    Both files are written to temporary names and moved into place, so
+    concurrent readers never observe a partial entry.
+    """
+    _require_pyarrow()
+    os.makedirs(cache_dir, exist_ok = True)
+    data_path, meta_path = _cache_paths(cache_dir, key)
+    tmp_suffix           = '.tmp-' + str(os.getpid())
+    object_columns       = write_frame(data_path + tmp_suffix, data)
+    meta                 = dict(meta, parser = PARSER_VERSION, object_columns = object_columns)
+    with open(meta_path + tmp_suffix, 'w', encoding = 'utf-8') as f_file:
+        json.dump(meta, f_file)
+    os.replace(data_path + tmp_suffix, data_path)
+    os.replace(meta_path + tmp_suffix, meta_path)
+    return data_path
+
+
+############################################################################
+
+DATABASE_FORMATS = {
+                    '.parquet': 'parquet', '.pq':      'parquet',
+                    '.feather': 'feather', '.arrow':   'feather', '.ipc': 'feather',
+                   }
+
+def database_format(name, file_format = None):
+    """Return ``'csv'``, ``'parquet'`` or ``'feather'`` for ``name``.
+
+    An explicit ``file_format`` wins; otherwise the file extension
+    decides, and anything unrecognized is delimited text.
+    """
+    if (file_format is not None):
+        file_format = str(file_format).lower()
+        file_format = {'pq': 'parquet', 'arrow': 'feather', 'ipc': 'feather', 'tsv': 'csv', 'txt': 'csv'}.get(file_format, file_format)
+        if (file_format not in ('csv', 'parquet', 'feather')):
+            raise ValueError("file_format must be 'csv', 'parquet' or 'feather'.")
+        return file_format
+    return DATABASE_FORMATS.get(os.path.splitext(str(name))[1].lower(), 'csv')
+
+
+def sniff_separator(name, sample_size = 1 << 16):
+    """Guess the delimiter of a text database from its first bytes.
+
+    Returns ``None`` when the sample is inconclusive, in which case the
+    caller falls back to pandas' (slow) Python-engine sniffing.
+    """
+    with open(name, 'r', encoding = 'utf-8', errors = 'replace', newline = '') as f_file:
+        sample = f_file.read(sample_size)
+    try:
+        return csv.Sniffer().sniff(sample, delimiters = '\t,;|').delimiter
+    except csv.Error:
+        return None
+
+
+def write_database(data, name, file_format = 'csv', sep = '\t'):
+    """Write the working database in ``file_format``.
+
+    Text columns keep their missing values as nulls, so a columnar file
+    reads back the same frame a ``dtype = str`` CSV round trip gives.
+    """
+    if (file_format == 'csv'):
+        data.to_csv(name, index = False, sep = sep)
+        return name
+    _require_pyarrow('Parquet/Feather databases')
+    frame         = data.reset_index(drop = True)
+    frame.columns = [str(col) for col in frame.columns]
+    for col in frame.columns:
+        if (frame[col].dtype == object):
+            frame[col] = frame[col].where(frame[col].isna(), frame[col].astype(str))
+    if (file_format == 'parquet'):
+        frame.to_parquet(name, index = False)
+    else:
+        frame.to_feather(name)
+    return name
+
+
+def _csv_options(name, sep):
+    if (sep is None):
+        sep = sniff_separator(name)
+    if (sep is None):
+        return {'dtype': str, 'sep': None, 'engine': 'python'}
+    return {'dtype': str, 'sep': sep}
+
+
+def database_columns(name, file_format = 'csv', sep = None):
+    """Column names stored in a database file, without reading its rows."""
+    if (file_format == 'csv'):
+        return pd.read_csv(name, nrows = 0, **_csv_options(name, sep)).columns.tolist()
+    pyarrow = _require_pyarrow('Parquet/Feather databases')
+    if (file_format == 'parquet'):
+        import pyarrow.parquet
+        return pyarrow.parquet.ParquetFile(name).schema_arrow.names
+    import pyarrow.ipc
+    return pyarrow.ipc.open_file(name).schema.names
+
+
+def read_database(name, file_format = 'csv', sep = None, columns = None):
+    """Read a database written by ``write_database`` (or any CSV export).
+
+    CSV delimiters are sniffed from a sample when ``sep`` is None, so the
+    fast C parser is used whenever the sample is conclusive. ``columns``
+    restricts which columns are read; stored columns that are skipped
+    come back filled with ``'UNKNOWN'`` (the readers' placeholder for
+    absent fields), so downstream code still finds every column.
+    """
+    stored = None
+    if (columns is not None):
+        stored  = database_columns(name, file_format, sep = sep)
+        columns = [col for col in stored if col in set(columns)]
+    if (file_format == 'csv'):
+        data = pd.read_csv(name, usecols = columns, **_csv_options(name, sep))
+    else:
+        _require_pyarrow('Parquet/Feather databases')
+        if (file_format == 'parquet'):
+            data = pd.read_parquet(name, columns = columns)
+        else:
+            data = pd.read_feather(name, columns = columns)
+    if (stored is not None):
+        for col in stored:
+            if (col not in data.columns):
+                data[col] = 'UNKNOWN'
+        data = data[stored]
+    return data
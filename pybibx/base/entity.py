@@ -0,0 +1,244 @@
+############################################################################
+
+# pyBibX - Integer-coded entity store.
+#
+# The per-document entity lists derived by __make_bib (authors,
+# references, keywords, sources, languages, countries, institutions and
+# reference IDs) are kept CSR-style: one interned vocabulary per family
+# plus an int64 ``indptr`` and an int32 ``indices`` array of codes into
+# it. Each distinct string is stored once, however many documents carry
+# it. The legacy list-of-lists attributes are ``RaggedList`` views over
+# these arrays, and analyses that only need the structure (adjacency
+# matrices, counts) read the arrays directly through ``incidence``.
+# ``RaggedBuilder`` encodes rows as they are produced, chunk by chunk,
+# so the batch __make_bib never holds a family as strings in full.
+
+############################################################################
+
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+
+from scipy.sparse import csr_matrix
+
+############################################################################
+
+ENTITY_FAMILIES = ('aut', 'ref', 'kid', 'auk', 'jou', 'lan', 'ctr', 'uni', 'ref_id')
+
+############################################################################
+
+class RaggedList(Sequence):
+    """Read-only list of lists backed by CSR arrays.
+
+    Row ``i`` holds ``vocab[indices[indptr[i]:indptr[i + 1]]]``. Rows are
+    decoded on access and returned as fresh ``list`` objects, so the view
+    behaves like the list of lists it replaces for every read-only use
+    (indexing, slicing, iteration, ``len`` and ``==``).
+    """
+
+    def __init__(self, indptr, indices, vocab):
+        self.indptr  = indptr
+        self.indices = indices
+        self.vocab   = vocab
+
+    def __len__(self):
+        return max(len(self.indptr) - 1, 0)
+
+    def _row(self, i):
+        codes = self.indices[int(self.indptr[i]):int(self.indptr[i + 1])]
+        vocab = self.vocab
+        return [vocab[j] for j in codes.tolist()]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        n = len(self)
+        i = int(i)
+        if (i < 0):
+            i = i + n
+        if not (0 <= i < n):
+            raise IndexError('RaggedList index out of range')
+        return self._row(i)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self._row(i)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == list(b) for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'RaggedList(' + repr(self.tolist()) + ')'
+
+    def tolist(self):
+        return list(self)
+
+    def row_ids(self):
+        """Document index of every stored occurrence (COO row array)."""
+        return np.repeat(np.arange(len(self), dtype = np.int64), np.diff(np.asarray(self.indptr)))
+
+
+############################################################################
+
+def encode_ragged(rows, vocab_index = None):
+    """CSR-encode a list of lists of strings.
+
+    Returns ``(indptr, indices, vocab)``. Codes follow first appearance;
+    pass an existing ``vocab_index`` (string -> code) to keep extending
+    a vocabulary, which is updated in place.
+    """
+    vocab_index = {} if vocab_index is None else vocab_index
+    indptr      = np.zeros(len(rows) + 1, dtype = np.int64)
+    indices     = []
+    vocab       = []
+    for i, row in enumerate(rows):
+        for item in row:
+            code = vocab_index.get(item)
+            if code is None:
+                code              = len(vocab_index)
+                vocab_index[item] = code
+                vocab.append(item)
+            indices.append(code)
+        indptr[i + 1] = len(indices)
+    return indptr, np.asarray(indices, dtype = np.int32), vocab
+
+
+class RaggedBuilder:
+    """Incremental CSR encoder of a list of lists of strings.
+
+    ``append`` encodes a chunk of rows against the shared vocabulary and
+    keeps only its code arrays; ``build`` concatenates them once into a
+    ``RaggedList``.
+    """
+
+    def __init__(self):
+        self.vocab_index = {}
+        self.vocab       = []
+        self._indptr     = [np.zeros(1, dtype = np.int64)]
+        self._indices    = []
+        self._size       = 0
+
+    def append(self, rows):
+        indptr, indices, vocab = encode_ragged(rows, self.vocab_index)
+        self._indptr.append(indptr[1:] + self._size)
+        self._indices.append(indices)
+        self.vocab.extend(vocab)
+        self._size = self._size + len(indices)
+        return self
+
+    def build(self):
+        indices = np.concatenate(self._indices) if self._indices else np.zeros(0, dtype = np.int32)
+        return RaggedList(np.concatenate(self._indptr), indices.astype(np.int32, copy = False), list(self.vocab))
+
+
+def incidence_matrix(rows, labels, dtype = np.int32):
+    """Document x label matrix of occurrence counts of a ``RaggedList``.
+
+    Entry ``(d, k)`` counts how often ``labels[k]`` occurs in row ``d``;
+    occurrences of strings outside ``labels`` are dropped.
+    """
+    position = {label: k for k, label in enumerate(labels)}
+    codes    = np.fromiter((position.get(item, -1) for item in rows.vocab), dtype = np.int64, count = len(rows.vocab))
+    cols     = codes[np.asarray(rows.indices, dtype = np.int64)]
+    docs     = rows.row_ids()
+    keep     = cols >= 0
+    data     = np.ones(int(keep.sum()), dtype = dtype)
+    return csr_matrix((data, (docs[keep], cols[keep])), shape = (len(rows), len(labels)), dtype = dtype)
+
+
+class EntityStore:
+    """One ``RaggedList`` per entity family, with shared helpers.
+
+    ``store[name]`` is the legacy-compatible view of a family. ``extend``
+    appends documents without re-encoding the existing ones, and
+    ``incidence`` turns a family into a document x label sparse matrix
+    whose columns follow any label order (typically the ``u_*`` list).
+    Incidence matrices are cached until the family changes, so repeated
+    counts over the same dataset version reuse them; the cache is keyed on
+    the identity of the label list and holds the last ``INCIDENCE_CACHE``
+    lists of each family.
+    """
+
+    INCIDENCE_CACHE = 4
+
+    def __init__(self):
+        self.families   = {}
+        self._indexes   = {}
+        self._incidence = {}
+
+    def __contains__(self, name):
+        return name in self.families
+
+    def __getitem__(self, name):
+        return self.families[name]
+
+    def set(self, name, rows):
+        """Store ``rows`` (a list of lists or a ``RaggedList``); return the view."""
+        if not isinstance(rows, RaggedList):
+            rows = RaggedList(*encode_ragged(rows))
+        self.families[name] = rows
+        self._indexes.pop(name, None)
+        self._forget(name)
+        return rows
+
+    def _forget(self, name):
+        self._incidence.pop(name, None)
+
+    def _index(self, name):
+        if name not in self._indexes:
+            self._indexes[name] = {item: code for code, item in enumerate(self.families[name].vocab)}
+        return self._indexes[name]
+
+    def extend(self, name, rows):
+        """Append the documents in ``rows`` to a family; return the new view."""
+        if name not in self.families:
+            return self.set(name, rows)
+        current                = self.families[name]
+        index                  = self._index(name)
+        indptr, indices, vocab = encode_ragged(rows, index)
+        view                   = RaggedList(
+                                            np.concatenate([np.asarray(current.indptr), indptr[1:] + int(current.indptr[-1])]),
+                                            np.concatenate([np.asarray(current.indices), indices]).astype(np.int32),
+                                            list(current.vocab) + vocab
+                                           )
+        self.families[name] = view
+        self._forget(name)
+        return view
+
+    def family_of(self, rows):
+        """Name of the family whose view is ``rows`` (None if not stored)."""
+        for name, family in self.families.items():
+            if family is rows:
+                return name
+        return None
+
+    def incidence(self, name, labels, dtype = np.int32, rows = None):
+        """Document x label matrix of occurrence counts (see ``incidence_matrix``).
+
+        ``rows`` optionally keeps only the given documents, in that order.
+        A cached matrix is reused for the same ``labels`` object, so a label
+        list must not be modified in place once it has been used here.
+        """
+        cache = self._incidence.setdefault(name, OrderedDict())
+        key   = (id(labels), len(labels))
+        entry = cache.get(key)
+        if (entry is not None and entry[0] is labels):
+            matrix = entry[1]
+        else:
+            matrix     = incidence_matrix(self.families[name], labels)
+            cache[key] = (labels, matrix)
+        cache.move_to_end(key)
+        while (len(cache) > self.INCIDENCE_CACHE):
+            cache.popitem(last = False)
+        if (rows is not None):
+            matrix = matrix[np.asarray(rows, dtype = np.int64)]
+        return matrix.astype(dtype)
@@ -6,18 +6,33 @@ references, so the default normalization expands cited works into readable
 references while preserving the original OpenAlex IDs in ``CR_OPENALEX``.
 """
 
+import base64
+import glob
+import gzip
+import http.client
 import json
+import os
+import random
 import re
+import sqlite3
+import threading
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pandas as pd
 
+from .batch import chunk_list, resolve_workers
+
 OPENALEX_WORKS_API = "https://api.openalex.org/works"
 OPENALEX_HOST = "https://openalex.org/"
 OPENALEX_API_HOST = "https://api.openalex.org/"
+TRANSIENT_HTTP_CODES = (429, 500, 502, 503, 504)
+REDIRECT_HTTP_CODES = (301, 302, 303, 307, 308)
 OPENALEX_URL_RE = re.compile(r"(?:https?://)?(?:api\.)?openalex\.org/(?:works/)?(W\d+)", re.IGNORECASE)
 
 OPENALEX_COLUMNS = [
@@ -76,16 +91,26 @@ def abstract_from_inverted_index(index):
     """Reconstruct a plain abstract from OpenAlex's inverted-index format."""
     if not index or not isinstance(index, dict):
         return ""
-    positions = []
+    slots = {}
+    clash = False
     for word, locs in index.items():
         if not isinstance(locs, (list, tuple)):
             continue
         for pos in locs:
             try:
-                positions.append((int(pos), str(word)))
+                pos = int(pos)
             except Exception:
                 continue
-    return " ".join(word for _, word in sorted(positions))
+            if pos in slots:
+                clash = True
+                slots[pos].append(str(word))
+            else:
+                slots[pos] = [str(word)]
+    # Positions are normally unique, so placing words by position avoids
+    # sorting (position, word) pairs; shared positions keep word order.
+    if clash:
+        return " ".join(" ".join(sorted(slots[pos])) for pos in sorted(slots))
+    return " ".join(slots[pos][0] for pos in sorted(slots))
 
 
 def normalize_openalex_id(value):
@@ -198,10 +223,390 @@ def _build_url(base, params):
     return base + "?" + urllib.parse.urlencode(clean)
 
 
-def _load_json_url(url):
-    req = urllib.request.Request(url, headers={"User-Agent": "pybibx-openalex/1.0"})
-    with urllib.request.urlopen(req, timeout=60) as response:
-        return json.loads(response.read().decode("utf-8"))
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    ``rate`` tokens are added per second up to ``capacity``; ``acquire``
+    takes one token, sleeping until it is available. Callers reserve
+    their slot under the lock and sleep outside it, so waiting threads
+    are released in arrival order at the configured rate.
+    """
+
+    def __init__(self, rate=10.0, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class OpenAlexSession:
+    """Connection-pooled, rate-limited OpenAlex HTTP client.
+
+    Each worker thread keeps one keep-alive connection per host, requests
+    go through a shared ``TokenBucket`` (10 requests/s by default, the
+    polite-pool limit) and ``map`` runs calls on a bounded thread pool of
+    ``max_workers``. ``api_base`` points the works endpoint elsewhere,
+    e.g. at a local stand-in server in tests. Like ``urlopen``, redirects
+    are followed (up to ``MAX_REDIRECTS`` hops) and the ``HTTP(S)_PROXY``
+    and ``NO_PROXY`` environment settings are honoured.
+    """
+
+    MAX_REDIRECTS = 10
+
+    def __init__(self, api_base=OPENALEX_WORKS_API, max_workers=8, rate=10.0, burst=None, timeout=60, user_agent="pybibx-openalex/1.0", retries=4, backoff=1.0, max_backoff=60.0):
+        self.works_api = api_base.rstrip('/')
+        self.max_workers = max(1, int(max_workers))
+        self.limiter = TokenBucket(rate, burst)
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.retries = max(0, int(retries))
+        self.backoff = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.requests = 0
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._executor = None
+
+    def _check_fork(self):
+        # Threads and sockets do not survive a fork; start afresh.
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _connection(self, scheme, netloc):
+        pool = getattr(self._local, 'connections', None)
+        if pool is None:
+            pool = self._local.connections = {}
+        route = pool.get((scheme, netloc))
+        if route is None:
+            route = pool[(scheme, netloc)] = self._open_route(scheme, netloc)
+            with self._lock:
+                self._connections.append(route[0])
+        return route
+
+    def _open_route(self, scheme, netloc):
+        # (connection, proxy headers): the headers are None when requests
+        # go straight to ``netloc`` (directly or through a CONNECT tunnel)
+        # and a dict when they are forwarded by a plain HTTP proxy, which
+        # expects the absolute URL as request target.
+        factory = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        proxy = self._proxy(scheme, netloc)
+        if proxy is None:
+            return factory(netloc, timeout=self.timeout), None
+        headers = {}
+        if proxy.username is not None:
+            credentials = urllib.parse.unquote(proxy.username) + ':' + urllib.parse.unquote(proxy.password or '')
+            headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+        address = proxy.hostname + (':' + str(proxy.port) if proxy.port else '')
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(address, timeout=self.timeout)
+            conn.set_tunnel(netloc, headers=headers)
+            return conn, None
+        proxy_factory = http.client.HTTPSConnection if proxy.scheme == 'https' else http.client.HTTPConnection
+        return proxy_factory(address, timeout=self.timeout), headers
+
+    @staticmethod
+    def _proxy(scheme, netloc):
+        # Proxy for ``scheme`` from the environment, as urlopen picks it;
+        # None for a direct connection.
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy or urllib.request.proxy_bypass(urllib.parse.urlsplit('//' + netloc).hostname or netloc):
+            return None
+        if '://' not in proxy:
+            proxy = 'http://' + proxy
+        return urllib.parse.urlsplit(proxy)
+
+    def _drop_connection(self, scheme, netloc):
+        route = self._local.connections.pop((scheme, netloc), None)
+        if route is not None:
+            route[0].close()
+            with self._lock:
+                if route[0] in self._connections:
+                    self._connections.remove(route[0])
+
+    def get_json(self, url):
+        """GET ``url`` and decode its JSON body.
+
+        Transient failures (429, 5xx, timeouts, dropped connections) are
+        retried up to ``retries`` times with exponential backoff and
+        jitter, honouring ``Retry-After``. Other non-2xx answers raise
+        ``urllib.error.HTTPError`` at once, as ``urlopen`` did.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                return self._get_json_once(url)
+            except urllib.error.HTTPError as exc:
+                if exc.code not in TRANSIENT_HTTP_CODES or attempt == self.retries:
+                    raise
+                delay = self._retry_after(exc.headers)
+            except (OSError, http.client.HTTPException):
+                if attempt == self.retries:
+                    raise
+                delay = None
+            if delay is None:
+                delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+                delay = delay * random.uniform(0.5, 1.0)
+            time.sleep(delay)
+
+    @staticmethod
+    def _retry_after(headers):
+        try:
+            return max(0.0, float(headers.get('Retry-After')))
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    def _get_json_once(self, url):
+        # Redirects (OpenAlex answers merged work IDs with 301) are
+        # followed on the pooled connections.
+        self._check_fork()
+        for _ in range(self.MAX_REDIRECTS + 1):
+            response, body = self._request(url)
+            location = response.getheader('Location')
+            if response.status in REDIRECT_HTTP_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if not 200 <= response.status < 300:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            if response.getheader('Content-Encoding', '').lower() == 'gzip':
+                body = gzip.decompress(body)
+            return json.loads(body.decode('utf-8'))
+        raise urllib.error.HTTPError(url, response.status, 'too many redirects', response.headers, None)
+
+    def _request(self, url):
+        # One GET of ``url``; returns the response and its body. A request
+        # on a reused connection that the server has closed is replayed
+        # once on a fresh connection.
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        headers = {'User-Agent': self.user_agent, 'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'}
+        self.limiter.acquire()
+        for attempt in range(2):
+            conn, proxy_headers = self._connection(parts.scheme, parts.netloc)
+            try:
+                if proxy_headers is None:
+                    conn.request('GET', target, headers=headers)
+                else:
+                    conn.request('GET', urllib.parse.urlunsplit(parts[:4] + ('',)), headers={**headers, **proxy_headers})
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionError):
+                self._drop_connection(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self._drop_connection(parts.scheme, parts.netloc)
+                raise
+            break
+        with self._lock:
+            self.requests += 1
+        if response.getheader('Connection', '').lower() == 'close':
+            self._drop_connection(parts.scheme, parts.netloc)
+        return response, body
+
+    def map(self, func, items):
+        """``[func(item) for item in items]`` on the session's thread pool."""
+        items = list(items)
+        if len(items) <= 1 or self.max_workers == 1:
+            return [func(item) for item in items]
+        self._check_fork()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pybibx-openalex')
+        return list(self._executor.map(func, items))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_DEFAULT_SESSION = None
+
+
+def default_session():
+    """Process-wide ``OpenAlexSession`` used when none is passed."""
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        _DEFAULT_SESSION = OpenAlexSession()
+    return _DEFAULT_SESSION
+
+
+def set_default_session(session):
+    """Install ``session`` as the default; returns the previous one."""
+    global _DEFAULT_SESSION
+    previous, _DEFAULT_SESSION = _DEFAULT_SESSION, session
+    return previous
+
+
+def _load_json_url(url, session=None):
+    return (session or default_session()).get_json(url)
+
+
+def _rejected(exc):
+    # A 4xx answer other than 429 is about the request itself (e.g. a
+    # malformed ID), not about the service being unavailable.
+    return isinstance(exc, urllib.error.HTTPError) and 400 <= exc.code < 500 and exc.code not in TRANSIENT_HTTP_CODES
+
+
+class ReferenceCache:
+    """Persistent SQLite cache of OpenAlex works, usable as ``reference_cache``.
+
+    Behaves like the plain dict the expansion code expects: keys are
+    OpenAlex IDs (normalized on the way in, so ``W123`` and the URL form
+    hit the same row) and values are work dicts, stored as compressed
+    JSON with their fetch time. ``None`` values record misses.
+
+    ``in`` honours the expiry policy, so stale entries are fetched again:
+    works expire after ``ttl`` seconds (None: never) and misses after
+    ``negative_ttl`` seconds. ``get`` still returns a stale work, and a
+    miss never overwrites a stored work, so a failed refresh keeps the
+    last good copy. The cache can be pickled (it reopens by path), so it
+    can be handed to worker processes.
+    """
+
+    def __init__(self, path, ttl=None, negative_ttl=86400):
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._open()
+
+    def _open(self):
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS works (id TEXT PRIMARY KEY, payload BLOB, fetched_at REAL NOT NULL)')
+
+    def __getstate__(self):
+        return {'path': self.path, 'ttl': self.ttl, 'negative_ttl': self.negative_ttl}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    @staticmethod
+    def _key(key):
+        return _compact_openalex_id(key)
+
+    def _row(self, key):
+        with self._lock:
+            return self._conn.execute('SELECT payload, fetched_at FROM works WHERE id = ?', (self._key(key),)).fetchone()
+
+    def _fresh(self, row):
+        limit = self.ttl if row[0] is not None else self.negative_ttl
+        return limit is None or time.time() - row[1] <= limit
+
+    def __contains__(self, key):
+        row = self._row(key)
+        return row is not None and self._fresh(row)
+
+    def get(self, key, default=None):
+        row = self._row(key)
+        if row is None:
+            return default
+        if row[0] is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def __getitem__(self, key):
+        if self._row(key) is None:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key, work):
+        self.update({key: work})
+
+    def update(self, items):
+        """Store many works in one transaction."""
+        now = time.time()
+        hits = []
+        misses = []
+        for key, work in dict(items).items():
+            key = self._key(key)
+            if not key:
+                continue
+            if work is None:
+                misses.append((key, now))
+            else:
+                payload = zlib.compress(json.dumps(work, ensure_ascii=False).encode('utf-8'))
+                hits.append((key, payload, now))
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO works (id, payload, fetched_at) VALUES (?, ?, ?)', hits)
+            self._conn.executemany(
+                'INSERT INTO works (id, payload, fetched_at) VALUES (?, NULL, ?) '
+                'ON CONFLICT(id) DO UPDATE SET fetched_at = excluded.fetched_at WHERE works.payload IS NULL',
+                misses,
+            )
+
+    def __delitem__(self, key):
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM works WHERE id = ?', (self._key(key),))
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM works').fetchone()[0]
+
+    def __iter__(self):
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute('SELECT id FROM works')]
+        return iter(OPENALEX_HOST + key for key in keys)
+
+    def purge(self):
+        """Delete expired entries; returns how many were removed."""
+        now = time.time()
+        removed = 0
+        with self._lock, self._conn:
+            if self.ttl is not None:
+                removed += self._conn.execute('DELETE FROM works WHERE payload IS NOT NULL AND fetched_at < ?', (now - self.ttl,)).rowcount
+            if self.negative_ttl is not None:
+                removed += self._conn.execute('DELETE FROM works WHERE payload IS NULL AND fetched_at < ?', (now - self.negative_ttl,)).rowcount
+        return removed
+
+    def close(self):
+        self._conn.close()
+
+
+def _as_reference_cache(reference_cache):
+    """Plain dict by default; a path opens a ``ReferenceCache``."""
+    if reference_cache is None:
+        return {}
+    if isinstance(reference_cache, (str, os.PathLike)):
+        return ReferenceCache(reference_cache)
+    return reference_cache
 
 
 def get_authors(work):
@@ -320,33 +725,38 @@ def format_openalex_reference(work):
     return ref if ref and ref != 'UNKNOWN' else 'UNKNOWN'
 
 
-def get_work(openalex_id, mailto=None):
+def get_work(openalex_id, mailto=None, session=None):
+    session = session or default_session()
     work_id = _compact_openalex_id(openalex_id)
     if not work_id:
         return None
     params = {}
     if mailto:
         params['mailto'] = mailto
-    url = OPENALEX_WORKS_API + '/' + urllib.parse.quote(work_id)
+    url = session.works_api + '/' + urllib.parse.quote(work_id)
     if params:
         url = _build_url(url, params)
-    return _load_json_url(url)
+    return _load_json_url(url, session)
 
 
-def get_works_batch(openalex_ids, mailto=None):
+def get_works_batch(openalex_ids, mailto=None, session=None, failed=None):
     """Fetch works by OpenAlex ID using the API filter endpoint.
 
-    Falls back to an empty list on unrecoverable batch errors. Callers can
-    use ``get_work`` sequentially for missing items.
+    Chunks are fetched concurrently on the session's pool and results are
+    returned in chunk order. A chunk the API rejects (a 4xx other than
+    429) is split in half and each half retried, recursively, so one bad
+    ID costs O(log n) extra requests and the rest of its chunk is still
+    fetched in bulk. IDs rejected on their own are appended to ``failed``
+    when a list is given. Other errors -- transient ones that outlived
+    the session's retries included -- are raised.
     """
+    session = session or default_session()
     ids = [_compact_openalex_id(x) for x in openalex_ids]
     ids = [x for x in OrderedDict.fromkeys(ids) if x]
     if not ids:
         return []
-    out = []
-    # Keep chunks conservative to avoid long URLs.
-    for start in range(0, len(ids), 50):
-        chunk = ids[start:start + 50]
+
+    def fetch(chunk):
         params = {
             'filter': 'openalex_id:' + '|'.join(chunk),
             'per-page': min(200, len(chunk)),
@@ -354,15 +764,28 @@ def get_works_batch(openalex_ids, mailto=None):
         if mailto:
             params['mailto'] = mailto
         try:
-            payload = _load_json_url(_build_url(OPENALEX_WORKS_API, params))
-            out.extend(payload.get('results', []) or [])
-        except Exception:
-            continue
+            payload = _load_json_url(_build_url(session.works_api, params), session)
+            return payload.get('results', []) or []
+        except Exception as exc:
+            if not _rejected(exc):
+                raise
+            if len(chunk) == 1:
+                if failed is not None:
+                    failed.append(chunk[0])
+                return []
+        middle = len(chunk) // 2
+        return fetch(chunk[:middle]) + fetch(chunk[middle:])
+
+    # Keep chunks conservative to avoid long URLs.
+    chunks = [ids[start:start + 50] for start in range(0, len(ids), 50)]
+    out = []
+    for results in session.map(fetch, chunks):
+        out.extend(results)
     return out
 
 
-def expand_references_for_works(works, mailto=None, max_refs_per_work=None, reference_cache=None):
-    reference_cache = reference_cache if reference_cache is not None else {}
+def expand_references_for_works(works, mailto=None, max_refs_per_work=None, reference_cache=None, session=None):
+    reference_cache = _as_reference_cache(reference_cache)
     wanted = []
     for work in works or []:
         refs = [normalize_openalex_id(r) for r in (work.get('referenced_works', []) or []) if r]
@@ -372,114 +795,177 @@ def expand_references_for_works(works, mailto=None, max_refs_per_work=None, refe
             if ref and ref not in reference_cache:
                 wanted.append(ref)
     wanted = list(OrderedDict.fromkeys(wanted))
+    session = session or default_session()
+    found = {}
+    failed = []
     if wanted:
         try:
-            for ref_work in get_works_batch(wanted, mailto=mailto):
+            for ref_work in get_works_batch(wanted, mailto=mailto, session=session, failed=failed):
                 ref_id = normalize_openalex_id(ref_work.get('id'))
                 if ref_id:
-                    reference_cache[ref_id] = ref_work
+                    found[ref_id] = ref_work
         except Exception:
-            pass
-    # Sequential fallback for missing references. Failures store None so they
-    # are not retried endlessly during one normalization call.
-    for ref in wanted:
-        if ref in reference_cache:
-            continue
+            # The service is unavailable: nothing is recorded, so these
+            # references are fetched again next time rather than cached
+            # as misses.
+            return reference_cache
+    # IDs the API rejected on their own are misses. IDs a successful batch
+    # did not return (e.g. merged works) are fetched one by one, following
+    # the redirect to the surviving work. Misses store None so they are not
+    # retried endlessly (a ReferenceCache retries them once its negative
+    # TTL expires); lookups that fail for other reasons store nothing.
+    for ref in failed:
+        found.setdefault(normalize_openalex_id(ref), None)
+    missing = [ref for ref in wanted if ref not in found]
+    unavailable = object()
+
+    def fetch(ref):
         try:
-            reference_cache[ref] = get_work(ref, mailto=mailto)
-        except Exception:
-            reference_cache[ref] = None
+            return get_work(ref, mailto=mailto, session=session)
+        except Exception as exc:
+            return None if _rejected(exc) else unavailable
+
+    for ref, ref_work in zip(missing, session.map(fetch, missing)):
+        if ref_work is not unavailable:
+            found[ref] = ref_work
+    if found:
+        reference_cache.update(found)
     return reference_cache
 
 
-def works_to_dataframe(works, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None):
+def _work_to_row(work, expand_references=True, max_refs_per_work=None, reference_cache=None):
+    reference_cache = _as_reference_cache(reference_cache)
+    refs = [normalize_openalex_id(r) for r in (work.get('referenced_works', []) or []) if r]
+    if max_refs_per_work is not None:
+        refs = refs[:max_refs_per_work]
+    if expand_references:
+        ref_texts = []
+        for ref in refs:
+            ref_work = reference_cache.get(ref)
+            ref_texts.append(format_openalex_reference(ref_work) if ref_work else 'UNKNOWN')
+        cr_text = sanitize_openalex_reference_text("; ".join([r for r in ref_texts if r]) or "UNKNOWN")
+    else:
+        cr_text = "; ".join(refs) if refs else "UNKNOWN"
+    title = work.get('display_name') or work.get('title') or 'UNKNOWN'
+    source_name = get_source_name(work)
+    year = _safe_str(work.get('publication_year'), 'UNKNOWN')
+    doc_type = _safe_str(work.get('type'), 'UNKNOWN')
+    doi = _normalize_doi(work.get('doi'))
+    abstract = abstract_from_inverted_index(work.get('abstract_inverted_index')) or 'UNKNOWN'
+    keywords = get_keywords(work)
+    authors = get_authors(work)
+    affs = get_affiliations(work)
+    institutions = get_institutions(work)
+    countries = get_countries(work)
+    cited_by = _safe_str(work.get('cited_by_count'), '0')
+    language = _safe_str(work.get('language'), 'UNKNOWN')
+    openalex_id = normalize_openalex_id(work.get('id')) or 'UNKNOWN'
+    oa_url = _get_oa_url(work)
+    row = {
+        # Human-friendly/OpenAlex export aliases requested by the API.
+        'AU': authors,
+        'TI': title,
+        'SO': source_name,
+        'PY': year,
+        'DT': doc_type,
+        'DI': doi,
+        'AB': abstract,
+        'DE': keywords,
+        'ID': keywords,
+        'C1': affs,
+        'CR': cr_text,
+        'CR_OPENALEX': _json_dumps(refs),
+        'TC': cited_by,
+        'LA': language,
+        'DB': 'OpenAlex',
+        'UT': openalex_id,
+        'URL': openalex_id,
+        'OA_URL': oa_url,
+        # Internal pyBibX columns consumed by pbx.py.
+        'author': authors,
+        'title': title,
+        'abbrev_source_title': source_name,
+        'journal': source_name,
+        'year': year,
+        'document_type': doc_type,
+        'doi': doi,
+        'abstract': abstract,
+        'keywords': keywords,
+        'author_keywords': keywords,
+        'affiliation': affs,
+        'address': affs,
+        'institution': institutions,
+        'country': countries,
+        'correspondence_address1': 'UNKNOWN',
+        'references': cr_text,
+        'cr_openalex': _json_dumps(refs),
+        'note': cited_by,
+        'language': language,
+        'source': 'openalex',
+        'url': openalex_id,
+        'openalex_id': openalex_id,
+        'oa_url': oa_url,
+    }
+    return row
+
+
+def works_to_dataframe(works, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None, chunk_size=None, session=None):
+    """Build the normalized pyBibX frame for a list of OpenAlex works.
+
+    With ``chunk_size`` the works may be any iterable; they are converted
+    in batches by ``iter_works_frames`` and only the batch frames are kept.
+    """
+    if chunk_size is not None:
+        frames = list(iter_works_frames(
+            works,
+            chunk_size=chunk_size,
+            expand_references=expand_references,
+            mailto=mailto,
+            max_refs_per_work=max_refs_per_work,
+            reference_cache=reference_cache,
+            session=session,
+        ))
+        if not frames:
+            return works_to_dataframe([], expand_references=False)
+        return pd.concat(frames, axis=0, ignore_index=True, sort=False)
     works = works or []
-    reference_cache = reference_cache if reference_cache is not None else {}
+    reference_cache = _as_reference_cache(reference_cache)
     if expand_references:
         expand_references_for_works(
             works,
             mailto=mailto,
             max_refs_per_work=max_refs_per_work,
             reference_cache=reference_cache,
+            session=session,
         )
-    rows = []
-    for work in works:
-        refs = [normalize_openalex_id(r) for r in (work.get('referenced_works', []) or []) if r]
-        if max_refs_per_work is not None:
-            refs = refs[:max_refs_per_work]
-        if expand_references:
-            ref_texts = []
-            for ref in refs:
-                ref_work = reference_cache.get(ref)
-                ref_texts.append(format_openalex_reference(ref_work) if ref_work else 'UNKNOWN')
-            cr_text = sanitize_openalex_reference_text("; ".join([r for r in ref_texts if r]) or "UNKNOWN")
-        else:
-            cr_text = "; ".join(refs) if refs else "UNKNOWN"
-        title = work.get('display_name') or work.get('title') or 'UNKNOWN'
-        source_name = get_source_name(work)
-        year = _safe_str(work.get('publication_year'), 'UNKNOWN')
-        doc_type = _safe_str(work.get('type'), 'UNKNOWN')
-        doi = _normalize_doi(work.get('doi'))
-        abstract = abstract_from_inverted_index(work.get('abstract_inverted_index')) or 'UNKNOWN'
-        keywords = get_keywords(work)
-        authors = get_authors(work)
-        affs = get_affiliations(work)
-        institutions = get_institutions(work)
-        countries = get_countries(work)
-        cited_by = _safe_str(work.get('cited_by_count'), '0')
-        language = _safe_str(work.get('language'), 'UNKNOWN')
-        openalex_id = normalize_openalex_id(work.get('id')) or 'UNKNOWN'
-        oa_url = _get_oa_url(work)
-        row = {
-            # Human-friendly/OpenAlex export aliases requested by the API.
-            'AU': authors,
-            'TI': title,
-            'SO': source_name,
-            'PY': year,
-            'DT': doc_type,
-            'DI': doi,
-            'AB': abstract,
-            'DE': keywords,
-            'ID': keywords,
-            'C1': affs,
-            'CR': cr_text,
-            'CR_OPENALEX': _json_dumps(refs),
-            'TC': cited_by,
-            'LA': language,
-            'DB': 'OpenAlex',
-            'UT': openalex_id,
-            'URL': openalex_id,
-            'OA_URL': oa_url,
-            # Internal pyBibX columns consumed by pbx.py.
-            'author': authors,
-            'title': title,
-            'abbrev_source_title': source_name,
-            'journal': source_name,
-            'year': year,
-            'document_type': doc_type,
-            'doi': doi,
-            'abstract': abstract,
-            'keywords': keywords,
-            'author_keywords': keywords,
-            'affiliation': affs,
-            'address': affs,
-            'institution': institutions,
-            'country': countries,
-            'correspondence_address1': 'UNKNOWN',
-            'references': cr_text,
-            'cr_openalex': _json_dumps(refs),
-            'note': cited_by,
-            'language': language,
-            'source': 'openalex',
-            'url': openalex_id,
-            'openalex_id': openalex_id,
-            'oa_url': oa_url,
-        }
-        rows.append(row)
+    rows = [_work_to_row(work, expand_references, max_refs_per_work, reference_cache) for work in works]
     df = pd.DataFrame(rows)
     return normalize_openalex_dataframe(df)
 
 
+def iter_works_frames(works, chunk_size=10000, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None, session=None):
+    """Yield normalized frames of at most ``chunk_size`` works.
+
+    ``works`` may be a generator (see ``iter_openalex_works``). References
+    are expanded per batch against the shared ``reference_cache`` and each
+    work dict is dropped once its row is built, so only one batch of work
+    dicts is alive at a time.
+    """
+    reference_cache = _as_reference_cache(reference_cache)
+    for batch in chunk_list(works, max(int(chunk_size), 1)):
+        if expand_references:
+            expand_references_for_works(
+                batch,
+                mailto=mailto,
+                max_refs_per_work=max_refs_per_work,
+                reference_cache=reference_cache,
+                session=session,
+            )
+        rows = [_work_to_row(work, expand_references, max_refs_per_work, reference_cache) for work in batch]
+        del batch
+        yield normalize_openalex_dataframe(pd.DataFrame(rows))
+
+
 def _looks_like_openalex_standard_csv(df):
     cols = set(str(c) for c in df.columns)
     strong = {
@@ -649,7 +1135,7 @@ def normalize_openalex_dataframe(data, auto_detect=True):
     return df
 
 
-def search_works(query, from_year=None, to_year=None, max_results=1000, per_page=200, mailto=None, filter=None, sort=None, sleep=0.1):
+def _search_params(query, from_year=None, to_year=None, per_page=200, mailto=None, filter=None, sort=None):
     per_page = max(1, min(int(per_page), 200))
     filters = []
     if filter:
@@ -661,7 +1147,6 @@ def search_works(query, from_year=None, to_year=None, max_results=1000, per_page
     params = {
         'search': query,
         'per-page': per_page,
-        'cursor': '*',
     }
     if filters:
         params['filter'] = ','.join(filters)
@@ -669,22 +1154,126 @@ def search_works(query, from_year=None, to_year=None, max_results=1000, per_page
         params['sort'] = sort
     if mailto:
         params['mailto'] = mailto
-    works = []
-    cursor = '*'
-    while len(works) < max_results:
-        params['cursor'] = cursor
-        payload = _load_json_url(_build_url(OPENALEX_WORKS_API, params))
+    return params
+
+
+def _checkpoint_state_path(checkpoint):
+    return os.path.join(checkpoint, 'state.json')
+
+
+def _checkpoint_page_path(checkpoint, number):
+    return os.path.join(checkpoint, f'page_{number:06d}.json.gz')
+
+
+def _read_checkpoint(checkpoint):
+    path = _checkpoint_state_path(checkpoint)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_checkpoint(checkpoint, state):
+    path = _checkpoint_state_path(checkpoint)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(path + '.tmp', path)
+
+
+def _iter_search_pages(params, max_results=1000, sleep=None, session=None, checkpoint=None):
+    session = session or default_session()
+    state = None
+    if checkpoint is not None:
+        os.makedirs(checkpoint, exist_ok=True)
+        state = _read_checkpoint(checkpoint)
+        if state is not None and state.get('params') != params:
+            raise ValueError(f"Checkpoint {checkpoint} belongs to a different search.")
+    if state is None:
+        state = {'params': params, 'max_results': max_results, 'cursor': '*', 'pages': 0, 'done': False}
+    count = 0
+    # Replay pages already on disk, then continue from the saved cursor.
+    for number in range(1, state['pages'] + 1):
+        with gzip.open(_checkpoint_page_path(checkpoint, number), 'rt', encoding='utf-8') as f:
+            batch = json.load(f)[:max_results - count]
+        count += len(batch)
+        yield batch
+        if count >= max_results:
+            return
+    query = dict(params)
+    while not state['done'] and count < max_results:
+        query['cursor'] = state['cursor']
+        payload = _load_json_url(_build_url(session.works_api, query), session)
         batch = payload.get('results', []) or []
-        works.extend(batch)
         cursor = (payload.get('meta') or {}).get('next_cursor')
-        if not cursor or not batch:
-            break
-        if sleep:
+        state['cursor'] = cursor
+        state['done'] = not cursor or not batch
+        if checkpoint is not None:
+            state['pages'] += 1
+            with gzip.open(_checkpoint_page_path(checkpoint, state['pages']), 'wt', encoding='utf-8') as f:
+                json.dump(batch, f)
+            _write_checkpoint(checkpoint, state)
+        batch = batch[:max_results - count]
+        count += len(batch)
+        yield batch
+        if not state['done'] and sleep:
             time.sleep(sleep)
-    return works[:max_results]
 
 
-def search_to_dataframe(query, from_year=None, to_year=None, max_results=1000, per_page=200, mailto=None, filter=None, sort=None, sleep=0.1, expand_references=True, max_refs_per_work=None, reference_cache=None):
+def iter_search_pages(query, from_year=None, to_year=None, max_results=1000, per_page=200, mailto=None, filter=None, sort=None, sleep=None, session=None, checkpoint=None):
+    """Yield the pages of a works search as lists of work dicts.
+
+    With ``checkpoint`` (a directory) every fetched page and the next
+    cursor are saved as they arrive; running the same search again with
+    the same checkpoint replays the saved pages and continues from the
+    cursor where the previous run stopped.
+    """
+    params = _search_params(query, from_year, to_year, per_page, mailto, filter, sort)
+    return _iter_search_pages(params, max_results=max_results, sleep=sleep, session=session, checkpoint=checkpoint)
+
+
+def search_works(query, from_year=None, to_year=None, max_results=1000, per_page=200, mailto=None, filter=None, sort=None, sleep=None, session=None, checkpoint=None):
+    """Page through a works search with cursor pagination.
+
+    Requests are paced by the session's rate limiter; ``sleep`` adds an
+    extra fixed pause between pages when given. See ``iter_search_pages``
+    for ``checkpoint``.
+    """
+    works = []
+    for batch in iter_search_pages(query, from_year, to_year, max_results, per_page, mailto, filter, sort, sleep, session, checkpoint):
+        works.extend(batch)
+    return works
+
+
+def resume_search(checkpoint, max_results=None, sleep=None, session=None):
+    """Finish the search saved in ``checkpoint`` and return all its works."""
+    state = _read_checkpoint(checkpoint)
+    if state is None:
+        raise FileNotFoundError(f"No search checkpoint found in {checkpoint}.")
+    max_results = state.get('max_results', 1000) if max_results is None else max_results
+    works = []
+    for batch in _iter_search_pages(state['params'], max_results=max_results, sleep=sleep, session=session, checkpoint=checkpoint):
+        works.extend(batch)
+    return works
+
+
+def search_to_dataframe(query, from_year=None, to_year=None, max_results=1000, per_page=200, mailto=None, filter=None, sort=None, sleep=None, expand_references=True, max_refs_per_work=None, reference_cache=None, session=None, checkpoint=None, chunk_size=None):
+    """Run a works search and build the normalized pyBibX frame.
+
+    With ``chunk_size`` pages are streamed into ``works_to_dataframe`` as
+    they arrive (references expanded per batch) instead of after the
+    whole harvest.
+    """
+    if chunk_size is not None:
+        pages = iter_search_pages(query, from_year, to_year, max_results, per_page, mailto, filter, sort, sleep, session, checkpoint)
+        return works_to_dataframe(
+            (work for batch in pages for work in batch),
+            expand_references=expand_references,
+            mailto=mailto,
+            max_refs_per_work=max_refs_per_work,
+            reference_cache=reference_cache,
+            chunk_size=chunk_size,
+            session=session,
+        )
     works = search_works(
         query=query,
         from_year=from_year,
@@ -695,6 +1284,8 @@ def search_to_dataframe(query, from_year=None, to_year=None, max_results=1000, p
         filter=filter,
         sort=sort,
         sleep=sleep,
+        session=session,
+        checkpoint=checkpoint,
     )
     return works_to_dataframe(
         works,
@@ -702,20 +1293,62 @@ def search_to_dataframe(query, from_year=None, to_year=None, max_results=1000, p
         mailto=mailto,
         max_refs_per_work=max_refs_per_work,
         reference_cache=reference_cache,
+        session=session,
     )
 
 
+def _works_from_payload(payload):
+    if isinstance(payload, dict) and 'results' in payload:
+        return payload.get('results') or []
+    if isinstance(payload, dict) and 'id' in payload:
+        return [payload]
+    if isinstance(payload, list):
+        return payload
+    return []
+
+
+def _open_text(path):
+    if str(path).lower().endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _is_json_document(path):
+    name = str(path).lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    return os.path.splitext(name)[1] == '.json'
+
+
+def iter_openalex_works(path):
+    """Yield OpenAlex work dicts from a JSON, JSONL or gzipped file.
+
+    JSON Lines files (``.jsonl``, ``.ndjson``, snapshot ``part_*.gz``
+    partitions) are read one line at a time, so only the current work is
+    held in memory; a line may also carry an API page (``results``). A
+    ``.json`` document is parsed whole, as ``load_openalex_json`` does.
+    """
+    with _open_text(path) as f:
+        if _is_json_document(path):
+            for work in _works_from_payload(json.load(f)):
+                yield work
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            payload = json.loads(line)
+            if isinstance(payload, dict) and 'results' not in payload:
+                yield payload
+            else:
+                for work in _works_from_payload(payload):
+                    yield work
+
+
 def load_openalex_json(path, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None):
-    with open(path, 'r', encoding='utf-8') as f:
+    with _open_text(path) as f:
         payload = json.load(f)
-    if isinstance(payload, dict) and 'results' in payload:
-        works = payload.get('results') or []
-    elif isinstance(payload, dict) and 'id' in payload:
-        works = [payload]
-    elif isinstance(payload, list):
-        works = payload
-    else:
-        works = []
+    works = _works_from_payload(payload)
     return works_to_dataframe(
         works,
         expand_references=expand_references,
@@ -725,9 +1358,143 @@ def load_openalex_json(path, expand_references=True, mailto=None, max_refs_per_w
     )
 
 
+def load_openalex_jsonl(path, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None, chunk_size=10000):
+    """Stream a JSON Lines (optionally gzipped) export into a pyBibX frame."""
+    return works_to_dataframe(
+        iter_openalex_works(path),
+        expand_references=expand_references,
+        mailto=mailto,
+        max_refs_per_work=max_refs_per_work,
+        reference_cache=reference_cache,
+        chunk_size=chunk_size,
+    )
+
+
+def _entity_key(value):
+    """Compact upper-case ID (``C41008148``, ``S123``) or lower-case name."""
+    text = _safe_str(value).strip()
+    tail = text.split('?')[0].rstrip('/').rsplit('/', 1)[-1]
+    if re.fullmatch(r'[A-Za-z]\d+', tail):
+        return tail.upper()
+    return text.lower()
+
+
+def _entity_keys(items):
+    keys = set()
+    for item in items:
+        item = item or {}
+        for value in (item.get('id'), item.get('display_name')):
+            if _safe_str(value):
+                keys.add(_entity_key(value))
+    return keys
+
+
+def _snapshot_filters(from_year=None, to_year=None, ids=None, concepts=None, sources=None):
+    return {
+        'from_year': int(from_year) if from_year is not None else None,
+        'to_year': int(to_year) if to_year is not None else None,
+        'ids': {_compact_openalex_id(x) for x in ids} if ids is not None else None,
+        'concepts': {_entity_key(x) for x in concepts} if concepts is not None else None,
+        'sources': {_entity_key(x) for x in sources} if sources is not None else None,
+    }
 
-def load_openalex_auto(path, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None):
+
+def _work_matches(work, filters):
+    """True when ``work`` passes every active snapshot filter.
+
+    Cheap scalar tests run first so most rejected works never have their
+    concept or source lists inspected.
+    """
+    if filters['from_year'] is not None or filters['to_year'] is not None:
+        try:
+            year = int(work.get('publication_year'))
+        except (TypeError, ValueError):
+            return False
+        if filters['from_year'] is not None and year < filters['from_year']:
+            return False
+        if filters['to_year'] is not None and year > filters['to_year']:
+            return False
+    if filters['ids'] is not None and _compact_openalex_id(work.get('id')) not in filters['ids']:
+        return False
+    if filters['concepts'] is not None:
+        items = (work.get('concepts', []) or []) + (work.get('topics', []) or [])
+        if not (_entity_keys(items) & filters['concepts']):
+            return False
+    if filters['sources'] is not None:
+        locations = [work.get('primary_location')] + (work.get('locations', []) or [])
+        items = [(loc or {}).get('source') for loc in locations]
+        if not (_entity_keys(items) & filters['sources']):
+            return False
+    return True
+
+
+def list_snapshot_partitions(snapshot_dir, updated_since=None):
+    """Sorted ``updated_date=*/part_*.gz`` files below ``snapshot_dir``.
+
+    ``updated_since`` (``'YYYY-MM-DD'``) skips whole partition folders
+    whose ``updated_date`` is older, without opening them.
+    """
+    paths = sorted(glob.glob(os.path.join(snapshot_dir, '**', 'part_*.gz'), recursive=True))
+    if updated_since is None:
+        return paths
+    since = str(updated_since)
+    kept = []
+    for path in paths:
+        folder = os.path.basename(os.path.dirname(path))
+        if folder.startswith('updated_date=') and folder.split('=', 1)[1] < since:
+            continue
+        kept.append(path)
+    return kept
+
+
+def _load_snapshot_partition(job):
+    path, filters, chunk_size = job
+    works = (work for work in iter_openalex_works(path) if _work_matches(work, filters))
+    frames = list(iter_works_frames(works, chunk_size=chunk_size, expand_references=False))
+    if not frames:
+        return None
+    return pd.concat(frames, axis=0, ignore_index=True, sort=False)
+
+
+def load_openalex_snapshot(snapshot_dir, from_year=None, to_year=None, ids=None, concepts=None, sources=None, updated_since=None, workers=None, chunk_size=10000):
+    """Carve a pyBibX frame out of a local OpenAlex works snapshot.
+
+    Partitions are decompressed and parsed in a process pool of
+    ``workers`` processes (None: one per CPU). Filters are applied to each
+    work before its row is built: publication year range, work ``ids``,
+    ``concepts`` (concept or topic IDs / display names) and ``sources``
+    (source IDs / display names). References are kept as OpenAlex IDs, as
+    with ``expand_references=False``, since no API is queried. Rows follow
+    partition order, so the result does not depend on ``workers``.
+    """
+    paths = list_snapshot_partitions(snapshot_dir, updated_since=updated_since)
+    filters = _snapshot_filters(from_year, to_year, ids, concepts, sources)
+    jobs = [(path, filters, chunk_size) for path in paths]
+    frames = []
+    if jobs:
+        workers = resolve_workers(workers, len(jobs))
+        if workers == 1:
+            results = map(_load_snapshot_partition, jobs)
+            frames = [frame for frame in results if frame is not None]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                frames = [frame for frame in executor.map(_load_snapshot_partition, jobs) if frame is not None]
+    if not frames:
+        return works_to_dataframe([], expand_references=False)
+    return pd.concat(frames, axis=0, ignore_index=True, sort=False)
+
+
+def load_openalex_auto(path, expand_references=True, mailto=None, max_refs_per_work=None, reference_cache=None, chunk_size=10000):
     file_extension = path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+    if file_extension in ['jsonl', 'ndjson', 'gz']:
+        return load_openalex_jsonl(
+            path,
+            expand_references=expand_references,
+            mailto=mailto,
+            max_refs_per_work=max_refs_per_work,
+            reference_cache=reference_cache,
+            chunk_size=chunk_size,
+        )
     if file_extension == 'json':
         return load_openalex_json(
             path,
@@ -0,0 +1,266 @@
+"""Local OpenAlex stand-in server and client throughput benchmark.
+
+``StandInServer`` serves the parts of the OpenAlex ``/works`` API that
+``pybibx.base.openalex`` uses (search with cursor pagination, the
+``openalex_id`` filter and by-ID lookups) from an in-memory fixture
+corpus, with configurable latency and error injection. ``run_benchmark``
+drives ``search_to_dataframe`` with ``expand_references=True`` against it
+and reports requests/sec, works/sec and peak memory, so concurrency and
+caching changes can be measured without network access::
+
+    python -m pybibx.base.openalex_bench --works 5000 --latency 0.02
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import tracemalloc
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import openalex
+
+
+def make_corpus(n_works=2000, refs_per_work=20, seed=0):
+    """Deterministic synthetic corpus of ``n_works`` OpenAlex-like works.
+
+    Every work cites ``refs_per_work`` other works of the corpus, so
+    reference expansion resolves entirely against the stand-in.
+    """
+    rng = random.Random(seed)
+    words = ['model', 'decision', 'network', 'analysis', 'criteria', 'fuzzy', 'ranking', 'data', 'method', 'review']
+    countries = ['BR', 'US', 'DE', 'CN', 'PT', 'GB']
+    corpus = []
+    for i in range(n_works):
+        title = ' '.join(rng.choice(words) for _ in range(6))
+        abstract = {}
+        for pos in range(rng.randint(20, 60)):
+            abstract.setdefault(rng.choice(words), []).append(pos)
+        authorships = []
+        for _ in range(rng.randint(1, 5)):
+            a = rng.randrange(n_works // 3 + 1)
+            authorships.append({
+                'author': {'display_name': f'Author {a}'},
+                'institutions': [{'display_name': f'University {a % 97}', 'country_code': countries[a % len(countries)]}],
+            })
+        refs = rng.sample(range(n_works), min(refs_per_work, n_works))
+        corpus.append({
+            'id': f'https://openalex.org/W{100000 + i}',
+            'display_name': title,
+            'publication_year': 1990 + i % 35,
+            'type': 'article',
+            'doi': f'https://doi.org/10.5555/bench.{i}',
+            'language': 'en',
+            'cited_by_count': rng.randint(0, 500),
+            'abstract_inverted_index': abstract,
+            'authorships': authorships,
+            'primary_location': {'source': {'id': f'https://openalex.org/S{i % 50}', 'display_name': f'Journal {i % 50}'}},
+            'concepts': [{'id': f'https://openalex.org/C{i % 12}', 'display_name': rng.choice(words)}],
+            'referenced_works': [f'https://openalex.org/W{100000 + r}' for r in refs],
+        })
+    return corpus
+
+
+class StandInServer:
+    """Threaded HTTP stand-in for the OpenAlex works API.
+
+    ``latency`` seconds (plus up to ``jitter``) are added to every answer
+    and a fraction ``error_rate`` of requests fails with ``error_code``.
+    IDs in ``bad_ids`` make any filter request that names them fail with
+    400, as malformed IDs do upstream. ``requests`` counts the requests
+    served. Use as a context manager or call ``start``/``stop``.
+    """
+
+    def __init__(self, corpus=None, latency=0.0, jitter=0.0, error_rate=0.0, error_code=503, bad_ids=None, host='127.0.0.1', port=0, seed=0):
+        self.corpus = corpus if corpus is not None else make_corpus()
+        self.by_id = {openalex._compact_openalex_id(work['id']): work for work in self.corpus}
+        self.latency = float(latency)
+        self.jitter = float(jitter)
+        self.error_rate = float(error_rate)
+        self.error_code = int(error_code)
+        self.bad_ids = {openalex._compact_openalex_id(x) for x in (bad_ids or [])}
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}/works'
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                status, body = server.respond(self.path)
+                payload = json.dumps(body).encode('utf-8') if body is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    def respond(self, path):
+        """Return ``(status, json_body)`` for a request path."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate and self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return self.error_code, {'error': 'injected failure'}
+        parts = urllib.parse.urlsplit(path)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        segments = [s for s in parts.path.split('/') if s]
+        if not segments or segments[0] != 'works':
+            return 404, {'error': 'not found'}
+        if len(segments) == 2:
+            work = self.by_id.get(openalex._compact_openalex_id(segments[1]))
+            return (200, work) if work is not None else (404, {'error': 'not found'})
+        filters = self._parse_filters(query.get('filter', ''))
+        per_page = max(1, min(int(query.get('per-page', 25)), 200))
+        if 'openalex_id' in filters:
+            ids = [openalex._compact_openalex_id(x) for x in filters['openalex_id'].split('|')]
+            if self.bad_ids.intersection(ids):
+                return 400, {'error': 'invalid openalex_id'}
+            results = [self.by_id[x] for x in ids if x in self.by_id]
+            return 200, {'meta': {'count': len(results), 'next_cursor': None}, 'results': results[:per_page]}
+        matches = self._search(query.get('search', ''), filters)
+        cursor = query.get('cursor', '*')
+        start = 0 if cursor in ('*', '') else int(cursor)
+        page = matches[start:start + per_page]
+        next_cursor = str(start + per_page) if start + per_page < len(matches) else None
+        return 200, {'meta': {'count': len(matches), 'next_cursor': next_cursor}, 'results': page}
+
+    @staticmethod
+    def _parse_filters(text):
+        filters = {}
+        for item in text.split(','):
+            if ':' in item:
+                key, value = item.split(':', 1)
+                filters[key] = value
+        return filters
+
+    def _search(self, text, filters):
+        text = text.lower()
+        low = int(filters['from_publication_date'][:4]) if 'from_publication_date' in filters else None
+        high = int(filters['to_publication_date'][:4]) if 'to_publication_date' in filters else None
+        out = []
+        for work in self.corpus:
+            if text and text not in work['display_name'].lower():
+                continue
+            year = work.get('publication_year')
+            if (low is not None and year < low) or (high is not None and year > high):
+                continue
+            out.append(work)
+        return out
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def run_benchmark(n_works=2000, refs_per_work=20, query='', max_results=None, per_page=200, latency=0.01, jitter=0.0, error_rate=0.0, max_workers=8, rate=0.0, chunk_size=None, reference_cache=None, track_memory=True, seed=0):
+    """Time ``search_to_dataframe(expand_references=True)`` against a stand-in.
+
+    ``rate`` is the client's token-bucket rate (0 disables limiting, which
+    is what a local benchmark usually wants). Peak memory is the
+    ``tracemalloc`` peak of the Python heap during the run, stand-in
+    included; tracing slows the client down, so pass ``track_memory=False``
+    for clean throughput figures. Returns a dict of measurements.
+    """
+    corpus = make_corpus(n_works, refs_per_work, seed)
+    max_results = n_works if max_results is None else max_results
+    with StandInServer(corpus, latency=latency, jitter=jitter, error_rate=error_rate, seed=seed) as server:
+        with openalex.OpenAlexSession(api_base=server.url, max_workers=max_workers, rate=rate, backoff=0.05) as session:
+            if track_memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            data = openalex.search_to_dataframe(
+                query,
+                max_results=max_results,
+                per_page=per_page,
+                expand_references=True,
+                reference_cache=reference_cache,
+                session=session,
+                chunk_size=chunk_size,
+            )
+            elapsed = time.perf_counter() - started
+            peak = None
+            if track_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            requests = server.requests
+    elapsed = max(elapsed, 1e-9)
+    return {
+        'works': int(data.shape[0]),
+        'requests': int(requests),
+        'seconds': round(elapsed, 3),
+        'requests_per_sec': round(requests / elapsed, 1),
+        'works_per_sec': round(data.shape[0] / elapsed, 1),
+        'peak_memory_mb': round(peak / (1024.0 * 1024.0), 1) if peak is not None else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the pyBibX OpenAlex client against a local stand-in server.')
+    parser.add_argument('--works', type=int, default=2000, help='fixture corpus size')
+    parser.add_argument('--refs', type=int, default=20, help='references per work')
+    parser.add_argument('--max-results', type=int, default=None)
+    parser.add_argument('--per-page', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.01, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--workers', type=int, default=8, help='client thread pool size')
+    parser.add_argument('--rate', type=float, default=0.0, help='client requests/sec limit (0: unlimited)')
+    parser.add_argument('--chunk-size', type=int, default=None, help='stream pages into the frame builder in chunks')
+    parser.add_argument('--reference-cache', default=None, help='path of a SQLite reference cache')
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc (faster, no peak memory)')
+    args = parser.parse_args(argv)
+    result = run_benchmark(
+        n_works=args.works,
+        refs_per_work=args.refs,
+        max_results=args.max_results,
+        per_page=args.per_page,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        max_workers=args.workers,
+        rate=args.rate,
+        chunk_size=args.chunk_size,
+        reference_cache=args.reference_cache,
+        track_memory=not args.no_memory,
+    )
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == '__main__':
+    main()
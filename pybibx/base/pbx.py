@@ -13,6 +13,7 @@
 ############################################################################
 # Required Libraries
 import chardet
+import copy
 import networkx as nx
 import numpy as np
 import os
@@ -29,22 +30,31 @@ except ImportError:
     import importlib_resources as pkg_resources
 
 from . import stws
+from .affiliation import country_matcher, institution_matcher
+from .entity import ENTITY_FAMILIES, EntityStore, RaggedBuilder, RaggedList, encode_ragged, incidence_matrix
+from .impact import impact_indices
+from .reader import read_bib_frame, read_scopus_csv_frame, stream_bib_frames, stream_scopus_csv_frames
+from .references import ReferenceResolver, as_reference_index, canonical_reference_map, normalize_title
 from .batch import (
     BatchConfig,
+    expand_file_list,
+    resolve_workers,
     estimate_dataframe_memory_mb,
     should_batch_df,
+    should_batch_file,
     chunk_dataframe,
     chunk_list,
     concat_numpy_chunks,
+    ordered_pool_map,
 )
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 from itertools import combinations
 from numba import njit
 from numba.typed import List
 from scipy.ndimage import gaussian_filter1d
 from scipy.signal import find_peaks
-from scipy.sparse import coo_matrix
 from scipy.sparse import csr_matrix
 from sklearn.cluster import KMeans
 from sklearn.decomposition import TruncatedSVD as tsvd
@@ -241,30 +251,6 @@ def _get_wordcloud():
 
 ############################################################################
 
-@njit
-def build_edges(idx_list):
-    total_pairs = 0
-    for items in idx_list:
-        n = len(items)
-        if (n > 1):
-            total_pairs = total_pairs + n * (n - 1)
-    rows = np.empty(total_pairs, dtype = np.int32)
-    cols = np.empty(total_pairs, dtype = np.int32)
-    pos  = 0
-    for items in idx_list:
-        n = len(items)
-        for i in range(0, n):
-            for j in range(i+1, n):
-                a1        = items[i]
-                a2        = items[j]
-                rows[pos] = a1
-                cols[pos] = a2
-                pos       = pos + 1
-                rows[pos] = a2
-                cols[pos] = a1
-                pos       = pos + 1
-    return rows, cols
-
 @njit
 def build_edges_ref(ref_idx_list):
     count = 0
@@ -287,12 +273,93 @@ def _require_dependency(dep, package = None, feature = None):
         feat   = f" for {feature}" if feature else ''
         raise ImportError(f"Install {target}{feat} to use this functionality.")
     return dep
+
+class _derived:
+    """Lazily computed, cached pbx_probe attribute.
+
+    On first access ``producer`` (a method name) is called; it assigns
+    this attribute and the others of its group as plain instance
+    attributes, which shadow the descriptor from then on. ``depends``
+    lists the attributes the value is derived from; _invalidate_derived
+    drops a cached value when one of them changes. Assigning the
+    attribute directly simply stores the value.
+    """
+
+    def __init__(self, producer, depends = ()):
+        self.producer = producer
+        self.depends  = frozenset(depends)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner = None):
+        if (obj is None):
+            return self
+        getattr(obj, self.producer)()
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
+_STOPWORDS_MEMO = {}
+
+def _read_stopwords(name, sample_size = 1 << 16):
+    # Packaged stopword lists never change, so each file is decoded once
+    # per process; chardet only looks at a bounded sample of its bytes.
+    if (name not in _STOPWORDS_MEMO):
+        with pkg_resources.open_binary(stws, name) as file:
+            sample = file.read(sample_size)
+        encoding = chardet.detect(sample)['encoding']
+        with pkg_resources.open_text(stws, name, encoding = encoding) as file:
+            content = file.read().split('\n')
+        content  = [line.rstrip('\r').rstrip('\n') for line in content]
+        _STOPWORDS_MEMO[name] = tuple(filter(None, content))
+    return list(_STOPWORDS_MEMO[name])
             
 ############################################################################
 
 # pbx Class
 class pbx_probe():
+
+    # Derived __make_bib outputs, computed on first access (see _derived).
+    aut_h        = _derived('_derive_author_indices',  ('aut', 'u_aut', 'citation', 'dy'))
+    aut_g        = _derived('_derive_author_indices',  ('aut', 'u_aut', 'citation', 'dy'))
+    aut_e        = _derived('_derive_author_indices',  ('aut', 'u_aut', 'citation', 'dy'))
+    aut_j        = _derived('_derive_author_indices',  ('aut', 'u_aut', 'citation', 'dy'))
+    t_c          = _derived('_derive_self_citations',  ('u_aut', 'author_to_papers', 'ref', 'citation'))
+    s_c          = _derived('_derive_self_citations',  ('u_aut', 'author_to_papers', 'ref', 'citation'))
+    r_c          = _derived('_derive_self_citations',  ('u_aut', 'author_to_papers', 'ref', 'citation'))
+    dy_c_year    = _derived('_derive_collaboration',   ('aut', 'aut_docs', 'dy', 'date_str', 'date_end'))
+    dy_ref       = _derived('_derive_reference_ids',   ('data', 'ref', 'u_ref', 'dy', 'date_end'))
+    u_ref_id     = _derived('_derive_reference_ids',   ('data', 'ref', 'u_ref', 'dy', 'date_end'))
+    ref_id       = _derived('_derive_reference_ids',   ('data', 'ref', 'u_ref', 'dy', 'date_end'))
+    table_id_doc = _derived('_pbx_probe__id_document', ('data',))
+    dict_id_doc  = _derived('_pbx_probe__id_document', ('data',))
+    table_id_aut = _derived('_pbx_probe__id_author',   ('u_aut',))
+    dict_id_aut  = _derived('_pbx_probe__id_author',   ('u_aut',))
+    dict_aut_id  = _derived('_pbx_probe__id_author',   ('u_aut',))
+    table_id_jou = _derived('_pbx_probe__id_source',   ('u_jou',))
+    dict_id_jou  = _derived('_pbx_probe__id_source',   ('u_jou',))
+    dict_jou_id  = _derived('_pbx_probe__id_source',   ('u_jou',))
+    table_id_uni = _derived('_pbx_probe__id_institution', ('u_uni',))
+    dict_id_uni  = _derived('_pbx_probe__id_institution', ('u_uni',))
+    dict_uni_id  = _derived('_pbx_probe__id_institution', ('u_uni',))
+    table_id_ctr = _derived('_pbx_probe__id_country',  ('u_ctr',))
+    dict_id_ctr  = _derived('_pbx_probe__id_country',  ('u_ctr',))
+    dict_ctr_id  = _derived('_pbx_probe__id_country',  ('u_ctr',))
+    table_id_kwa = _derived('_pbx_probe__id_kwa',      ('u_auk',))
+    dict_id_kwa  = _derived('_pbx_probe__id_kwa',      ('u_auk',))
+    dict_kwa_id  = _derived('_pbx_probe__id_kwa',      ('u_auk',))
+    table_id_kwp = _derived('_pbx_probe__id_kwp',      ('u_kid',))
+    dict_id_kwp  = _derived('_pbx_probe__id_kwp',      ('u_kid',))
+    dict_kwp_id  = _derived('_pbx_probe__id_kwp',      ('u_kid',))
+
     def __init__(self, file_bib = None, db = 'scopus', del_duplicated = True, data = None, **kwargs):
+        db_list                = None
+        if isinstance(db, (list, tuple)):
+            db_list            = [str(item).lower() for item in db]
+            db                 = db_list[0] if len(db_list) > 0 else 'scopus'
         db                     = db.lower()
         self.database          = db
         self.institution_names =  [ 
@@ -688,6 +755,14 @@ class pbx_probe():
                                     '#d85679', '#12e193', '#82cafc', '#ac9362', '#f8481c', '#c292a1', '#c0fa8b', '#ca7b80',
                                     '#f4d054', '#fbdd7e', '#ffff7e', '#cd7584', '#f9bc08', '#c7c10c'
                                   ]
+        self.batch_config   = BatchConfig()
+        self.cache_dir      = kwargs.get('cache_dir', None)
+        self.canonical_refs = kwargs.get('canonical_refs', False)
+        self.ref_variants   = {}
+        self.ref_index      = as_reference_index(kwargs.get('reference_index', None))
+        if (kwargs.get('state', None) is not None):
+            self.load_state(kwargs['state'], mmap = kwargs.get('mmap', True))
+            return
         if (data is not None):
             if (self.database == 'openalex'):
                 from .openalex import works_to_dataframe, normalize_openalex_dataframe
@@ -699,8 +774,11 @@ class pbx_probe():
                     self.data = normalize_openalex_dataframe(data)
                 elif isinstance(data, list):
                     self.data = works_to_dataframe(data, expand_references = expand_references, mailto = mailto, max_refs_per_work = max_refs_per_work, reference_cache = reference_cache)
+                elif hasattr(data, '__iter__') and not isinstance(data, (str, bytes, dict)):
+                    chunk_size = self._get_chunk_size('make_bib')
+                    self.data  = works_to_dataframe(data, expand_references = expand_references, mailto = mailto, max_refs_per_work = max_refs_per_work, reference_cache = reference_cache, chunk_size = chunk_size)
                 else:
-                    raise TypeError("For db='openalex', data must be a pandas DataFrame or a list of OpenAlex work dictionaries.")
+                    raise TypeError("For db='openalex', data must be a pandas DataFrame or an iterable of OpenAlex work dictionaries.")
                 self._normalize_openalex_country_columns()
             else:
                 self.data = data.copy(deep = True)
@@ -709,7 +787,11 @@ class pbx_probe():
         else:
             if (file_bib is None):
                 raise ValueError('file_bib is required unless a DataFrame is provided via data=...')
-            if (self.database == 'openalex'):
+            many_files = isinstance(file_bib, (list, tuple)) or (db_list is not None)
+            many_files = many_files or (isinstance(file_bib, str) and any(ch in file_bib for ch in '*?[') and not os.path.exists(file_bib))
+            if (many_files):
+                self.data, self.entries = self.__read_bib_many(file_bib, db_list if db_list is not None else db, del_duplicated, **kwargs)
+            elif (self.database == 'openalex'):
                 from .openalex import load_openalex_auto
                 expand_references = kwargs.get('expand_references', False)
                 mailto = kwargs.get('mailto', None)
@@ -721,14 +803,18 @@ class pbx_probe():
                     mailto = mailto,
                     max_refs_per_work = max_refs_per_work,
                     reference_cache = reference_cache,
+                    chunk_size = self._get_chunk_size('make_bib'),
                 )
                 self._normalize_openalex_country_columns()
                 self.entries = []
                 doc = self.data.shape[0]
                 self.vb = ['A Total of ' + str(doc) + ' Documents were Found']
+            elif (self.cache_dir is None and self._should_stream(file_bib)):
+                self.entries, frames = self.__read_bib_stream(file_bib, db, del_duplicated)
+                self.__make_bib(frames = frames)
+                return
             else:
-                self.data, self.entries = self.__read_bib(file_bib, db, del_duplicated)
-        self.batch_config = BatchConfig()
+                self.data, self.entries = self.__read_bib_cached(file_bib, db, del_duplicated, self.cache_dir)
         self.__make_bib()
 
     def _country_lookup_maps(self):
@@ -831,6 +917,19 @@ class pbx_probe():
             df = getattr(self, 'data', None)
         return should_batch_df(df, cfg)
 
+    # Function: Decide whether an export should be parsed straight into
+    # the batch __make_bib instead of being read whole first
+    def _should_stream(self, path):
+        if not hasattr(self, 'batch_config') or self.batch_config is None:
+            self.batch_config = BatchConfig()
+        cfg  = self.batch_config
+        mode = getattr(cfg, 'mode', 'auto')
+        if (mode == 'off'):
+            return False
+        if (mode == 'on'):
+            return True
+        return should_batch_file(path, cfg)
+
     # Function: Resolve the chunk size for a given operation
     def _get_chunk_size(self, op = "general"):
         if not hasattr(self, 'batch_config') or self.batch_config is None:
@@ -902,10 +1001,87 @@ class pbx_probe():
     # ----------------------------------------------------------------
 
     # Function: Prepare .bib File (dispatcher)
-    def __make_bib(self, verbose = True):
-        if self._should_batch(getattr(self, 'data', None), op = "make_bib"):
-            return self.__make_bib_batch(verbose = verbose)
-        return self.__make_bib_small(verbose = verbose)
+    def __make_bib(self, verbose = True, frames = None):
+        self._merge_state = None
+        self._invalidate_derived()
+        if (frames is not None):
+            result = self.__make_bib_batch(verbose = verbose, frames = frames)
+        elif self._should_batch(getattr(self, 'data', None), op = "make_bib"):
+            result = self.__make_bib_batch(verbose = verbose)
+        else:
+            result = self.__make_bib_small(verbose = verbose)
+        self.ref_variants = {}
+        if (getattr(self, 'canonical_refs', False)):
+            self.__canonicalize_references()
+        self._build_entity_store()
+        return result
+
+    # Function: Entity Store (integer-coded entity lists, see entity.py).
+    # Families that are not computed yet (ref_id is derived lazily) are
+    # added when they are.
+    def _build_entity_store(self):
+        self.entities = EntityStore()
+        for name in ENTITY_FAMILIES:
+            if (name in self.__dict__):
+                setattr(self, name, self.entities.set(name, self.__dict__[name]))
+        return self.entities
+
+    def _entity_store(self):
+        store = getattr(self, 'entities', None)
+        if (store is None or any(store.families.get(name) is not self.__dict__.get(name) for name in ENTITY_FAMILIES)):
+            store = self._build_entity_store()
+        return store
+
+    # Function: Drop Cached Derived Outputs. With no argument every derived
+    # attribute is dropped; otherwise those depending (transitively) on
+    # one of ``changed``, and the groups of any derived name in ``changed``.
+    def _invalidate_derived(self, *changed):
+        fields  = {name: item for name, item in vars(type(self)).items() if isinstance(item, _derived)}
+        changed = set(changed) if changed else set(fields)
+        changed = changed | {name for name, item in fields.items() for other in changed if other in fields and fields[other].producer == item.producer}
+        dropped = set()
+        while True:
+            stale = {name for name, item in fields.items() if name not in dropped and (name in changed or item.depends & changed)}
+            if not stale:
+                break
+            dropped.update(stale)
+            changed.update(stale)
+        for name in dropped:
+            self.__dict__.pop(name, None)
+        return
+
+    # Function: Compute Derived Outputs now (all, or the groups of ``names``)
+    def _materialize_derived(self, *names):
+        fields = {name: item for name, item in vars(type(self)).items() if isinstance(item, _derived)}
+        for name in (names if names else fields):
+            getattr(self, name)
+        return
+
+    # Producers of the derived outputs declared at the top of the class.
+    def _derive_author_indices(self):
+        self.aut_h = self.h_index()
+        self.aut_g = self.g_index()
+        self.aut_e = self.e_index()
+        self.aut_j = self.j_index()
+        return
+
+    def _derive_self_citations(self):
+        self.t_c, self.s_c = self.__total_and_self_citations()
+        self.r_c           = [self.s_c[i]/max(self.t_c[i], 1) for i in range(0, len(self.t_c))]
+        return
+
+    def _derive_collaboration(self):
+        self.dy_c_year = self.__get_collaboration_year()
+        return
+
+    def _derive_reference_ids(self):
+        self.dy_ref   = self.__get_ref_year()
+        self.u_ref_id = self.__get_ref_id()
+        ref_map       = dict(zip(self.u_ref, self.u_ref_id))
+        ref_id        = [[ref_map.get(ref, ref) for ref in ref_list] for ref_list in self.ref]
+        store         = getattr(self, 'entities', None)
+        self.ref_id   = store.set('ref_id', ref_id) if store is not None else ref_id
+        return
 
     # Function: Prepare .bib File (small/in-memory legacy path)
     def __make_bib_small(self, verbose = True):
@@ -971,10 +1147,6 @@ class pbx_probe():
         self.av_c_doc              = round(sum(self.citation)/self.data.shape[0], 2) if self.data.shape[0] > 0 else 0
         self.ref, self.u_ref       = self.__get_str(entry = 'references', s = ';',     lower = False, sorting = True)
         self.aut, self.u_aut       = self.__get_str(entry = 'author',     s = ' and ', lower = True,  sorting = True)
-        self.aut_h                 = self.h_index()
-        self.aut_g                 = self.g_index()
-        self.aut_e                 = self.e_index()
-        self.aut_j                 = self.j_index()
         self.aut_docs              = [len(item) for item in self.aut]
         self.aut_single            = len([item  for item in self.aut_docs if item == 1])
         self.aut_multi             = [item for item in self.aut_docs if item > 1]
@@ -1002,31 +1174,14 @@ class pbx_probe():
         self.uni_cit               = self.__get_counts(self.u_uni, self.uni, self.citation)
         self.doc_aut               = self.__get_counts(self.u_aut, self.aut)
         self.av_doc_aut            = round(sum(self.doc_aut)/len(self.doc_aut), 2) if len(self.doc_aut) > 0 else 0
-        self.t_c, self.s_c         = self.__total_and_self_citations()
-        self.r_c                   = [self.s_c[i]/max(self.t_c[i], 1) for i in range(0, len(self.t_c))]
-        self.dy_c_year             = self.__get_collaboration_year()
         self.u_ref                 = [ref for ref in self.u_ref if ref.lower() != 'unknown']
-        self.dy_ref                = self.__get_ref_year()
-        self.u_ref_id              = self.__get_ref_id()
-        ref_map                    = dict(zip(self.u_ref, self.u_ref_id))
-        self.ref_id                = []
-        for ref_list in self.ref:
-            r_id = [ref_map.get(ref, ref) for ref in ref_list]
-            self.ref_id.append(r_id)
-        self.__id_document()
-        self.__id_author()
-        self.__id_source()
-        self.__id_institution()
-        self.__id_country()
-        self.__id_kwa()
-        self.__id_kwp()
         if (verbose == True):
             for i in range(0, len(self.vb)):
                 print(self.vb[i])
         return
 
     # Function: Prepare .bib File (chunked/batch path)
-    def __make_bib_batch(self, verbose = True):
+    def __make_bib_batch(self, verbose = True, frames = None):
         """Streaming equivalent of __make_bib_small.
 
         Produces the same public attributes as the in-memory path, but
@@ -1045,8 +1200,14 @@ class pbx_probe():
         self.aut / self.ref / self.citation: h/g/e/j indices,
         __total_and_self_citations, __get_collaboration_year,
         __get_ref_year, __get_ref_id, and the __id_* lookup builders.
+
+        ``frames``, when given, is an iterable of normalized chunks (see
+        __read_bib_stream) that is parsed as it is read; self.data is
+        assembled from those chunks after the loop instead of being
+        read whole and split first.
         """
-        self.data                  = self.data.reset_index(drop = True).copy()
+        if (frames is None):
+            self.data              = self.data.reset_index(drop = True).copy()
         self.ask_gpt_ap            = -1
         self.ask_gpt_cp            = -1
         self.ask_gpt_ip            = -1
@@ -1071,25 +1232,25 @@ class pbx_probe():
         self.rpys_rs               = -1
         self.top_co_c              = -1
         self.natsort               = lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', s)]
-        if self.data.empty:
-            # Same empty-state initialization as the small path.
-            return self.__make_bib_small(verbose = verbose)
-        self.data['year']  = self.data['year'].replace('UNKNOWN', '0')
-        chunk_size         = self._get_chunk_size('make_bib')
-        if getattr(self.batch_config, 'verbose', False):
-            print(f'[pybibx batch] __make_bib_batch: rows={len(self.data)}, chunk_size={chunk_size}')
+        chunk_size                 = self._get_chunk_size('make_bib')
+        if (frames is None):
+            if self.data.empty:
+                # Same empty-state initialization as the small path.
+                return self.__make_bib_small(verbose = verbose)
+            self.data['year'] = self.data['year'].replace('UNKNOWN', '0')
+            if getattr(self.batch_config, 'verbose', False):
+                print(f'[pybibx batch] __make_bib_batch: rows={len(self.data)}, chunk_size={chunk_size}')
+        elif getattr(self.batch_config, 'verbose', False):
+            print(f'[pybibx batch] __make_bib_batch: rows=streamed, chunk_size={chunk_size}')
 
         # ---- Streaming accumulators ----
+        # Entity rows are CSR-encoded chunk by chunk (see entity.py), so
+        # no family is ever held as a full list of lists of strings. The
+        # ctr / uni rows are also kept before replace_unknowns, which is
+        # what the side maps read.
         all_years     = []
         all_citations = []
-        all_ref       = []
-        all_aut       = []
-        all_kid       = []
-        all_auk       = []
-        all_jou       = []
-        all_lan       = []
-        all_ctr       = []
-        all_uni       = []
+        all_rows      = {name: RaggedBuilder() for name in ('ref', 'aut', 'kid', 'auk', 'jou', 'lan', 'ctr', 'uni', 'ctr_raw', 'uni_raw')}
 
         u_ref_counter = Counter()
         u_aut_counter = Counter()
@@ -1110,90 +1271,59 @@ class pbx_probe():
         country_doc_counter     = Counter()
         institution_doc_counter = Counter()
 
+        # ---- Map: parse chunks (optionally in a process pool) ----
+        # A stream's length is unknown up front; the pool is then only
+        # clamped to the CPU count.
+        if (frames is None):
+            n_chunks = -(-len(self.data) // chunk_size) if chunk_size > 0 else 1
+            frames   = chunk_dataframe(self.data, chunk_size)
+            streamed = None
+        else:
+            n_chunks = os.cpu_count() or 1
+            streamed = []
+            frames   = self.__collect_bib_frames(frames, streamed)
+        workers  = resolve_workers(getattr(self.batch_config, 'workers', 1), n_chunks)
+        if getattr(self.batch_config, 'verbose', False) and workers > 1:
+            print(f'[pybibx batch] __make_bib_batch: workers={workers}')
+        jobs          = self.__make_bib_chunk_jobs(frames)
         global_offset = 0
-        for chunk in chunk_dataframe(self.data, chunk_size):
-            n = len(chunk)
-            if n == 0:
-                continue
-
-            # Year
-            chunk_years = pd.to_numeric(chunk['year'], errors = 'coerce', downcast = 'float').tolist()
-            all_years.extend(chunk_years)
-
-            # Citations
-            chunk_cits = self._parse_citation_series_chunk(chunk['note'])
-            all_citations.extend(chunk_cits)
-
-            # Multi-valued fields
-            ref_chunk, _ = self._split_multivalue_series_chunk(chunk['references'],          sep = ';',     lower = False, is_reference = True)
-            aut_chunk, _ = self._split_multivalue_series_chunk(chunk['author'],              sep = ' and ', lower = True)
-            kid_chunk, _ = self._split_multivalue_series_chunk(chunk['keywords'],            sep = ';',     lower = True)
-            auk_chunk, _ = self._split_multivalue_series_chunk(chunk['author_keywords'],     sep = ';',     lower = True)
-            jou_chunk, _ = self._split_multivalue_series_chunk(chunk['abbrev_source_title'], sep = ';',     lower = True)
-            lan_chunk, _ = self._split_multivalue_series_chunk(chunk['language'],            sep = '.',     lower = True)
-
-            # Countries / institutions: depend on the chunk's authors,
-            # so do them right after parsing aut_chunk.
-            ctr_chunk, _ = self._extract_countries_chunk(chunk, aut_chunk, global_offset)
-            uni_chunk, _ = self._extract_institutions_chunk(chunk, aut_chunk, global_offset)
-
-            all_ref.extend(ref_chunk)
-            all_aut.extend(aut_chunk)
-            all_kid.extend(kid_chunk)
-            all_auk.extend(auk_chunk)
-            all_jou.extend(jou_chunk)
-            all_lan.extend(lan_chunk)
-            all_ctr.extend(ctr_chunk)
-            all_uni.extend(uni_chunk)
-
-            # Counters: flat counts (used to drive filter_list-equivalent
-            # outputs) and per-row presence-counts (used for *_cit /
-            # doc_aut, equivalent to __get_counts with `u in e`).
-            for refs in ref_chunk:
-                u_ref_counter.update(refs)
-            for kid in kid_chunk:
-                u_kid_counter.update(kid)
-            for auk in auk_chunk:
-                u_auk_counter.update(auk)
-            for lan in lan_chunk:
-                u_lan_counter.update(lan)
-            for jou in jou_chunk:
-                u_jou_counter.update(jou)
-            for aut_list in aut_chunk:
-                u_aut_counter.update(aut_list)
-            for ctrs in ctr_chunk:
-                u_ctr_counter.update(ctrs)
-            for unis in uni_chunk:
-                u_uni_counter.update(unis)
-
-            # author_to_papers, *_cit and doc_aut counters.
-            for local_i in range(0, n):
-                global_i     = global_offset + local_i
-                authors      = aut_chunk[local_i]
-                journals     = jou_chunk[local_i]
-                countries    = ctr_chunk[local_i]
-                institutions = uni_chunk[local_i]
-                cit_count    = chunk_cits[local_i]
-                # author_to_papers preserves duplicates (same as
-                # __make_bib_small).
-                for author in authors:
-                    author_to_papers[author].append(global_i)
-                # Per-row presence count (deduped within the row), to
-                # match `u in e` semantics of __get_counts.
-                for author in set(authors):
-                    author_cit_counter[author] += cit_count
-                    author_doc_counter[author] += 1
-                for j in set(journals):
-                    journal_cit_counter[j] += cit_count
-                    journal_doc_counter[j] += 1
-                for c in set(countries):
-                    country_cit_counter[c] += cit_count
-                    country_doc_counter[c] += 1
-                for u in set(institutions):
-                    institution_cit_counter[u] += cit_count
-                    institution_doc_counter[u] += 1
 
-            global_offset += n
+        # ---- Reduce: in chunk (= row) order, so the result does not
+        # depend on the number of workers ----
+        for part in ordered_pool_map(pbx_probe._make_bib_chunk_job, jobs, workers):
+            all_years.extend(part['years'])
+            all_citations.extend(part['cits'])
+            for name in ('ref', 'aut', 'kid', 'auk', 'jou', 'lan'):
+                all_rows[name].append(part[name])
+            for name in ('ctr', 'uni'):
+                all_rows[name + '_raw'].append(part[name])
+                all_rows[name].append(self.replace_unknowns(part[name]))
+            u_ref_counter.update(part['u_ref'])
+            u_kid_counter.update(part['u_kid'])
+            u_auk_counter.update(part['u_auk'])
+            u_lan_counter.update(part['u_lan'])
+            u_jou_counter.update(part['u_jou'])
+            u_aut_counter.update(part['u_aut'])
+            u_ctr_counter.update(part['u_ctr'])
+            u_uni_counter.update(part['u_uni'])
+            for author, papers in part['author_to_papers'].items():
+                author_to_papers[author].extend(papers)
+            author_cit_counter.update(part['author_cit'])
+            author_doc_counter.update(part['author_doc'])
+            journal_cit_counter.update(part['journal_cit'])
+            journal_doc_counter.update(part['journal_doc'])
+            country_cit_counter.update(part['country_cit'])
+            country_doc_counter.update(part['country_doc'])
+            institution_cit_counter.update(part['institution_cit'])
+            institution_doc_counter.update(part['institution_doc'])
+            global_offset += len(part['years'])
+
+        if (streamed is not None):
+            if (len(streamed) == 0):
+                self.data = pd.DataFrame(columns = self.entries)
+                return self.__make_bib_small(verbose = verbose)
+            self.data = pd.concat(streamed, ignore_index = True)
+            del streamed
 
         # ---- Finalize public attributes ----
         self.dy        = pd.Series(all_years, dtype = 'float64').reset_index(drop = True)
@@ -1207,17 +1337,14 @@ class pbx_probe():
         self.av_c_doc  = round(sum(self.citation) / self.data.shape[0], 2) if self.data.shape[0] > 0 else 0
 
         # References (raw): __get_str sorts unique alphabetically; so do we.
-        self.ref       = all_ref
+        all_rows       = {name: builder.build() for name, builder in all_rows.items()}
+        self.ref       = all_rows['ref']
         self.u_ref     = sorted(u_ref_counter.keys())
 
         # Authors: __get_str alphabetic.
-        self.aut       = all_aut
+        self.aut       = all_rows['aut']
         self.u_aut     = sorted(u_aut_counter.keys())
 
-        self.aut_h     = self.h_index()
-        self.aut_g     = self.g_index()
-        self.aut_e     = self.e_index()
-        self.aut_j     = self.j_index()
         self.aut_docs  = [len(item) for item in self.aut]
         self.aut_single = len([item for item in self.aut_docs if item == 1])
         self.aut_multi  = [item for item in self.aut_docs if item > 1]
@@ -1230,70 +1357,121 @@ class pbx_probe():
 
         # Keywords / author keywords / journals: filter_list with
         # default simple=False (drops 'unknown', sorts by count desc).
-        self.kid                   = all_kid
+        self.kid                   = all_rows['kid']
         u_kid_raw                  = sorted(u_kid_counter.keys())
         self.u_kid, self.kid_count = self._filter_list_from_counter(u_kid_raw, u_kid_counter, simple = False)
 
-        self.auk                   = all_auk
+        self.auk                   = all_rows['auk']
         u_auk_raw                  = sorted(u_auk_counter.keys())
         self.u_auk, self.auk_count = self._filter_list_from_counter(u_auk_raw, u_auk_counter, simple = False)
 
-        self.jou                   = all_jou
+        self.jou                   = all_rows['jou']
         u_jou_raw                  = sorted(u_jou_counter.keys())
         self.u_jou, self.jou_count = self._filter_list_from_counter(u_jou_raw, u_jou_counter, simple = False)
         # jou_cit aligned to the (re-sorted) u_jou:
         self.jou_cit               = [journal_cit_counter[j] for j in self.u_jou]
 
         # Languages: filter_list with simple=True (alphabetic order).
-        self.lan                   = all_lan
+        self.lan                   = all_rows['lan']
         u_lan_raw                  = sorted(u_lan_counter.keys())
         self.u_lan, self.lan_count = self._filter_list_from_counter(u_lan_raw, u_lan_counter, simple = True)
 
         # Countries: built incrementally during the chunk loop above.
-        self.ctr                   = self.replace_unknowns(all_ctr)
+        self.ctr                   = all_rows['ctr']
         u_ctr_raw                  = sorted(u_ctr_counter.keys())
         self.u_ctr, self.ctr_count = self._filter_list_from_counter(u_ctr_raw, u_ctr_counter, simple = True)
         self.ctr_cit               = [country_cit_counter[c] for c in self.u_ctr]
         # Rebuild author_country_map / corr_a_country_map / frst_a_country_map
         # from the streamed data so the public attributes match the
         # small path's shape.
-        self._build_country_side_maps_from_streams(all_aut, all_ctr)
+        self._build_country_side_maps_from_streams(self.aut, all_rows['ctr_raw'])
 
         # Institutions: built incrementally during the chunk loop above.
-        self.uni                   = self.replace_unknowns(all_uni)
+        self.uni                   = all_rows['uni']
         u_uni_raw                  = sorted(u_uni_counter.keys())
         self.u_uni, self.uni_count = self._filter_list_from_counter(u_uni_raw, u_uni_counter, simple = True)
         self.uni_cit               = [institution_cit_counter[u] for u in self.u_uni]
-        self._build_institution_side_maps_from_streams(all_aut, all_uni)
+        self._build_institution_side_maps_from_streams(self.aut, all_rows['uni_raw'])
 
         # doc_aut: equivalent to __get_counts(u_aut, aut) (presence).
         self.doc_aut    = [author_doc_counter[a] for a in self.u_aut]
         self.av_doc_aut = round(sum(self.doc_aut) / len(self.doc_aut), 2) if len(self.doc_aut) > 0 else 0
 
-        self.t_c, self.s_c = self.__total_and_self_citations()
-        self.r_c           = [self.s_c[i] / max(self.t_c[i], 1) for i in range(0, len(self.t_c))]
-        self.dy_c_year     = self.__get_collaboration_year()
         self.u_ref         = [ref for ref in self.u_ref if ref.lower() != 'unknown']
-        self.dy_ref        = self.__get_ref_year()
-        self.u_ref_id      = self.__get_ref_id()
-        ref_map            = dict(zip(self.u_ref, self.u_ref_id))
-        self.ref_id        = []
-        for ref_list in self.ref:
-            r_id = [ref_map.get(ref, ref) for ref in ref_list]
-            self.ref_id.append(r_id)
-
-        self.__id_document()
-        self.__id_author()
-        self.__id_source()
-        self.__id_institution()
-        self.__id_country()
-        self.__id_kwa()
-        self.__id_kwp()
         if (verbose == True):
             for i in range(0, len(self.vb)):
                 print(self.vb[i])
         return
 
+    # Helper: lazily yield the chunk jobs of __make_bib_batch. Only the
+    # lookup tables the chunk parsers read are shipped with each chunk.
+    def __make_bib_chunk_jobs(self, frames):
+        tables = (self.country_names, self.institution_names, self.inst_priority)
+        offset = 0
+        for chunk in frames:
+            yield (chunk, offset, tables)
+            offset = offset + len(chunk)
+
+    # Helper: give streamed chunks their global row labels and the batch
+    # year convention, keeping them for the final self.data
+    def __collect_bib_frames(self, frames, streamed):
+        offset = 0
+        for chunk in frames:
+            chunk.index   = pd.RangeIndex(offset, offset + len(chunk))
+            chunk['year'] = chunk['year'].replace('UNKNOWN', '0')
+            offset        = offset + len(chunk)
+            streamed.append(chunk)
+            yield chunk
+
+    # Helper: parse one chunk for __make_bib_batch (runs in a worker
+    # process when BatchConfig.workers > 1). Returns the chunk's rows and
+    # its partial Counters; __make_bib_batch reduces them in chunk order.
+    @staticmethod
+    def _make_bib_chunk_job(job):
+        chunk, global_offset, tables = job
+        probe = pbx_probe.__new__(pbx_probe)
+        probe.country_names, probe.institution_names, probe.inst_priority = tables
+        part          = {}
+        part['years'] = pd.to_numeric(chunk['year'], errors = 'coerce', downcast = 'float').tolist()
+        part['cits']  = probe._parse_citation_series_chunk(chunk['note'])
+        part['ref'], _ = probe._split_multivalue_series_chunk(chunk['references'],          sep = ';',     lower = False, is_reference = True)
+        part['aut'], _ = probe._split_multivalue_series_chunk(chunk['author'],              sep = ' and ', lower = True)
+        part['kid'], _ = probe._split_multivalue_series_chunk(chunk['keywords'],            sep = ';',     lower = True)
+        part['auk'], _ = probe._split_multivalue_series_chunk(chunk['author_keywords'],     sep = ';',     lower = True)
+        part['jou'], _ = probe._split_multivalue_series_chunk(chunk['abbrev_source_title'], sep = ';',     lower = True)
+        part['lan'], _ = probe._split_multivalue_series_chunk(chunk['language'],            sep = '.',     lower = True)
+
+        # Countries / institutions depend on the chunk's authors.
+        part['ctr'], _ = probe._extract_countries_chunk(chunk, part['aut'], global_offset)
+        part['uni'], _ = probe._extract_institutions_chunk(chunk, part['aut'], global_offset)
+
+        # Flat counts (filter_list-equivalent outputs).
+        for name in ('ref', 'kid', 'auk', 'lan', 'jou', 'aut', 'ctr', 'uni'):
+            counter = Counter()
+            for row in part[name]:
+                counter.update(row)
+            part['u_' + name] = counter
+
+        # author_to_papers keeps duplicates (same as __make_bib_small);
+        # *_cit / *_doc are per-row presence counts, matching the
+        # `u in e` semantics of __get_counts.
+        author_to_papers = defaultdict(list)
+        presence         = {}
+        for key in ('author', 'journal', 'country', 'institution'):
+            presence[key + '_cit'] = Counter()
+            presence[key + '_doc'] = Counter()
+        for local_i in range(0, len(chunk)):
+            cit_count = part['cits'][local_i]
+            for author in part['aut'][local_i]:
+                author_to_papers[author].append(global_offset + local_i)
+            for key, name in (('author', 'aut'), ('journal', 'jou'), ('country', 'ctr'), ('institution', 'uni')):
+                for item in dict.fromkeys(part[name][local_i]):
+                    presence[key + '_cit'][item] += cit_count
+                    presence[key + '_doc'][item] += 1
+        part['author_to_papers'] = author_to_papers
+        part.update(presence)
+        return part
+
     # Helper: filter_list-equivalent built on top of a Counter so we
     # avoid the O(|u_e| * N_flat) e_.count() scan inside filter_list.
     def _filter_list_from_counter(self, u_e, counter, simple = False):
@@ -1309,6 +1487,19 @@ class pbx_probe():
         counts = [counts[i] for i in idx]
         return keys, counts
 
+    # Helper: corresponding author of a row, read the way the row's own
+    # export marks it (WoS in affiliation_, the others in
+    # correspondence_address1), so merged collections of mixed sources
+    # are parsed row by row. ``exact`` keeps the case-sensitive WoS test
+    # of the country maps.
+    def _corresponding_author(self, row, authors, exact = False):
+        if (str(row['source']).lower() == 'wos'):
+            aff    = row['affiliation_']
+            marked = ('Corresponding Author' in aff) if exact else ('corresponding author' in aff.lower())
+        else:
+            marked = 'corresponding author' in row['correspondence_address1'].lower()
+        return authors[0] if (marked and authors) else None
+
     # Side-map rebuilders used by __make_bib_batch to keep the public
     # author_*_map / corr_a_*_map / frst_a_*_map attributes consistent
     # with the small path's shape, without re-running the full-data
@@ -1328,15 +1519,9 @@ class pbx_probe():
                     self.author_country_map[author].append((row_idx, country))
         self.corr_a_country_map = {}
         for index, row in self.data.iterrows():
-            if (self.database.lower() == 'wos'):
-                if ('Corresponding Author' in row['affiliation_']):
-                    corresponding_author = next((author for author in self.aut[index] if 'Corresponding Author' in row['affiliation_']), None)
-                    if (corresponding_author and corresponding_author in self.author_country_map):
-                        self.corr_a_country_map[corresponding_author] = self.author_country_map[corresponding_author]
-            else:
-                corresponding_author = next((author for author in self.aut[index] if 'corresponding author' in row['correspondence_address1'].lower()), None)
-                if (corresponding_author and corresponding_author in self.author_country_map):
-                    self.corr_a_country_map[corresponding_author] = self.author_country_map[corresponding_author]
+            corresponding_author = self._corresponding_author(row, self.aut[index], exact = True)
+            if (corresponding_author and corresponding_author in self.author_country_map):
+                self.corr_a_country_map[corresponding_author] = self.author_country_map[corresponding_author]
         self.frst_a_country_map = {}
         for index, row in self.data.iterrows():
             if (self.aut[index]):
@@ -1359,16 +1544,9 @@ class pbx_probe():
         self.author_inst_map = {a: list(s) for a, s in author_inst_set.items()}
         self.corr_a_inst_map = {}
         for index, row in self.data.iterrows():
-            if (self.database == 'wos'):
-                if ('corresponding author' in row['affiliation_'].lower()):
-                    corresponding_author = next((author for author in self.aut[index] if 'corresponding author' in row['affiliation_'].lower()), None)
-                    if (corresponding_author and corresponding_author in self.author_inst_map):
-                        self.corr_a_inst_map[corresponding_author] = self.author_inst_map[corresponding_author]
-            else:
-                if ('corresponding author' in row['correspondence_address1'].lower()):
-                    corresponding_author = next((author for author in self.aut[index] if 'corresponding author' in row['correspondence_address1'].lower()), None)
-                    if (corresponding_author and corresponding_author in self.author_inst_map):
-                        self.corr_a_inst_map[corresponding_author] = self.author_inst_map[corresponding_author]
+            corresponding_author = self._corresponding_author(row, self.aut[index])
+            if (corresponding_author and corresponding_author in self.author_inst_map):
+                self.corr_a_inst_map[corresponding_author] = self.author_inst_map[corresponding_author]
         self.frst_a_inst_map = {}
         for index, row in self.data.iterrows():
             if (self.aut[index]):
@@ -1390,32 +1568,6 @@ class pbx_probe():
         logic (e.g. emitting (global_row_index, country) tuples
         directly during streaming). Currently unused.
         """
-        country_replacements = {
-            ' usa':            ' united states of america',
-            'england':         'united kingdom',
-            'antigua & barbu': 'antigua and barbuda',
-            'bosnia & herceg': 'bosnia and herzegovina',
-            'cent afr republ': 'central african republic',
-            'czech republic':  'czechia',
-            'dominican rep':   'dominican republic',
-            'equat guinea':    'equatorial guinea',
-            'fr austr lands':  'french southern territories',
-            'fr polynesia':    'french polynesia',
-            'malagasy republ': 'madagascar',
-            'mongol peo rep':  'mongolia',
-            'neth antilles':   'saint martin',
-            'north ireland':   'ireland',
-            'peoples r china': 'china',
-            'rep of georgia':  'georgia',
-            'russia':          'russian federation',
-            'sao tome e prin': 'sao tome and principe',
-            'scotland':        'united kingdom',
-            'st kitts & nevi': 'saint kitts and nevis',
-            'trinid & tobago': 'trinidad and tobago',
-            'u arab emirates': 'united arab emirates',
-            'usa':             'united states of america',
-            'vietnam':         'viet nam',
-        }
         data = chunk.copy(deep = True)
         def preprocess_affiliation(row):
             source = row['source'].lower()
@@ -1425,12 +1577,10 @@ class pbx_probe():
                 aff = row['affiliation_'].replace('(Corresponding Author)', '')
                 return aff.replace(',', ', ') if ',' in aff and ', ' not in aff else aff
             return 'UNKNOWN'
-        data['processed_affiliation'] = data.apply(preprocess_affiliation, axis = 1).str.lower()
-        data['processed_affiliation'] = data['processed_affiliation'].replace('united states of america', 'usa', regex = True)
-        data['processed_affiliation'] = data['processed_affiliation'].replace('united states', 'usa', regex = True)
-        data['processed_affiliation'] = data['processed_affiliation'].replace(country_replacements, regex = True)
-        rows   = []
-        unique = set()
+        data['processed_affiliation'] = data.apply(preprocess_affiliation, axis = 1)
+        matcher = country_matcher(self.country_names)
+        rows    = []
+        unique  = set()
         for local_i, (_, row) in enumerate(data.iterrows()):
             authors      = authors_chunk[local_i] if local_i < len(authors_chunk) else []
             source       = str(row.get('source', 'UNKNOWN')).lower()
@@ -1446,17 +1596,10 @@ class pbx_probe():
                     unique.add(country)
                 rows.append(row_countries)
                 continue
-            affiliations = row['processed_affiliation'].split(';')
+            affiliations  = [(aff.lower(), matcher.find(aff)) for aff in row['processed_affiliation'].split(';')]
             row_countries = []
             for author in authors:
-                detected_country = 'UNKNOWN'
-                for aff in affiliations:
-                    for country in self.country_names:
-                        if (country.lower() in aff and author in aff):
-                            detected_country = country
-                            break
-                    if (detected_country != 'UNKNOWN'):
-                        break
+                detected_country = next((country for aff, country in affiliations if country is not None and author in aff), 'UNKNOWN')
                 row_countries.append(detected_country)
                 unique.add(detected_country)
             rows.append(row_countries)
@@ -1470,19 +1613,7 @@ class pbx_probe():
         row-aware logic (e.g. emitting (global_row_index, value)
         tuples directly during streaming). Currently unused.
         """
-        def extract_top_institution_with_priority(text, institution_names):
-            segments              = text.split(';')
-            selected_institutions = []
-            for segment in segments:
-                segment   = segment.strip().lower()
-                sub_parts = segment.split(',')
-                matches   = [ (part.strip(), self.inst_priority.get(keyword, 0)) for part in sub_parts for keyword in self.inst_priority.keys() if keyword in part ]
-                if (matches):
-                    matches.sort(key = lambda x: (-x[1], -len(x[0])))
-                    selected_institutions.append(matches[0][0])
-                else:
-                    selected_institutions.append('UNKNOWN')
-            return selected_institutions
+        matcher = institution_matcher(self.inst_priority)
         sources = chunk['source'].str.lower()
         if 'affiliation' in chunk.columns:
             affiliations = chunk['affiliation'].fillna('').str.lower()
@@ -1498,7 +1629,7 @@ class pbx_probe():
             np.where(sources == 'wos', affiliations_wos, 'UNKNOWN')
         )
         processed_affiliations = pd.Series(processed_affiliations, index = chunk.index)
-        top_institutions       = processed_affiliations.apply(lambda row: extract_top_institution_with_priority(row, self.institution_names))
+        top_institutions       = processed_affiliations.apply(matcher.extract)
         rows = []
         unique = set()
         for local_i, (_, top_inst) in enumerate(top_institutions.items()):
@@ -1604,12 +1735,10 @@ class pbx_probe():
     # Function: Filter Lists
     def filter_list(self, u_e = [], e = [], simple = False):
         if (simple == True):
-            e_      = [item for sublist in e for item in sublist]
-            e_count = [e_.count(item) for item in u_e]   
+            e_count = self._entity_incidence(u_e, e).sum(axis = 0).A1.tolist()
         else:
             u_e     = [item for item in u_e if item.lower() != 'unknown']
-            e_      = [item for sublist in e for item in sublist]
-            e_count = [e_.count(item) for item in u_e]
+            e_count = self._entity_incidence(u_e, e).sum(axis = 0).A1.tolist()
             idx     = sorted(range(len(e_count)), key = e_count.__getitem__)
             idx.reverse()
             u_e     = [u_e[i]     for i in idx]
@@ -1761,19 +1890,30 @@ class pbx_probe():
                 if col in data.columns:
                     data[col] = data[col].apply(self._normalize_country_value)
         else:
-            data, _ = self.__read_bib(file_bib, db, del_duplicated)
-        self.data  = pd.concat([self.data, data])
-        self.data  = self.data.reset_index(drop = True)
-        self.data  = self.data.fillna('UNKNOWN')
-        if self._should_batch(self.data, op = 'merge_database'):
-            idx = self._dedup_indices_batch(self.data)
+            cache_dir = kwargs.get('cache_dir', getattr(self, 'cache_dir', None))
+            data, _   = self.__read_bib_cached(file_bib, db, del_duplicated, cache_dir)
+        if (kwargs.get('canonical_refs', None) is not None):
+            self.canonical_refs = kwargs['canonical_refs']
+        incremental = kwargs.get('incremental', False) and db.lower() != 'openalex' and self.database.lower() != 'openalex'
+        if (incremental):
+            self.__merge_incremental(data.fillna('UNKNOWN'))
+            if (getattr(self, 'canonical_refs', False)):
+                self.__canonicalize_references()
+            for i in range(0, len(self.vb)):
+                print(self.vb[i])
         else:
-            idx = self._dedup_indices_full(self.data)
-        if idx:
-            self.data.drop(idx, axis = 0, inplace = True)
-            self.data = self.data.reset_index(drop = True)
+            self.data  = pd.concat([self.data, data])
+            self.data  = self.data.reset_index(drop = True)
+            self.data  = self.data.fillna('UNKNOWN')
+            if self._should_batch(self.data, op = 'merge_database'):
+                idx = self._dedup_indices_batch(self.data)
+            else:
+                idx = self._dedup_indices_full(self.data)
+            if idx:
+                self.data.drop(idx, axis = 0, inplace = True)
+                self.data = self.data.reset_index(drop = True)
+            self.__make_bib(verbose = True)
         size       = self.data.shape[0]
-        self.__make_bib(verbose = True)
         dt         = self.data['document_type'].value_counts()
         dt         = dt.sort_index(axis = 0)
         self.vb    = []
@@ -1792,6 +1932,317 @@ class pbx_probe():
         print('############################################################################')
         return
 
+    # Helper: persistent state behind incremental merges. Built once from
+    # the current __make_bib outputs and then kept in step by
+    # __merge_incremental; any full __make_bib drops it.
+    def _merge_state_get(self):
+        state = getattr(self, '_merge_state', None)
+        if (state is not None and state['rows'] == self.data.shape[0]):
+            return state
+        doi_keys, title_keys = self._build_dedup_keys_chunk(self.data)
+        counts               = {
+                                'kid': Counter(dict(zip(self.u_kid, self.kid_count))),
+                                'auk': Counter(dict(zip(self.u_auk, self.auk_count))),
+                                'jou': Counter(dict(zip(self.u_jou, self.jou_count))),
+                                'lan': Counter(dict(zip(self.u_lan, self.lan_count))),
+                                'ctr': Counter(dict(zip(self.u_ctr, self.ctr_count))),
+                                'uni': Counter(dict(zip(self.u_uni, self.uni_count))),
+                               }
+        cits                 = {
+                                'aut': Counter(dict(zip(self.u_aut, self.aut_cit))),
+                                'jou': Counter(dict(zip(self.u_jou, self.jou_cit))),
+                                'ctr': Counter(dict(zip(self.u_ctr, self.ctr_cit))),
+                                'uni': Counter(dict(zip(self.u_uni, self.uni_cit))),
+                               }
+        collab               = Counter()
+        for i in range(0, len(self.aut)):
+            collab[(str(int(self.dy[i])), 'n = ' + str(len(self.aut[i])))] += 1
+        doc_keys             = list(self._reference_match_keys(self.data)) if self.data.shape[0] > 0 else []
+        state                = {
+                                'rows':         self.data.shape[0],
+                                'seen_doi':     {doi for doi in doi_keys if doi != 'UNKNOWN'},
+                                'seen_title':   set(title_keys),
+                                'counts':       counts,
+                                'cits':         cits,
+                                'docs':         Counter(dict(zip(self.u_aut, self.doc_aut))),
+                                'collab':       collab,
+                                'ref_keys':     set(self.u_ref),
+                                'aut_keys':     set(self.u_aut),
+                                'ctr_keys':     set(self.u_ctr),
+                                'uni_keys':     set(self.u_uni),
+                                'years':        Counter(self.dy.dropna().tolist()),
+                                'cit_sum':      sum(self.citation),
+                                'ref_year':     dict(zip(self.u_ref, self.__get_ref_year())),
+                                'ref_year_end': self.date_end,
+                                'doc_keys':     doc_keys,
+                                'doc_match':    ReferenceResolver(self.u_ref).match(doc_keys),
+                               }
+        self._merge_state = state
+        return state
+
+    # Function: Merge Database (incremental)
+    def __merge_incremental(self, data):
+        """Append ``data`` and update the __make_bib outputs in place.
+
+        ``data`` is deduplicated against the persistent DOI / title key
+        sets of the collection and only the added rows are parsed. The
+        Counter aggregates, author_to_papers, the per-author indices of
+        the authors in the added rows and the reference vocabulary are
+        then updated from those rows. Unique lists are re-derived from the
+        counters, so they keep the order of a full rebuild (countries and
+        institutions use the sorted order of the batch path).
+        """
+        state                = self._merge_state_get()
+        # The author indices and citation splits are updated from their
+        # current values below, so they must exist before rows are added.
+        self._materialize_derived('aut_h', 't_c')
+        data                 = data.reset_index(drop = True)
+        doi_keys, title_keys = self._build_dedup_keys_chunk(data)
+        keep                 = []
+        for i in range(0, data.shape[0]):
+            doi, title = doi_keys[i], title_keys[i]
+            if ((doi != 'UNKNOWN' and doi in state['seen_doi']) or title in state['seen_title']):
+                continue
+            if (doi != 'UNKNOWN'):
+                state['seen_doi'].add(doi)
+            state['seen_title'].add(title)
+            keep.append(i)
+        data                 = data.iloc[keep].reset_index(drop = True)
+        if (data.empty):
+            return
+        offset               = self.data.shape[0]
+        n                    = data.shape[0]
+        data['year']         = data['year'].replace('UNKNOWN', '0')
+        columns              = list(self.data.columns)
+        self.data            = pd.concat([self.data, data]).reset_index(drop = True)
+        if (list(self.data.columns) != columns or len(columns) != len(data.columns)):
+            self.data = self.data.fillna('UNKNOWN')
+        # The added rows are parsed as they sit in the merged frame, so
+        # columns only one of the exports has read 'UNKNOWN' in the other.
+        data                 = self.data.iloc[offset:].reset_index(drop = True)
+
+        # ---- Parse the added rows only ----
+        years        = pd.to_numeric(data['year'], errors = 'coerce', downcast = 'float')
+        cits         = self._parse_citation_series_chunk(data['note'])
+        rows         = {}
+        rows['ref'], _ = self._split_multivalue_series_chunk(data['references'],          sep = ';',     lower = False, is_reference = True)
+        rows['aut'], _ = self._split_multivalue_series_chunk(data['author'],              sep = ' and ', lower = True)
+        rows['kid'], _ = self._split_multivalue_series_chunk(data['keywords'],            sep = ';',     lower = True)
+        rows['auk'], _ = self._split_multivalue_series_chunk(data['author_keywords'],     sep = ';',     lower = True)
+        rows['jou'], _ = self._split_multivalue_series_chunk(data['abbrev_source_title'], sep = ';',     lower = True)
+        rows['lan'], _ = self._split_multivalue_series_chunk(data['language'],            sep = '.',     lower = True)
+        batch          = self._should_batch(self.data, op = 'make_bib')
+        ctr_raw, ctr_u, ctr_pairs, uni_raw, uni_u, uni_pairs = self.__merge_entities(data, rows['aut'], offset, batch)
+        rows['ctr']    = self.replace_unknowns(ctr_raw)
+        rows['uni']    = self.replace_unknowns(uni_raw)
+        new_refs       = sorted({ref for row in rows['ref'] for ref in row if ref not in state['ref_keys'] and ref.lower() != 'unknown'})
+        store          = self._entity_store()
+        for name, new_rows in rows.items():
+            setattr(self, name, store.extend(name, new_rows))
+        # The batch path counts countries / institutions before
+        # replace_unknowns, the small path after it.
+        counted        = dict(rows, ctr = ctr_raw, uni = uni_raw) if batch else rows
+        for name, counter in state['counts'].items():
+            for row in counted[name]:
+                counter.update(row)
+        for k in range(0, n):
+            for name, counter in state['cits'].items():
+                for item in set(counted[name][k]):
+                    counter[item] += cits[k]
+            state['docs'].update(set(rows['aut'][k]))
+            state['aut_keys'].update(rows['aut'][k])
+        state['ref_keys'].update(new_refs)
+        state['ctr_keys'].update(ctr_u)
+        state['uni_keys'].update(uni_u)
+
+        # ---- Years and citations ----
+        self.dy         = pd.concat([self.dy, years.astype(self.dy.dtype)], ignore_index = True)
+        state['years'].update(years.dropna().tolist())
+        self.date_str   = int(min(state['years'])) if state['years'] else 0
+        self.date_end   = int(max(state['years'])) if state['years'] else 0
+        doc_types       = data['document_type'].value_counts()
+        self.doc_types  = self.doc_types.add(doc_types, fill_value = 0).astype('int64').sort_index()
+        self.doc_types.index.name = 'document_type'
+        self.doc_types.name       = 'count'
+        year_counts     = pd.Series([state['years'][year] for year in sorted(state['years'])], dtype = 'int64')
+        self.av_d_year  = round(year_counts.mean(), 2) if len(year_counts) > 0 else 0
+        self.citation   = list(self.citation) + cits
+        state['cit_sum'] = state['cit_sum'] + sum(cits)
+        self.av_c_doc   = round(state['cit_sum']/self.data.shape[0], 2) if self.data.shape[0] > 0 else 0
+
+        # ---- Authors ----
+        old_index       = {author: i for i, author in enumerate(self.u_aut)}
+        old_values      = (self.aut_h, self.aut_g, self.aut_e, self.aut_j, self.t_c, self.s_c)
+        for k, authors in enumerate(rows['aut']):
+            for author in authors:
+                self.author_to_papers[author].append(offset + k)
+        self.u_aut      = sorted(state['aut_keys'])
+        affected        = {author for authors in rows['aut'] for author in authors}
+        fresh           = self.__author_impact([author for author in self.u_aut if author in affected or author not in old_index])
+        columns         = [[], [], [], [], [], []]
+        for author in self.u_aut:
+            if (author in fresh):
+                values = fresh[author]
+            else:
+                values = [column[old_index[author]] for column in old_values]
+            for column, value in zip(columns, values):
+                column.append(value)
+        self.aut_h, self.aut_g, self.aut_e, self.aut_j, self.t_c, self.s_c = columns
+        self.r_c        = [self.s_c[i]/max(self.t_c[i], 1) for i in range(0, len(self.t_c))]
+        new_docs        = [len(item) for item in rows['aut']]
+        self.aut_docs   = list(self.aut_docs) + new_docs
+        self.aut_single = self.aut_single + len([item for item in new_docs if item == 1])
+        self.aut_multi  = list(self.aut_multi) + [item for item in new_docs if item > 1]
+        self.aut_cit    = [state['cits']['aut'][a] for a in self.u_aut]
+        self.doc_aut    = [state['docs'][a]        for a in self.u_aut]
+        self.av_doc_aut = round(sum(self.doc_aut)/len(self.doc_aut), 2) if len(self.doc_aut) > 0 else 0
+
+        # ---- Keywords, sources, languages, countries, institutions ----
+        counts                     = state['counts']
+        self.u_kid, self.kid_count = self._filter_list_from_counter(sorted(counts['kid'].keys()), counts['kid'], simple = False)
+        self.u_auk, self.auk_count = self._filter_list_from_counter(sorted(counts['auk'].keys()), counts['auk'], simple = False)
+        self.u_jou, self.jou_count = self._filter_list_from_counter(sorted(counts['jou'].keys()), counts['jou'], simple = False)
+        self.jou_cit               = [state['cits']['jou'][j] for j in self.u_jou]
+        self.u_lan, self.lan_count = self._filter_list_from_counter(sorted(counts['lan'].keys()), counts['lan'], simple = True)
+        self.u_ctr, self.ctr_count = self._filter_list_from_counter(sorted(state['ctr_keys']), counts['ctr'], simple = True)
+        self.ctr_cit               = [state['cits']['ctr'][c] for c in self.u_ctr]
+        self.u_uni, self.uni_count = self._filter_list_from_counter(sorted(state['uni_keys']), counts['uni'], simple = True)
+        self.uni_cit               = [state['cits']['uni'][u] for u in self.u_uni]
+        self.__merge_side_maps(data, rows['aut'], ctr_pairs, uni_pairs)
+
+        # ---- Collaboration table ----
+        for k in range(0, n):
+            state['collab'][(str(int(years.iloc[k])), 'n = ' + str(new_docs[k]))] += 1
+        self.dy_c_year = self.__collaboration_table(state['collab'])
+
+        # ---- Reference vocabulary and reference IDs ----
+        self.u_ref   = sorted(list(self.u_ref) + new_refs)
+        if (state['ref_year_end'] != self.date_end):
+            state['ref_year']     = dict(zip(self.u_ref, self.__get_ref_year()))
+            state['ref_year_end'] = self.date_end
+        else:
+            state['ref_year'].update(zip(new_refs, self.__get_ref_year(new_refs)))
+        doc_match    = state['doc_match']
+        if (len(new_refs) > 0):
+            for i, match in enumerate(ReferenceResolver(new_refs).match(state['doc_keys'])):
+                if (match is not None and (doc_match[i] is None or match < doc_match[i])):
+                    doc_match[i] = match
+        new_keys     = list(self._reference_match_keys(data))
+        state['doc_keys'].extend(new_keys)
+        doc_match.extend(ReferenceResolver(self.u_ref).match(new_keys))
+        ref_index     = {ref: j for j, ref in enumerate(self.u_ref)}
+        self.dy_ref   = [state['ref_year'][ref] for ref in self.u_ref]
+        self.u_ref_id = ['r_' + str(j) for j in range(0, len(self.u_ref))]
+        owner         = {}
+        for i, match in enumerate(doc_match):
+            if (match is not None):
+                owner[match] = i
+        for match, i in owner.items():
+            j                = ref_index[match]
+            self.u_ref_id[j] = str(i)
+            self.dy_ref[j]   = int(self.dy[i])
+        ref_map       = dict(zip(self.u_ref, self.u_ref_id))
+        self.ref_id   = store.set('ref_id', [[ref_map.get(ref, ref) for ref in ref_list] for ref_list in self.ref])
+
+        # ---- Lookup tables and cached analyses ----
+        if ('table_id_doc' in self.__dict__):
+            doc_list          = [str(i) for i in range(offset, offset + n)]
+            docs              = [str(data.iloc[i]['author'])+' ('+str(data.iloc[i]['year'])+'). '+str(data.iloc[i]['title'])+'. '+str(data.iloc[i]['journal'])+'. doi:'+str(data.iloc[i]['doi'])+'. ' for i in range(0, n)]
+            self.table_id_doc = pd.concat([self.table_id_doc, pd.DataFrame(zip(doc_list, docs), columns = ['ID', 'Document'])], ignore_index = True)
+            self.dict_id_doc.update(zip(doc_list, docs))
+        self._invalidate_derived('table_id_aut', 'table_id_jou', 'table_id_uni', 'table_id_ctr', 'table_id_kwa', 'table_id_kwp')
+        for name in ('ask_gpt_ap', 'ask_gpt_cp', 'ask_gpt_ip', 'ask_gpt_sp', 'ask_gpt_bp', 'ask_gpt_ct', 'ask_gpt_ep', 'ask_gpt_ng', 'ask_gpt_rt', 'ask_gpt_sk', 'ask_gpt_wd', 'top_y_x', 'heat_y_x', 'top_refs', 'rpys_pk', 'rpys_rs', 'top_co_c'):
+            setattr(self, name, -1)
+        if hasattr(self, '_internal_reference_doc_ids_cache'):
+            del self._internal_reference_doc_ids_cache
+        state['rows'] = self.data.shape[0]
+        return
+
+    # Helper: h, g, e, j, total and self citations of ``authors``, by
+    # author. The indices come from impact_indices over the authors'
+    # papers, as h_index/g_index/e_index/j_index compute them.
+    def __author_impact(self, authors):
+        papers = [self.author_to_papers.get(author, []) for author in authors]
+        owner  = [k for k, rows in enumerate(papers) for _ in rows]
+        docs   = [i for rows in papers for i in rows]
+        table  = impact_indices(owner, docs, self.citation, len(authors))
+        h, g   = table['h'].tolist(), table['g'].tolist()
+        e, j   = list(table['e']), table['j'].tolist()
+        values = {}
+        for k, author in enumerate(authors):
+            t_c            = sum(self.citation[i] for i in papers[k])
+            author_lower   = author.lower()
+            s_c            = sum(1 for i in papers[k] for ref in self.ref[i] if author_lower in ref.lower())
+            values[author] = (h[k], g[k], e[k], j[k], t_c, s_c)
+        return values
+
+    # Helper: countries and institutions of the rows appended at ``offset``
+    # (``data`` holds them with the merged frame's columns). Uses the
+    # extractor a full __make_bib of the merged data would use (chunk
+    # extractors on the batch path, __get_countries and
+    # __get_institutions on a shallow copy holding only the new rows
+    # otherwise). Returns raw rows, unique values and (author, row, value)
+    # entries for the side maps, for countries and then institutions.
+    def __merge_entities(self, data, aut_rows, offset, batch):
+        if (batch):
+            ctr_raw, ctr_u = self._extract_countries_chunk(data, aut_rows, offset)
+            uni_raw, uni_u = self._extract_institutions_chunk(data, aut_rows, offset)
+            ctr_pairs      = []
+            uni_pairs      = []
+            for k in range(0, len(aut_rows)):
+                seen = set()
+                for author, country in zip(aut_rows[k], ctr_raw[k]):
+                    if (author not in seen):
+                        seen.add(author)
+                        ctr_pairs.append((author, offset + k, country))
+                for author, inst in zip(aut_rows[k], uni_raw[k]):
+                    uni_pairs.append((author, offset + k, inst))
+            return ctr_raw, ctr_u, ctr_pairs, uni_raw, uni_u, uni_pairs
+        part       = copy.copy(self)
+        part.data  = data
+        part.aut   = aut_rows
+        part.u_aut = sorted({author for authors in aut_rows for author in authors})
+        ctr_raw, ctr_u = part.__get_countries()
+        uni_raw, uni_u = part.__get_institutions()
+        ctr_pairs  = [(author, offset + row, value) for author, entries in part.author_country_map.items() for row, value in entries]
+        # __get_institutions only records 'UNKNOWN' for an author's first
+        # row when the author has no entry yet; drop it for known authors.
+        uni_pairs  = []
+        for author, entries in part.author_inst_map.items():
+            first = min(row for row, _ in entries) if entries else None
+            for row, value in entries:
+                if (value == 'UNKNOWN' and row == first and self.author_inst_map.get(author)):
+                    continue
+                uni_pairs.append((author, offset + row, value))
+        return ctr_raw, ctr_u, ctr_pairs, uni_raw, uni_u, uni_pairs
+
+    # Helper: extend the author -> (row, country/institution) maps and the
+    # corresponding/first author views with the rows appended at ``offset``
+    def __merge_side_maps(self, data, aut_rows, ctr_pairs, uni_pairs):
+        for author, row, country in ctr_pairs:
+            self.author_country_map.setdefault(author, []).append((row, country))
+        for author, row, inst in uni_pairs:
+            entries = self.author_inst_map.setdefault(author, [])
+            if ((row, inst) not in entries):
+                entries.append((row, inst))
+        self.author_country_map = {a: self.author_country_map.get(a, []) for a in self.u_aut}
+        self.author_inst_map    = {a: self.author_inst_map.get(a, [])    for a in self.u_aut}
+        for k in range(0, len(aut_rows)):
+            authors = aut_rows[k]
+            row     = data.iloc[k]
+            ca_ctr  = self._corresponding_author(row, authors, exact = True)
+            ca_inst = self._corresponding_author(row, authors)
+            if (ca_ctr and ca_ctr in self.author_country_map):
+                self.corr_a_country_map[ca_ctr] = self.author_country_map[ca_ctr]
+            if (ca_inst and ca_inst in self.author_inst_map):
+                self.corr_a_inst_map[ca_inst] = self.author_inst_map[ca_inst]
+            if (authors):
+                if (authors[0] in self.author_country_map):
+                    self.frst_a_country_map[authors[0]] = self.author_country_map[authors[0]]
+                if (authors[0] in self.author_inst_map):
+                    self.frst_a_inst_map[authors[0]] = self.author_inst_map[authors[0]]
+        return
+
     # Helper: build (doi_key, title_key) for a chunk. The keys preserve
     # the small-path semantics: cleaned title using clear_text with
     # the same arguments, and DOI as-is.
@@ -1857,22 +2308,31 @@ class pbx_probe():
         return rows_to_drop
 
     # Function: Save Working Database
-    def save_database(self, sep = '\t', name = 'data.csv'):
-        self.data.to_csv(name, index = False, sep = sep)
+    def save_database(self, sep = '\t', name = 'data.csv', file_format = None):
+        from .cache import database_format, write_database
+        write_database(self.data, name, file_format = database_format(name, file_format), sep = sep)
         return
     
     # Function: Load Working Database
-    def load_database(self, name = 'data.csv', sep = None):
-        kwargs = {'dtype': str}
-        if (sep is not None):
-            kwargs['sep'] = sep
-        else:
-            kwargs['sep'] = None
-            kwargs['engine'] = 'python'
-        data = pd.read_csv(name, **kwargs)
+    def load_database(self, name = 'data.csv', sep = None, columns = None, file_format = None):
+        from .cache import database_format, read_database
+        data = read_database(name, file_format = database_format(name, file_format), sep = sep, columns = columns)
         self.load_database_df(data)
         return
 
+    # Function: Save Derived State (binary snapshot of data + __make_bib outputs)
+    def save_state(self, path):
+        from .state import save_state
+        return save_state(self, path)
+
+    # Function: Load Derived State (memory-mapped, nothing is recomputed)
+    def load_state(self, path, mmap = True):
+        from .state import load_state
+        self._invalidate_derived()
+        load_state(self, path, mmap = mmap)
+        self._build_entity_store()
+        return
+
     # Function: Load Working Database from DataFrame (in memory)
     def load_database_df(self, data):
         if (getattr(self, 'database', '').lower() == 'openalex'):
@@ -2040,6 +2500,47 @@ class pbx_probe():
         self.__make_bib(verbose = False)
         return
 
+    # Function: Canonical References. Collapses the variants of one cited
+    # work (author format, abbreviated source, with or without DOI) onto
+    # its most cited variant and keeps the variant -> canonical map in
+    # ref_variants. Stays on for later rebuilds of the database.
+    def canonicalize_references(self, verbose = True):
+        self.canonical_refs = True
+        before              = len(self.u_ref)
+        self.__canonicalize_references()
+        if (verbose == True):
+            print('A Total of ' + str(before - len(self.u_ref)) + ' Reference Variants were Merged ( ' + str(len(self.u_ref)) + ' Unique References )')
+        return self.ref_variants
+
+    # Helper: rewrite ref / u_ref through canonical_reference_map. A work
+    # cited by one document under two variants is counted once.
+    def __canonicalize_references(self):
+        counts  = Counter(ref for refs in self.ref for ref in refs)
+        mapping = canonical_reference_map(self.u_ref, counts)
+        self.ref_variants.update(mapping)
+        for variant, canonical in self.ref_variants.items():
+            self.ref_variants[variant] = mapping.get(canonical, canonical)
+        if (len(mapping) == 0):
+            return
+        merged = set(mapping.values())
+        rows   = []
+        for refs in self.ref:
+            row  = []
+            seen = set()
+            for ref in refs:
+                ref = mapping.get(ref, ref)
+                if (ref in merged):
+                    if (ref in seen):
+                        continue
+                    seen.add(ref)
+                row.append(ref)
+            rows.append(row)
+        self.ref          = rows
+        self.u_ref        = [ref for ref in self.u_ref if ref not in mapping]
+        self._merge_state = None
+        self._invalidate_derived('ref', 'u_ref')
+        return
+
     # Function: Replace Keyword Plus
     def replace_keyword_plus(self, replace_all, edit = True):
         if edit:
@@ -2130,333 +2631,81 @@ class pbx_probe():
 
     # Function: Read .bib File
     def __read_bib(self, bib, db = 'scopus', del_duplicated = True):
-        
-        #----------------------------------------------------------------------
-
-        def read_text_file_with_fallback(path, encodings = None):
-            encodings = encodings or ['utf-8', 'utf-8-sig', 'cp1252', 'latin-1']
-            last_error = None
-            for encoding in encodings:
-                try:
-                    with open(path, 'r', encoding = encoding) as f_file:
-                        return f_file.read(), encoding
-                except UnicodeDecodeError as exc:
-                    last_error = exc
-            with open(path, 'rb') as f_file:
-                raw_bytes = f_file.read()
-            guess = chardet.detect(raw_bytes).get('encoding') or 'latin-1'
-            try:
-                return raw_bytes.decode(guess), guess
-            except Exception:
-                if last_error is not None:
-                    raise last_error
-                return raw_bytes.decode('latin-1', errors = 'replace'), 'latin-1'
-        
-        def assign_authors_to_affiliations(authors_str, affiliations_str):
-            authors          = [a.strip() for a in authors_str.split(' and ')]
-            affiliations     = [a.strip() for a in affiliations_str.split(';')]
-            new_affiliations = []
-            for i, aff in enumerate(affiliations):
-                if i < len(authors):
-                    new_affiliations.append(f"{authors[i]} {aff}")
-                else:
-                    new_affiliations.append(aff)
-            return '; '.join(new_affiliations)
-        
-        def get_corresponding_authors_and_affiliations(corr_address):
-            if not isinstance(corr_address, str):
-                return [], []
-            match = re.search(r'Corresponding Author\s+([^;]+);([^;]+)', corr_address, re.IGNORECASE)
-            if not match:
-                return [], []
-            authors_part      = match.group(1).strip()
-            affiliations_part = match.group(2).strip()
-            authors           = [a for a in re.split(r'\s+and\s+|;', authors_part)]
-            affiliations      = [affiliations_part]
-            return authors, affiliations
-        
-        def map_authors_to_affiliations(row):
-            authors_str             = row['author']
-            affiliations_str        = row['affiliation']
-            correspondence_address1 = row['correspondence_address1']
-            if isinstance(authors_str, str):
-                authors = [a for a in re.split(r'\s+and\s+|;', authors_str)]
-            else:
-                authors = []
-            if isinstance(affiliations_str, str):
-                affiliations = [a.strip() for a in affiliations_str.split(';')]
-            else:
-                affiliations = []
-            ca_authors, ca_affiliations = get_corresponding_authors_and_affiliations(correspondence_address1)
-            new_affiliations            = []
-            for ca_author, ca_aff in zip(ca_authors, ca_affiliations):
-                new_affiliations.append(f"{ca_author} {ca_aff}")
-            for ca_aff in ca_affiliations:
-                affiliations = [aff for aff in affiliations if ca_aff.lower() not in aff.lower()]
-            remaining_authors = [a for a in authors if a not in ca_authors]
-            for i, author in enumerate(remaining_authors):
-                if i < len(affiliations):
-                    aff = affiliations[i]
-                    new_affiliations.append(f"{author} {aff}")
-            transformed_affiliation = '; '.join(new_affiliations)
-            return transformed_affiliation
-
-        #----------------------------------------------------------------------
-        
         self.vb        = []
         db             = db.lower()
         file_extension = os.path.splitext(bib)[1].lower()
-        f_list         = []
         if  (db == 'scopus' and file_extension == '.csv'):
-            #data         = pd.read_csv(bib, encoding = 'utf8', dtype = str)
-            try:
-                data = pd.read_csv(bib, encoding = 'utf8', dtype = str)
-            except UnicodeDecodeError:
-                data = pd.read_csv(bib, encoding = 'cp1252', dtype = str)
-            data.columns = data.columns.str.lower()
-            if ('abbrev_source_title' not in data.columns and 'abbreviated source title' in data.columns):
-                data.rename(columns = {'abbreviated source title': 'abbrev_source_title'}, inplace = True)
-            if ('abbrev_source_title' not in data.columns and 'journal' in data.columns):
-                data.rename(columns = {'journal': 'abbrev_source_title'}, inplace = True)
-            if ('document_type' not in data.columns and 'document type' in data.columns):
-                data.rename(columns = {'document type': 'document_type'}, inplace = True)
-            if ('art_number.' not in data.columns and 'art. no.' in data.columns):
-                data.rename(columns = {'art. no.': 'art_number'}, inplace = True)
-            if ('author_keywords' not in data.columns and 'author keywords' in data.columns):
-                data.rename(columns = {'author keywords': 'author_keywords'}, inplace = True)
-            if ('author' not in data.columns and 'authors' in data.columns):
-                data.rename(columns = {'authors': 'author'}, inplace = True)
-            if ('chemicals_cas' not in data.columns and r'chemicals/cas' in data.columns):
-                data.rename(columns = {r'chemicals/cas': 'chemicals_cas'}, inplace = True)
-            if ('correspondence_address' not in data.columns and 'correspondence address' in data.columns):
-                data.rename(columns = {'correspondence address': 'correspondence_address'}, inplace = True)
-            if ('editor' not in data.columns and 'editors' in data.columns):
-                data.rename(columns = {'editors': 'editor'}, inplace = True)
-            if ('funding_details' not in data.columns and 'funding details' in data.columns):
-                data.rename(columns = {'funding details': 'funding_details'}, inplace = True)
-            if ('keywords' not in data.columns and 'index keywords' in data.columns):
-                data.rename(columns = {'index keywords': 'keywords'}, inplace = True)
-            if ('language' not in data.columns and 'language of original document' in data.columns):
-                data.rename(columns = {'language of original document': 'language'}, inplace = True)
-            if ('note' not in data.columns and 'cited by' in data.columns):
-                data.rename(columns = {'cited by': 'note'}, inplace = True)
-            if ('page_count' not in data.columns and 'page count' in data.columns):
-                data.rename(columns = {'page count': 'page_count'}, inplace = True)
-            if ('pubmed_id' not in data.columns and 'pubmed id' in data.columns):
-                data.rename(columns = {'pubmed id': 'pubmed_id'}, inplace = True)
-            sanity_check = ['abbrev_source_title', 'abstract', 'address', 'affiliation', 'art_number',
-                            'author', 'author_keywords', 'chemicals_cas', 'coden',      
-                            'correspondence_address1', 'document_type', 'doi', 'editor', 'funding_details',
-                            'funding_text\xa01', 'funding_text\xa02', 'funding_text\xa03', 'isbn', 'issn',
-                            'journal', 'keywords', 'language', 'note', 'number', 'page_count', 'pages',
-                            'publisher', 'pubmed_id', 'references', 'source', 'sponsors', 'title',
-                            'tradenames', 'url', 'volume', 'year']
-            for col in sanity_check:
-                if (col not in data.columns):
-                    data[col] = 'UNKNOWN'
-            data           = data.reindex(sorted(data.columns), axis = 1)
-            data['author'] = data['author'].apply(lambda x: x.replace(';', ' and ') if isinstance(x, str) else x)
-            doc           = data.shape[0]
+            chunk_size = self._get_chunk_size('make_bib')
+            data       = read_scopus_csv_frame(bib, chunk_size = chunk_size)
+            doc        = data.shape[0]
         else:
-            f_lines, _ = read_text_file_with_fallback(bib)
-            f_list     = f_lines.split('\n')
-            if (db == 'wos'):
-                f_list_ = []
-                for i in range(0, len(f_list)):
-                    if (f_list[i][:3] != '   '):
-                        f_list_.append(f_list[i])
-                    else:
-                        if (f_list_[-1].find('Cited-References') != -1):
-                            f_list[i] = f_list[i].replace(';', ',')
-                        if (f_list_[-1].find('Cited-References') == -1):
-                            f_list_[-1] = f_list_[-1] + f_list[i]
-                        else:
-                            f_list[i]   = f_list[i].replace(';', ',')
-                            f_list_[-1] = f_list_[-1] + ';' + f_list[i]
-                f_list = f_list_
-            if (db == 'pubmed'):
-                f_list_ = []
-                for i in range(0, len(f_list)):
-                    if (i == 0 and f_list[i][:6] != '      ' ):
-                        f_list_.append(f_list[i])
-                    elif (i > 0 and f_list[i][:6] != '      ' and f_list[i][:6] != f_list[i-1][:6] and (f_list[i][:6].lower() != 'fau - ' and f_list[i][:6].lower() != 'au  - ' and f_list[i][:6].lower() != 'auid- ' and f_list[i][:6].lower() != 'ad  - ')):
-                        f_list_.append(f_list[i])
-                    elif (i > 0 and f_list[i][:6] != '      ' and f_list[i][:6] == f_list[i-1][:6] and (f_list[i][:6].lower() != 'fau - ' and f_list[i][:6].lower() != 'au  - ' and f_list[i][:6].lower() != 'auid- ' and f_list[i][:6].lower() != 'ad  - ' and f_list[i][:6].lower() != 'pt  - ')):
-                        f_list_[-1] = f_list_[-1] + '; ' + f_list[i][6:]
-                    elif (f_list[i][:6] == '      '):
-                        f_list_[-1] = f_list_[-1] + f_list[i][6:]
-                    elif (f_list[i][:6] == 'FAU - '):
-                        f_list_.append(f_list[i])
-                        j = i + 1
-                        while (len(f_list[j]) != 0):
-                            j = j + 1
-                            if (f_list[j][:6].lower() == 'fau - '):
-                                f_list_[-1] = f_list_[-1] + '; ' + f_list[j][6:]
-                                f_list[j]   = f_list[j][:6].lower() + f_list[j][6:]
-                    elif (f_list[i][:6] == 'AU  - '):
-                        f_list_.append(f_list[i])
-                        j = i + 1
-                        while (len(f_list[j]) != 0):
-                            j = j + 1
-                            if (f_list[j][:6].lower() == 'au  - '):
-                                f_list_[-1] = f_list_[-1] + ' and ' + f_list[j][6:]
-                                f_list[j]   = f_list[j][:6].lower() + f_list[j][6:]
-                    elif (f_list[i][:6] == 'AUID- '):
-                        f_list_.append(f_list[i])
-                        j = i + 1
-                        while (len(f_list[j]) != 0):
-                            j = j + 1
-                            if (f_list[j][:6].lower() == 'auid- '):
-                                f_list_[-1] = f_list_[-1] + '; ' + f_list[j][6:]
-                                f_list[j]   = f_list[j][:6].lower() + f_list[j][6:]
-                    elif (f_list[i][:6] == 'AD  - '):
-                        f_list_.append(f_list[i])
-                        j = i + 1
-                        while (len(f_list[j]) != 0):
-                            j = j + 1
-                            if (f_list[j][:6].lower() == 'ad  - '):
-                                f_list_[-1] = f_list_[-1] + f_list[j][6:]
-                                f_list[j]   = f_list[j][:6].lower() + f_list[j][6:]
-                    elif (f_list[i][:6] == 'PT  - '):
-                        f_list_.append(f_list[i])
-                        j = i + 1
-                        while (len(f_list[j]) != 0):
-                            j = j + 1
-                            if (f_list[j][:6].lower() == 'pt  - '):
-                                f_list[j] = f_list[j][:6].lower() + f_list[j][6:]
-                f_list = [item for item in f_list_]
-                for i in range(0, len(f_list)):
-                    if (len(f_list[i]) > 0):
-                        if (f_list[i][4] == '-'):
-                            f_list[i] = f_list[i][:4] + '=' + f_list[i][5:]
-                        if (f_list[i][:3] == 'LID'):
-                            f_list[i] = f_list[i].replace(' [doi]', '')
-            lhs = []
-            rhs = []
-            doc = 0
-            for i in range(0, len(f_list)):
-              if (f_list[i].find('@') == 0 or f_list[i][:4].lower() == 'pmid'):  
-                lhs.append('doc_start')
-                rhs.append('doc_start')
-                if (db == 'pubmed'):
-                    lhs.append('note')
-                    rhs.append('0')
-                    lhs.append('source')
-                    rhs.append('PubMed')
-                if (db == 'wos'):
-                    lhs.append('source')
-                    rhs.append('WoS')
-                doc = doc + 1
-              if ( (f_list[i].find('=') != -1 and f_list[i].find(' ') != 0) or (f_list[i].find('=') != -1 and f_list[i].find('=') == 15) ): # DBLP
-                lhs.append(f_list[i].split('=')[0].lower().strip())
-                rhs.append(f_list[i].split('=')[1].replace('{', '').replace('},', '').replace('}', '').replace('}},', '').strip())
-              elif (f_list[i].find(' ') == 0 and i!= 0 and rhs[-1] != 'doc_start'):
-                rhs[-1] = rhs[-1]+' '+f_list[i].replace('{', '').replace('},', '').replace('}', '').replace('}},', '').strip()
-            if (db == 'scopus' and 'abbrev_source_title' not in lhs and 'journal' in lhs):
-                for i in range(0, len(lhs)):
-                    if (lhs[i] == 'journal'):
-                        lhs[i] = 'abbrev_source_title'
-            if (db == 'scopus'):
-                for i in range(0, len(lhs)):
-                    if (lhs[i] == 'type'):
-                        lhs[i] = 'document_type'
-            if (db == 'wos' and 'journal-iso' not in lhs and 'journal' in lhs):
-                for i in range(0, len(lhs)):
-                    if (lhs[i] == 'journal'):
-                        lhs[i] = 'journal-iso'
-            if (db == 'pubmed' and 'ta' not in lhs and 'jt' in lhs):
-                for i in range(0, len(lhs)):
-                    if (lhs[i] == 'jt'):
-                        lhs[i] = 'ta'
-            if (db == 'wos'):
-                for i in range(0, len(lhs)):
-                    if (lhs[i] == 'affiliation'):
-                        lhs[i] = 'affiliation_'
-                    if (lhs[i] == 'affiliations'):
-                        lhs[i] = 'affiliation'
-                    if (lhs[i] == 'article-number'):
-                        lhs[i] = 'art_number'
-                    if (lhs[i] == 'cited-references'):
-                        lhs[i] = 'references'
-                    if (lhs[i] == 'keywords'):
-                        lhs[i] = 'author_keywords'
-                    if (lhs[i] == 'journal-iso'):
-                        lhs[i] = 'abbrev_source_title'
-                    if (lhs[i] == 'keywords-plus'):
-                        lhs[i] = 'keywords'
-                    if (lhs[i] == 'note'):
-                        lhs[i] = 'note_'
-                    if (lhs[i] == 'times-cited'):
-                        lhs[i] = 'note'
-                    if (lhs[i] == 'type'):
-                        lhs[i] = 'document_type'
-                    lhs[i] = lhs[i].replace('-', '_')
-            if (db == 'pubmed'):
-                for i in range(0, len(lhs)):
-                    if (lhs[i] == 'ab'):
-                        lhs[i] = 'abstract'
-                    if (lhs[i] == 'ad'):
-                        lhs[i] = 'affiliation'
-                    if (lhs[i] == 'au'):
-                        lhs[i] = 'author'
-                    if (lhs[i] == 'auid'):
-                        lhs[i] = 'orcid'
-                    if (lhs[i] == 'fau'):
-                        lhs[i] = 'full_author'
-                    if (lhs[i] == 'lid'):
-                        lhs[i] = 'doi'
-                    if (lhs[i] == 'dp'):
-                        lhs[i] = 'year'
-                        rhs[i] = rhs[i][:4]
-                    if (lhs[i] == 'ed'):
-                        lhs[i] = 'editor'
-                    if (lhs[i] == 'ip'):
-                        lhs[i] = 'issue'
-                    if (lhs[i] == 'is'):
-                        lhs[i] = 'issn'
-                    if (lhs[i] == 'isbn'):
-                        lhs[i] = 'isbn'
-                    if (lhs[i] == 'jt'):
-                        lhs[i] = 'journal'
-                    if (lhs[i] == 'la'):
-                        lhs[i] = 'language'
-                        if (rhs[i] in self.language_names.keys()):
-                            rhs[i] = self.language_names[rhs[i]]
-                    if (lhs[i] == 'mh'):
-                        lhs[i] = 'keywords'
-                    if (lhs[i] == 'ot'):
-                        lhs[i] = 'author_keywords'
-                    if (lhs[i] == 'pg'):
-                        lhs[i] = 'pages'
-                    if (lhs[i] == 'pt'):
-                        lhs[i] = 'document_type'
-                    if (lhs[i] == 'pmid'):
-                        lhs[i] = 'pubmed_id'
-                    if (lhs[i] == 'ta'):
-                        lhs[i] = 'abbrev_source_title'
-                    if (lhs[i] == 'ti'):
-                        lhs[i] = 'title'
-                    if (lhs[i] == 'vi'):
-                        lhs[i] = 'volume'
-            labels       = list(set(lhs))
-            labels.remove('doc_start')
-            sanity_check = ['abbrev_source_title', 'abstract', 'address', 'affiliation', 'art_number', 'author', 'author_keywords', 'chemicals_cas', 'coden', 'correspondence_address1', 'document_type', 'doi', 'editor', 'funding_details', 'funding_text\xa01', 'funding_text\xa02', 'funding_text\xa03', 'isbn', 'issn', 'journal', 'keywords', 'language', 'note', 'number', 'page_count', 'pages', 'publisher', 'pubmed_id', 'references', 'source', 'sponsors', 'title', 'tradenames', 'url', 'volume', 'year']
-            for item in sanity_check:
-                if (item not in labels):
-                    labels.append(item)
-            labels.sort()      
-            values      = [i for i in range(0, len(labels))] 
-            labels_dict = dict(zip(labels, values))
-            data        = pd.DataFrame(index = range(0, doc), columns = labels)
-            count       = -1
-            for i in range(0, len(rhs)):
-              if (lhs[i] == 'doc_start'):
-                count = count + 1
-              else:
-                data.iloc[count, labels_dict[lhs[i]]] = rhs[i]
-        
+            chunk_size = self._get_chunk_size('make_bib')
+            data       = read_bib_frame(bib, db = db, chunk_size = chunk_size, language_names = self.language_names)
+            doc        = data.shape[0]
         entries = list(data.columns)
-        
+        data    = self.__bib_document_types(data, db, entries)
+        if (del_duplicated == True and 'doi' in entries):
+            idx        = self.__bib_duplicates(data, set(), set())
+            data.drop(idx, axis = 0, inplace = True)
+            data       = data.reset_index(drop = True)
+            string_vb  = 'A Total of ' + str(doc-len(idx)) + ' Documents were Found ( ' + str(doc) + ' Documents and '+ str(len(idx)) + ' Duplicates )'
+            self.vb.append(string_vb)
+        else:
+            string_vb  = 'A Total of ' + str(doc) + ' Documents were Found' 
+            self.vb.append(string_vb)
+        if ('document_type' in entries):
+            self.__bib_type_lines(Counter(data['document_type'].replace(np.nan, 'UNKNOWN')))
+        data = self.__bib_normalize(data, db, file_extension)
+        return data, entries
+
+    # Function: Read .bib File as normalized chunks for __make_bib_batch.
+    # Returns (entries, frames); frames is consumed as the chunks are
+    # parsed, duplicates are dropped across chunks and self.vb is
+    # complete once frames is exhausted.
+    def __read_bib_stream(self, bib, db = 'scopus', del_duplicated = True):
+        db              = db.lower()
+        file_extension  = os.path.splitext(bib)[1].lower()
+        chunk_size      = self._get_chunk_size('make_bib')
+        if  (db == 'scopus' and file_extension == '.csv'):
+            entries, frames = stream_scopus_csv_frames(bib, chunk_size = chunk_size)
+        else:
+            entries, frames = stream_bib_frames(bib, db = db, chunk_size = chunk_size, language_names = self.language_names)
+        return entries, self.__normalize_bib_frames(frames, db, file_extension, entries, del_duplicated)
+
+    def __normalize_bib_frames(self, frames, db, file_extension, entries, del_duplicated):
+        self.vb    = []
+        doc        = 0
+        dropped    = 0
+        types      = Counter()
+        seen_doi   = set()
+        seen_title = set()
+        for data in frames:
+            data = self.__bib_document_types(data.reset_index(drop = True), db, entries)
+            doc  = doc + data.shape[0]
+            if (del_duplicated == True and 'doi' in entries):
+                idx     = self.__bib_duplicates(data, seen_doi, seen_title)
+                data    = data.drop(idx, axis = 0).reset_index(drop = True)
+                dropped = dropped + len(idx)
+            if (data.shape[0] == 0):
+                continue
+            types.update(data['document_type'].replace(np.nan, 'UNKNOWN'))
+            yield self.__bib_normalize(data, db, file_extension)
+        if (del_duplicated == True and 'doi' in entries):
+            self.vb.append('A Total of ' + str(doc-dropped) + ' Documents were Found ( ' + str(doc) + ' Documents and '+ str(dropped) + ' Duplicates )')
+        else:
+            self.vb.append('A Total of ' + str(doc) + ' Documents were Found')
+        if ('document_type' in entries):
+            self.__bib_type_lines(types)
+
+    # Helper: document type counts for the verbose report
+    def __bib_type_lines(self, types):
+        self.vb.append('')
+        for tp in sorted(types):
+            self.vb.append(tp + ' = ' + str(types[tp]))
+        return
+
+    # Helper: map WoS / PubMed document types onto the Scopus ones (row-wise)
+    def __bib_document_types(self, data, db, entries):
         # WoS -> Scopus
         data['document_type'] = data['document_type'].replace('Article; Early Access','Article in Press')
         data['document_type'] = data['document_type'].replace('Article; Proceedings Paper','Proceedings Paper')
@@ -2518,36 +2767,82 @@ class pbx_probe():
         data['document_type'] = data['document_type'].replace('Systematic Review','Review')
         data['document_type'] = data['document_type'].replace('Scientific Integrity Review','Review')
         
-        if (del_duplicated == True and 'doi' in entries):
-            duplicated = data['doi'].duplicated()
-            title      = data['title']
-            title      = title.to_list()
-            title      = self.clear_text(title, stop_words  = [], lowercase = True, rmv_accents = True, rmv_special_chars = True, rmv_numbers = True, rmv_custom_words = [])
-            t_dupl     = pd.Series(title).duplicated()
-            for i in range(0, duplicated.shape[0]):
-                if (data.loc[i, 'doi'] == 'UNKNOWN' or pd.isnull(data.loc[i, 'doi'])):
-                    duplicated[i] = False
-                if (t_dupl[i] == True):
-                    duplicated[i] = True
-            idx        = list(duplicated.index[duplicated])
-            data.drop(idx, axis = 0, inplace = True)
-            data       = data.reset_index(drop = True)
-            string_vb  = 'A Total of ' + str(doc-len(idx)) + ' Documents were Found ( ' + str(doc) + ' Documents and '+ str(len(idx)) + ' Duplicates )'
-            self.vb.append(string_vb)
-        else:
-            string_vb  = 'A Total of ' + str(doc) + ' Documents were Found' 
-            self.vb.append(string_vb)
         if (db == 'wos' and 'type' in entries):
             data['document_type'] = data['type']
-        if ('document_type' in entries):
-            types     = list(data['document_type'].replace(np.nan, 'UNKNOWN'))
-            u_types   = list(set(types))
-            u_types.sort()
-            string_vb = ''
-            self.vb.append(string_vb)
-            for tp in u_types:
-                string_vb = tp + ' = ' + str(types.count(tp))
-                self.vb.append(string_vb)
+        return data
+
+    # Helper: index labels of the rows whose DOI or cleaned title was seen
+    # before, in ``data`` or in earlier chunks; ``seen_doi`` and
+    # ``seen_title`` are updated in place. The first occurrence is kept.
+    def __bib_duplicates(self, data, seen_doi, seen_title):
+        title = self.clear_text(data['title'].to_list(), stop_words  = [], lowercase = True, rmv_accents = True, rmv_special_chars = True, rmv_numbers = True, rmv_custom_words = [])
+        idx   = []
+        for i, doi, ttl in zip(data.index, data['doi'], title):
+            known = not (doi == 'UNKNOWN' or pd.isnull(doi))
+            if ((known and doi in seen_doi) or ttl in seen_title):
+                idx.append(i)
+            if (known):
+                seen_doi.add(doi)
+            seen_title.add(ttl)
+        return idx
+
+    # Helper: fill and rewrite the columns of a read frame (row-wise, so
+    # it applies to a whole export or to one of its chunks)
+    def __bib_normalize(self, data, db, file_extension):
+        
+        #----------------------------------------------------------------------
+
+        def assign_authors_to_affiliations(authors_str, affiliations_str):
+            authors          = [a.strip() for a in authors_str.split(' and ')]
+            affiliations     = [a.strip() for a in affiliations_str.split(';')]
+            new_affiliations = []
+            for i, aff in enumerate(affiliations):
+                if i < len(authors):
+                    new_affiliations.append(f"{authors[i]} {aff}")
+                else:
+                    new_affiliations.append(aff)
+            return '; '.join(new_affiliations)
+        
+        def get_corresponding_authors_and_affiliations(corr_address):
+            if not isinstance(corr_address, str):
+                return [], []
+            match = re.search(r'Corresponding Author\s+([^;]+);([^;]+)', corr_address, re.IGNORECASE)
+            if not match:
+                return [], []
+            authors_part      = match.group(1).strip()
+            affiliations_part = match.group(2).strip()
+            authors           = [a for a in re.split(r'\s+and\s+|;', authors_part)]
+            affiliations      = [affiliations_part]
+            return authors, affiliations
+        
+        def map_authors_to_affiliations(row):
+            authors_str             = row['author']
+            affiliations_str        = row['affiliation']
+            correspondence_address1 = row['correspondence_address1']
+            if isinstance(authors_str, str):
+                authors = [a for a in re.split(r'\s+and\s+|;', authors_str)]
+            else:
+                authors = []
+            if isinstance(affiliations_str, str):
+                affiliations = [a.strip() for a in affiliations_str.split(';')]
+            else:
+                affiliations = []
+            ca_authors, ca_affiliations = get_corresponding_authors_and_affiliations(correspondence_address1)
+            new_affiliations            = []
+            for ca_author, ca_aff in zip(ca_authors, ca_affiliations):
+                new_affiliations.append(f"{ca_author} {ca_aff}")
+            for ca_aff in ca_affiliations:
+                affiliations = [aff for aff in affiliations if ca_aff.lower() not in aff.lower()]
+            remaining_authors = [a for a in authors if a not in ca_authors]
+            for i, author in enumerate(remaining_authors):
+                if i < len(affiliations):
+                    aff = affiliations[i]
+                    new_affiliations.append(f"{author} {aff}")
+            transformed_affiliation = '; '.join(new_affiliations)
+            return transformed_affiliation
+
+        #----------------------------------------------------------------------
+        
         data.fillna('UNKNOWN', inplace = True)
         data['keywords']        = data['keywords'].apply(lambda x: x.replace(',',';'))
         data['author_keywords'] = data['author_keywords'].apply(lambda x: x.replace(',',';'))
@@ -2591,8 +2886,101 @@ class pbx_probe():
         if (db == 'scopus' and file_extension == '.bib'):
             data['abbrev_source_title'] = np.where( (data['abbrev_source_title'] == 'UNKNOWN') & (data['journal'] != 'UNKNOWN'), data['journal'], data['abbrev_source_title'] )
         data.replace(["UNKN", "unkn"], "UNKNOWN", inplace = True)
-        return data, entries
+        return data
     
+    # Function: Read .bib File through the optional on-disk cache
+    def __read_bib_cached(self, bib, db = 'scopus', del_duplicated = True, cache_dir = None):
+        if (cache_dir is None):
+            return self.__read_bib(bib, db, del_duplicated)
+        from .cache import export_cache_key, load_export_cache, save_export_cache
+        key    = export_cache_key(bib, db, del_duplicated)
+        cached = load_export_cache(cache_dir, key)
+        if (cached is not None):
+            data, meta = cached
+            self.vb    = list(meta.get('vb', []))
+            return data, list(meta.get('entries', []))
+        data, entries = self.__read_bib(bib, db, del_duplicated)
+        save_export_cache(cache_dir, key, data, entries = entries, vb = self.vb, db = db, source = os.path.abspath(bib))
+        return data, entries
+
+    # Helper: parse one export file inside a worker process. Runs
+    # __read_bib without dedup on a bare instance, so only the attributes
+    # the reader touches are shipped to the worker.
+    @staticmethod
+    def _read_bib_job(job):
+        path, db, language_names, openalex_kwargs, cache_dir = job
+        if (db == 'openalex'):
+            from .openalex import load_openalex_auto
+            data = load_openalex_auto(path, **openalex_kwargs)
+            return data, list(data.columns)
+        probe                = pbx_probe.__new__(pbx_probe)
+        probe.language_names = language_names
+        probe.batch_config   = BatchConfig()
+        data, entries        = probe.__read_bib_cached(path, db, False, cache_dir)
+        return data, entries
+
+    # Function: Read Several Files (process pool, single dedup pass)
+    def __read_bib_many(self, files, db = 'scopus', del_duplicated = True, **kwargs):
+        paths = expand_file_list(files)
+        if (len(paths) == 0):
+            raise ValueError('file_bib did not resolve to any file.')
+        if isinstance(db, (list, tuple)):
+            if (len(db) != len(paths)):
+                raise ValueError(f'db has {len(db)} entries but file_bib resolved to {len(paths)} files.')
+            dbs = [str(item).lower() for item in db]
+        else:
+            dbs = [str(db).lower()] * len(paths)
+        openalex_kwargs = {
+                            'expand_references': kwargs.get('expand_references', False),
+                            'mailto':            kwargs.get('mailto', None),
+                            'max_refs_per_work': kwargs.get('max_refs_per_work', None),
+                            'reference_cache':   kwargs.get('reference_cache', None),
+                          }
+        cache_dir = kwargs.get('cache_dir', getattr(self, 'cache_dir', None))
+        jobs      = [(path, db_i, self.language_names, openalex_kwargs, cache_dir) for path, db_i in zip(paths, dbs)]
+        workers   = kwargs.get('workers', getattr(self.batch_config, 'ingest_workers', None))
+        workers   = resolve_workers(workers, len(jobs))
+        if getattr(self.batch_config, 'verbose', False):
+            print(f'[pybibx batch] __read_bib_many: files={len(jobs)}, workers={workers}')
+        if (workers == 1):
+            results = [pbx_probe._read_bib_job(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                results = list(executor.map(pbx_probe._read_bib_job, jobs))
+        frames  = []
+        entries = []
+        for (data, file_entries), db_i in zip(results, dbs):
+            if (db_i == 'openalex'):
+                data = data.copy(deep = True)
+                for col in ['country', 'CU']:
+                    if col in data.columns:
+                        data[col] = data[col].apply(self._normalize_country_value)
+            frames.append(data)
+            entries.extend([item for item in file_entries if item not in entries])
+        data = pd.concat(frames, axis = 0, ignore_index = True, sort = False)
+        del frames, results
+        data = data.fillna('UNKNOWN')
+        data = data.reindex(sorted(data.columns), axis = 1)
+        doc  = data.shape[0]
+        self.vb = []
+        if (del_duplicated == True):
+            if self._should_batch(data, op = 'merge_database'):
+                idx = self._dedup_indices_batch(data)
+            else:
+                idx = self._dedup_indices_full(data)
+            if idx:
+                data.drop(idx, axis = 0, inplace = True)
+                data = data.reset_index(drop = True)
+            self.vb.append('A Total of ' + str(doc-len(idx)) + ' Documents were Found ( ' + str(doc) + ' Documents and '+ str(len(idx)) + ' Duplicates )')
+        else:
+            self.vb.append('A Total of ' + str(doc) + ' Documents were Found')
+        types   = list(data['document_type'])
+        u_types = sorted(set(types))
+        self.vb.append('')
+        for tp in u_types:
+            self.vb.append(tp + ' = ' + str(types.count(tp)))
+        return data, entries
+
     # Function: Update Verbose
     def __update_vb(self):
         self.vb   = []
@@ -2692,15 +3080,9 @@ class pbx_probe():
                 ctr.append(row_countries)
             self.corr_a_country_map = {}
             for index, row in self.data.iterrows():
-                if (self.database.lower() == 'wos'):
-                    if ('Corresponding Author' in row['affiliation_']):
-                        corresponding_author = next( (author for author in self.aut[index] if 'Corresponding Author' in row['affiliation_']), None )
-                        if (corresponding_author and corresponding_author in self.author_country_map):
-                            self.corr_a_country_map[corresponding_author] = self.author_country_map[corresponding_author]
-                else:
-                    corresponding_author = next((author for author in self.aut[index]  if 'corresponding author' in row['correspondence_address1'].lower()), None)
-                    if (corresponding_author and corresponding_author in self.author_country_map):
-                        self.corr_a_country_map[corresponding_author] = self.author_country_map[corresponding_author]
+                corresponding_author = self._corresponding_author(row, self.aut[index], exact = True)
+                if (corresponding_author and corresponding_author in self.author_country_map):
+                    self.corr_a_country_map[corresponding_author] = self.author_country_map[corresponding_author]
             self.frst_a_country_map = {}
             for index, row in self.data.iterrows():
                 if (self.aut[index]):  
@@ -2732,49 +3114,14 @@ class pbx_probe():
             return ctr, u_ctr
 
         data = self.data.copy(deep    = True)
-        data['processed_affiliation'] = data.apply(preprocess_affiliation, axis = 1).str.lower()
-        country_replacements          = {
-                                            ' usa':            ' united states of america',
-                                            'england':         'united kingdom',
-                                            'antigua & barbu': 'antigua and barbuda',
-                                            'bosnia & herceg': 'bosnia and herzegovina',
-                                            'cent afr republ': 'central african republic',
-                                            'czech republic':  'czechia',
-                                            'dominican rep':   'dominican republic',
-                                            'equat guinea':    'equatorial guinea',
-                                            'fr austr lands':  'french southern territories',
-                                            'fr polynesia':    'french polynesia',
-                                            'malagasy republ': 'madagascar',
-                                            'mongol peo rep':  'mongolia',
-                                            'neth antilles':   'saint martin',
-                                            'north ireland':   'ireland',
-                                            'peoples r china': 'china',
-                                            'rep of georgia':  'georgia',
-                                            'russia':          'russian federation',
-                                            'sao tome e prin': 'sao tome and principe',
-                                            'scotland':        'united kingdom',
-                                            'st kitts & nevi': 'saint kitts and nevis',
-                                            'trinid & tobago': 'trinidad and tobago',
-                                            'u arab emirates': 'united arab emirates',
-                                            'usa':             'united states of america',
-                                            'vietnam':         'viet nam',
-                                        }
-        data['processed_affiliation'] = data['processed_affiliation'].replace('united states of america', 'usa', regex = True)
-        data['processed_affiliation'] = data['processed_affiliation'].replace('united states', 'usa', regex = True)
-        data['processed_affiliation'] = data['processed_affiliation'].replace(country_replacements, regex = True)
+        data['processed_affiliation'] = data.apply(preprocess_affiliation, axis = 1)
+        matcher                       = country_matcher(self.country_names)
         self.author_country_map       = {author: [] for author in self.u_aut}
         for index, row in data.iterrows():
-            affiliations = row['processed_affiliation'].split(';')
+            affiliations = [(aff.lower(), matcher.find(aff)) for aff in row['processed_affiliation'].split(';')]
             authors      = self.aut[row.name]
             for author in authors:
-                detected_country = 'UNKNOWN'
-                for aff in affiliations:
-                    for country in self.country_names:
-                        if (country.lower() in aff and author in aff):
-                            detected_country = country
-                            break
-                    if (detected_country != 'UNKNOWN'):
-                        break
+                detected_country = next((country for aff, country in affiliations if country is not None and author in aff), 'UNKNOWN')
                 if not any(entry[0] == index for entry in self.author_country_map[author]):
                     self.author_country_map[author].append((index, detected_country))
         ctr, u_ctr = get_additional_country_data()
@@ -2797,25 +3144,6 @@ class pbx_probe():
     
     # Function: Get Institutions   
     def __get_institutions(self):
-        
-        #----------------------------------------------------------------------
-
-        def extract_top_institution_with_priority(text, institution_names):
-            segments              = text.split(';')
-            selected_institutions = []
-            for segment in segments:
-                segment   = segment.strip().lower()
-                sub_parts = segment.split(',')
-                matches   = [ (part.strip(), self.inst_priority.get(keyword, 0)) for part in sub_parts for keyword in self.inst_priority.keys() if keyword in part ]
-                if (matches):
-                    matches.sort(key = lambda x: (-x[1], -len(x[0])))
-                    selected_institutions.append(matches[0][0])
-                else:
-                    selected_institutions.append('UNKNOWN')
-            return selected_institutions
-
-        #----------------------------------------------------------------------
-
         if (self.data['source'].str.lower() == 'openalex').all() and ('institution' in self.data.columns):
             inst = []
             for index, row in self.data.iterrows():
@@ -2849,7 +3177,7 @@ class pbx_probe():
         affiliations_wos       = (self.data['affiliation_'].fillna('').str.lower() if 'affiliation_' in self.data.columns else pd.Series([''] * len(self.data)) )
         processed_affiliations = np.where(sources.isin(['scopus', 'pubmed', 'openalex']), affiliations, np.where(sources == 'wos', affiliations_wos, 'UNKNOWN') )
         processed_affiliations = pd.Series(processed_affiliations)
-        top_institutions       = processed_affiliations.apply( lambda row: extract_top_institution_with_priority(row, self.institution_names))
+        top_institutions       = processed_affiliations.apply(institution_matcher(self.inst_priority).extract)
         inst                   = [top for top in top_institutions]
         #flattened_institutions = [institution for sublist in top_institutions for institution in sublist]
         #u_inst                 = list(set(flattened_institutions))
@@ -2864,7 +3192,10 @@ class pbx_probe():
                             self.author_inst_map[author].append((index, re.sub(r'^(?:[A-Za-z]\.\s?)+', '', institution)))
                 if (len(self.author_inst_map[author]) == 0):
                     self.author_inst_map[author].append((index, 'UNKNOWN'))
-        self.author_inst_map = {k: list(set(v)) for k, v in self.author_inst_map.items()}
+        # Ordered dedup: a row's institution below is the first match in
+        # extraction order (as in _extract_institutions_chunk), not
+        # whichever a set happens to iterate first.
+        self.author_inst_map = {k: list(dict.fromkeys(v)) for k, v in self.author_inst_map.items()}
         #inst                 = []
         #for index, row in self.data.iterrows():
             #row_inst = []
@@ -2886,16 +3217,9 @@ class pbx_probe():
         u_inst               = list({re.sub(r'^(?:[A-Za-z]\.\s?)+', '', name).strip() for row in inst for name in row })
         self.corr_a_inst_map = {}
         for index, row in self.data.iterrows():
-            if (self.database == 'wos'):
-                if ('corresponding author' in row['affiliation_'].lower()):
-                    corresponding_author = next((author for author in self.aut[index] if 'corresponding author' in row['affiliation_'].lower()), None)
-                    if (corresponding_author and corresponding_author in self.author_inst_map):
-                        self.corr_a_inst_map[corresponding_author] = self.author_inst_map[corresponding_author]
-            else:
-                if ('corresponding author' in row['correspondence_address1'].lower()):
-                    corresponding_author = next( (author for author in self.aut[index] if 'corresponding author' in row['correspondence_address1'].lower()), None)
-                    if (corresponding_author and corresponding_author in self.author_inst_map):
-                        self.corr_a_inst_map[corresponding_author] = self.author_inst_map[corresponding_author]
+            corresponding_author = self._corresponding_author(row, self.aut[index])
+            if (corresponding_author and corresponding_author in self.author_inst_map):
+                self.corr_a_inst_map[corresponding_author] = self.author_inst_map[corresponding_author]
         self.frst_a_inst_map = {}
         for index, row in self.data.iterrows():
             if (self.aut[index]):  
@@ -2904,42 +3228,50 @@ class pbx_probe():
                     self.frst_a_inst_map[first_author] = self.author_inst_map[first_author]
         return inst, u_inst
 
-    # Function: Get Counts
+    # Function: Document x Entity Incidence (occurrence counts)
+    def _entity_incidence(self, u_ent, ent):
+        store = getattr(self, 'entities', None)
+        name  = store.family_of(ent) if store is not None else None
+        if (name is not None):
+            return store.incidence(name, u_ent)
+        if not isinstance(ent, RaggedList):
+            ent = RaggedList(*encode_ragged(ent))
+        return incidence_matrix(ent, u_ent)
+
+    # Function: Get Counts (documents, or the sum of acc over documents, holding each entity)
     def __get_counts(self, u_ent, ent, acc = []):
-        counts = []
-        for u in u_ent:
-            ents = 0
-            for j, e in enumerate(ent):
-                if (u in e):
-                    if (acc):
-                        ents = ents + acc[j]
-                    else:
-                        ents = ents + 1
-            counts.append(ents)
-        return counts
+        presence      = self._entity_incidence(u_ent, ent)
+        presence.data = np.ones_like(presence.data)
+        if (len(acc) > 0):
+            return (presence.T @ np.asarray(acc)).tolist()
+        return presence.sum(axis = 0).A1.tolist()
 
     # Function: Get Count Year
     def __get_counts_year(self, u_ent, ent):
         years = list(range(self.date_str, self.date_end + 1)) if self.date_end >= self.date_str else []
-        df_counts = pd.DataFrame(np.zeros((len(u_ent), len(years))))
         if len(years) == 0:
-            return df_counts
-        dy_vals = list(self.dy)
-        for i in range(0, len(u_ent)):
-            for j in range(0, min(len(ent), len(dy_vals))):
-                if (u_ent[i] in ent[j]):
-                    year_val = pd.to_numeric(dy_vals[j], errors = 'coerce')
-                    if pd.isna(year_val):
-                        continue
-                    year_int = int(year_val)
-                    if year_int not in years:
-                        continue
-                    k = years.index(year_int)
-                    df_counts.iloc[i, k] = df_counts.iloc[i, k] + 1
+            return pd.DataFrame(np.zeros((len(u_ent), len(years))))
+        presence      = self._entity_incidence(u_ent, ent)
+        presence.data = np.ones(len(presence.data), dtype = np.float64)
+        n_docs        = min(presence.shape[0], len(self.dy))
+        year_vals     = pd.to_numeric(pd.Series(list(self.dy)[:n_docs], dtype = object), errors = 'coerce').to_numpy(dtype = np.float64)
+        valid         = ~np.isnan(year_vals)
+        year_cols     = np.full(n_docs, -1, dtype = np.int64)
+        year_cols[valid] = year_vals[valid].astype(np.int64) - self.date_str
+        docs          = np.flatnonzero((year_cols >= 0) & (year_cols < len(years)))
+        one_hot       = csr_matrix((np.ones(len(docs)), (docs, year_cols[docs])), shape = (presence.shape[0], len(years)))
+        df_counts     = pd.DataFrame((presence.T @ one_hot).toarray())
         return df_counts
     
     # Function: Get Collaboration Year
     def __get_collaboration_year(self):
+        counts = Counter()
+        for k in range(0, len(self.aut)):
+            counts[(str(int(self.dy[k])), 'n = ' + str(len(self.aut[k])))] += 1
+        return self.__collaboration_table(counts)
+
+    # Function: Collaboration Table from (year, 'n = k') document counts
+    def __collaboration_table(self, counts):
         max_aut         = list(set([str(item) for item in self.aut_docs]))
         max_aut         = sorted(max_aut, key = self.natsort)
         n_collaborators = ['n = ' + i for i in max_aut]
@@ -2948,10 +3280,8 @@ class pbx_probe():
         years           = [str(int(item)) for item in years]
         years.append('Total')
         dy_collab_year = pd.DataFrame(np.zeros((len(years), len( n_collaborators))), index = years, columns = n_collaborators)
-        for k in range(0, len(self.aut)):
-            i                        = str(int(self.dy[k]))
-            j                        = ['n = ' + str(len(self.aut[k]))]
-            dy_collab_year.loc[i, j] = dy_collab_year.loc[i, j] + 1    
+        for (i, j), count in counts.items():
+            dy_collab_year.loc[i, j] = dy_collab_year.loc[i, j] + count
         dy_collab_year.iloc[-1, :] = dy_collab_year.sum(axis = 0)
         dy_collab_year.iloc[:, -1] = dy_collab_year.sum(axis = 1)
         for i in range(0, dy_collab_year.shape[0]):
@@ -2961,11 +3291,11 @@ class pbx_probe():
         return dy_collab_year
     
     # Function: Get Reference Year
-    def __get_ref_year(self):
+    def __get_ref_year(self, refs = None):
         date_end        = self.date_end
         year_pattern    = re.compile(r'(?<!\d)(\d{4})(?!\d)')
         extracted_years = []
-        for ref in self.u_ref:
+        for ref in (self.u_ref if refs is None else refs):
             matches     = year_pattern.findall(ref)
             valid_years = [int(year) for year in matches if 1665 <= int(year) <= date_end] # The oldest scientific journal is Philosophical Transactions, which was launched in 1665 by Henry Oldenburg
             extracted_years.append(max(valid_years) if valid_years else -1)
@@ -3017,35 +3347,76 @@ class pbx_probe():
             except Exception:
                 pass
 
-        keys_1 = self.data['title'].str.lower().str.replace('[', '', regex = False).str.replace(']', '', regex = False).tolist()
-        keys_2 = self.data['doi'].str.lower().tolist()
-        keys = np.where(sources.isin(['scopus', 'pubmed']), keys_1, np.where(sources == 'wos', keys_2, None))
-        corpus = ' '.join(ref.lower() for ref in self.u_ref)
-        matched_indices = []
-        for i, key in enumerate(keys):
-            if (key and key.strip()):
-                try:
-                    compiled_regex = re.compile(key)
-                    if (re.search(compiled_regex, corpus)):
-                        matched_indices.append(i)
-                except:
-                    pass
-        insd_r = []
-        insd_t = []
-        u_ref_lower = [ref.lower() for ref in self.u_ref]
-        for i in matched_indices:
-            key = keys[i]
-            for j, ref in enumerate(u_ref_lower):
-                if (re.search(key, ref)):
-                    insd_r.append(f'r_{j}')
-                    insd_t.append(str(i))
-                    self.dy_ref[j] = int(self.dy[i])
-                    break
-        dict_lbs = dict(zip(insd_r, insd_t))
-        dict_lbs.update({label: label for label in labels_r if label not in dict_lbs})
+        # A reference cited by several documents keeps the last of them.
+        # Collapsed variants (ref_variants) still match, as their canonical
+        # reference.
+        keys     = self._reference_match_keys(self.data)
+        refs     = list(self.u_ref)
+        owners   = list(range(0, len(refs)))
+        variants = getattr(self, 'ref_variants', {})
+        if (len(variants) > 0):
+            position = {ref: j for j, ref in enumerate(refs)}
+            for variant, canonical in variants.items():
+                if (canonical in position):
+                    refs.append(variant)
+                    owners.append(position[canonical])
+        # With a reference index, references it holds verbatim link first;
+        # the remaining documents are matched, then linked through the
+        # keys shared with indexed variants. New links join the index.
+        links    = []
+        index    = getattr(self, 'ref_index', None)
+        if (index is not None):
+            links = self.__indexed_reference_links(index, refs, exact = True)
+            keys  = list(keys)
+            for i, _ in links:
+                keys[i] = None
+        found    = [(i, j) for i, j in enumerate(ReferenceResolver(refs).resolve(keys)) if j is not None]
+        if (index is not None):
+            linked = {i for i, _ in links + found}
+            found  = found + [(i, j) for i, j in self.__indexed_reference_links(index, refs, exact = False) if i not in linked]
+            if (len(found) > 0):
+                index.add((refs[j], self.data['doi'].iloc[i], self.data['title'].iloc[i], self.dy.iloc[i]) for i, j in found)
+        dict_lbs = {}
+        for i, j in sorted(links + found):
+            j                     = owners[j]
+            dict_lbs[labels_r[j]] = str(i)
+            self.dy_ref[j]        = int(self.dy[i])
         labels_r = [dict_lbs.get(label, label) for label in labels_r]
         return labels_r
+
+    # Helper: (document, reference) pairs that a ReferenceIndex resolves,
+    # matching the indexed work by DOI, then by normalized title. Each
+    # document keeps its first reference, as in the text matching.
+    def __indexed_reference_links(self, index, refs, exact = False):
+        by_doi   = {}
+        by_title = {}
+        for i, (doi, title) in enumerate(zip(self.data['doi'].tolist(), self.data['title'].tolist())):
+            doi = str(doi).lower().strip()
+            if (doi and doi != 'unknown'):
+                by_doi[doi] = i
+            title = normalize_title(title)
+            if (title and title != 'unknown'):
+                by_title[title] = i
+        links = {}
+        for j, hit in enumerate(index.lookup(refs, exact)):
+            if (hit is None):
+                continue
+            doi, title, _ = hit
+            i             = by_doi.get(str(doi).lower().strip()) if doi else None
+            if (i is None and title):
+                i = by_title.get(normalize_title(title))
+            if (i is not None):
+                links.setdefault(i, j)
+        return list(links.items())
     
+    # Helper: per-document search keys used to link references to documents
+    # of the collection (title for Scopus/PubMed, DOI for WoS, else None)
+    def _reference_match_keys(self, data):
+        sources = data['source'].fillna('').astype(str).str.lower()
+        keys_1  = data['title'].str.lower().str.replace('[', '', regex = False).str.replace(']', '', regex = False).tolist()
+        keys_2  = data['doi'].str.lower().tolist()
+        return np.where(sources.isin(['scopus', 'pubmed']), keys_1, np.where(sources == 'wos', keys_2, None))
+
     ##############################################################################
     
     def _safe_doc_indices(self, indices):
@@ -3699,14 +4070,7 @@ class pbx_probe():
                     name = 'Stopwords-Thai.txt'
                 elif (sw_ == 'uk' or sw_ == 'ukr' or sw_ == 'ukrainian'):
                     name = 'Stopwords-Ukrainian.txt'
-                with pkg_resources.open_binary(stws, name) as file:
-                    raw_data = file.read()
-                result   = chardet.detect(raw_data)
-                encoding = result['encoding']
-                with pkg_resources.open_text(stws, name, encoding = encoding) as file:
-                    content = file.read().split('\n')
-                content = [line.rstrip('\r').rstrip('\n') for line in content]
-                sw      = list(filter(None, content))
+                sw = _read_stopwords(name)
                 sw_full.extend(sw)
         if (len(rmv_custom_words) > 0):
             sw_full.extend(rmv_custom_words)
@@ -4230,13 +4594,13 @@ class pbx_probe():
             rmv_custom_words.append('unknown') 
         if   (key == 'kwp'):
             u_ent = [item for item in self.u_kid if item not in rmv_custom_words]
-            ent   = [item for item in self.kid   if item not in rmv_custom_words]
+            ent   = self.kid
         elif (key == 'kwa'):
             u_ent = [item for item in self.u_auk if item not in rmv_custom_words]
-            ent   = [item for item in self.auk   if item not in rmv_custom_words]
+            ent   = self.auk
         elif (key == 'jou'):
             u_ent = [item for item in self.u_jou if item not in rmv_custom_words]
-            ent   = [item for item in self.jou   if item not in rmv_custom_words]
+            ent   = self.jou
         elif (key == 'abs'):
             abs_  = self.data['abstract'].tolist()
             abs_  = ['the' if i not in y_idx else  abs_[i] for i in range(0, len(abs_))]
@@ -4248,7 +4612,8 @@ class pbx_probe():
                 u_abs = u_abs[1:]
             s_abs       = [item.split() for item in abs_]
             s_abs       = [item for sublist in s_abs for item in sublist]
-            abs_count   = [s_abs.count(item) for item in u_abs]
+            s_abs       = Counter(s_abs)
+            abs_count   = [s_abs[item] for item in u_abs]
             idx         = sorted(range(len(abs_count)), key = abs_count.__getitem__)
             idx.reverse()
             abs_       = [item.split() for item in abs_]
@@ -4265,7 +4630,8 @@ class pbx_probe():
                 u_tit = u_tit[1:]
             s_tit       = [item.split() for item in tit_]
             s_tit       = [item for sublist in s_tit for item in sublist]
-            tit_count   = [s_tit.count(item) for item in u_tit]
+            s_tit       = Counter(s_tit)
+            tit_count   = [s_tit[item] for item in u_tit]
             idx         = sorted(range(len(tit_count)), key = tit_count.__getitem__)
             idx.reverse()
             tit_       = [item.split() for item in tit_]
@@ -4998,139 +5364,60 @@ class pbx_probe():
 
     #############################################################################
     
+    # Helper: h, g, e, j indices and first publication year of every
+    # author from one grouped pass (see impact.py). The table is cached
+    # until aut, u_aut, citation or dy are replaced, i.e. until the data
+    # changes.
+    def _impact_table(self):
+        key    = (self.aut, self.u_aut, self.citation, self.dy)
+        cached = getattr(self, '_impact_cache', None)
+        if (cached is not None and all(a is b for a, b in zip(cached[0], key))):
+            return cached[1]
+        occurrences        = self._entity_incidence(self.u_aut, self.aut).tocoo()
+        authors            = np.repeat(occurrences.col, occurrences.data)
+        docs               = np.repeat(occurrences.row, occurrences.data)
+        years              = pd.to_numeric(pd.Series(list(self.dy), dtype = object), errors = 'coerce').to_numpy(dtype = np.float64)
+        table              = impact_indices(authors, docs, self.citation, len(self.u_aut), years)
+        self._impact_cache = (key, table)
+        return table
+
     # Function: Hirsch Index
     def h_index(self):
-        h_i                     = []
-        researcher_to_citations = {researcher: [] for researcher in self.u_aut}
-        for i, researchers in enumerate(self.aut):
-            for researcher in researchers:
-                if (researcher in researcher_to_citations):
-                    researcher_to_citations[researcher].append(self.citation[i])
-        for researcher in self.u_aut:
-            citations = researcher_to_citations[researcher]
-            citations.sort(reverse = True)
-            h         = 0
-            for idx, citation in enumerate(citations):
-                if (citation >= idx + 1):
-                    h = idx + 1
-                else:
-                    break
-            h_i.append(h)
-        return h_i
+        return self._impact_table()['h'].tolist()
     
     # Function: G-Index
     def g_index(self):
-        g_i                     = []
-        researcher_to_citations = {researcher: [] for researcher in self.u_aut}
-        for i, authors in enumerate(self.aut):
-            for researcher in authors:
-                if (researcher in researcher_to_citations):
-                    citation_val = self.citation[i]
-                    if isinstance(citation_val, int):
-                        researcher_to_citations[researcher].append(citation_val)
-                    else:
-                        try:
-                            citation_int = int(citation_val)
-                            researcher_to_citations[researcher].append(citation_int)
-                        except:
-                            pass
-        for researcher in self.u_aut:
-            citations      = researcher_to_citations[researcher]
-            citations.sort(reverse = True)
-            cumulative_sum = 0
-            g              = 0
-            for idx, citation in enumerate(citations):
-                cumulative_sum = cumulative_sum + citation
-                if (cumulative_sum >= (idx + 1) ** 2):
-                    g = idx + 1
-                else:
-                    break
-            g_i.append(g)
-        return g_i
+        return self._impact_table()['g'].tolist()
 
     # Function: M-Index
     def m_index(self, current_year):
-        m_i                 = [] 
-        researcher_to_years = {researcher: [] for researcher in self.u_aut}
-        dy_vals             = list(self.dy)
-        for i, authors in enumerate(self.aut):
-            if i >= len(dy_vals):
-                break
-            year_val = pd.to_numeric(dy_vals[i], errors = 'coerce')
-            if pd.isna(year_val) or year_val == -1:
-                continue
-            for researcher in authors:
-                if (researcher in researcher_to_years):
-                    researcher_to_years[researcher].append(float(year_val))
-        for idx, researcher in enumerate(self.u_aut):
-            if (researcher_to_years[researcher]):
-                first_year    = min(researcher_to_years[researcher])
-                career_length = current_year - first_year + 1
-                if (career_length < 1):
-                    career_length = 1
-                m_value = self.aut_h[idx] / career_length
-            else:
-                m_value = None
-            m_i.append(m_value)
-        return m_i
+        table         = self._impact_table()
+        career_length = current_year - table['first_year'] + 1
+        career_length = np.where(career_length < 1, 1, career_length)
+        m_values      = table['h'] / career_length
+        return [None if np.isnan(first_year) else float(m_value) for first_year, m_value in zip(table['first_year'], m_values)]
     
     # Function: E-Index    
     def e_index(self):
-        researcher_to_citations = {researcher: [] for researcher in self.u_aut}
-        for i, authors in enumerate(self.aut):
-            for researcher in authors:
-                if (researcher in researcher_to_citations):
-                    citation_val = self.citation[i]
-                    if isinstance(citation_val, int):
-                        researcher_to_citations[researcher].append(citation_val)
-                    else:
-                        try:
-                            citation_int = int(citation_val)
-                            researcher_to_citations[researcher].append(citation_int)
-                        except:
-                            pass
-        e_indices = []
-        for researcher, h in zip(self.u_aut, self.aut_h):
-            citations  = researcher_to_citations[researcher]
-            citations.sort(reverse = True)
-            excess_sum = 0
-            for i in range(h):
-                if (i < len(citations)):
-                    excess = citations[i] - h
-                    if (excess > 0):
-                        excess_sum = excess_sum + excess
-            e_value = np.sqrt(excess_sum)
-            e_indices.append(e_value)
-        return e_indices
+        return list(self._impact_table()['e'])
 
     # Function: J-Index
     def j_index(self):
-        researcher_to_citations = {researcher: [] for researcher in self.u_aut}
-        for i, authors in enumerate(self.aut):
-            for researcher in authors:
-                if (researcher in researcher_to_citations):
-                    citation_val = self.citation[i]
-                    try:
-                        researcher_to_citations[researcher].append(int(citation_val))
-                    except Exception:
-                        pass
-        thresholds = [500, 250, 100, 50, 25, 10, 5, 4, 3, 2, 1.5, 1.25]
-        weights    = [1 / k for k in range(1, len(thresholds) + 1)]
-        weight_sum = sum(weights)
-        j_indices  = []
-        for researcher, h in zip(self.u_aut, self.aut_h):
-            citations = sorted(researcher_to_citations[researcher], reverse = True)
-            if h <= 0 or len(citations) == 0:
-                j_indices.append(0.0)
-                continue
-            weighted_increment = 0.0
-            for delta_hk, wk in zip(thresholds, weights):
-                threshold = h * delta_hk
-                nk = sum(1 for c in citations if c >= threshold)
-                weighted_increment = weighted_increment + wk * nk
-            j_value = h + (weighted_increment / weight_sum)
-            j_indices.append(float(j_value))
-        return j_indices
+        return self._impact_table()['j'].tolist()
+
+    # Function: Author Impact Indices (one table, computed once per dataset version)
+    def author_indices(self, current_year = None):
+        table = self._impact_table()
+        data  = {
+                 'Author':  list(self.u_aut),
+                 'H-index': table['h'].tolist(),
+                 'G-index': table['g'].tolist(),
+                 'E-index': list(table['e']),
+                 'J-index': table['j'].tolist(),
+                }
+        if (current_year is not None):
+            data['M-index'] = self.m_index(current_year)
+        return pd.DataFrame(data)
 
     # Function: Total and Self Citations
     def __total_and_self_citations(self):
@@ -5254,14 +5541,7 @@ class pbx_probe():
                 name = 'Stopwords-Ukrainian.txt'
             else:
                 continue
-            with pkg_resources.open_binary(stws, name) as file:
-                raw_data = file.read()
-            result   = chardet.detect(raw_data)
-            encoding = result['encoding']
-            with pkg_resources.open_text(stws, name, encoding = encoding) as file:
-                content = file.read().split('\n')
-            content = [line.rstrip('\r').rstrip('\n') for line in content]
-            sw      = list(filter(None, content))
+            sw = _read_stopwords(name)
             sw_full.extend(sw)
         return sw_full
 
@@ -6037,25 +6317,38 @@ class pbx_probe():
 
     #############################################################################
         
+    # Helper: entity co-occurrence from the document x entity incidence
+    # matrix X of the store. X.T @ X counts c_a * c_b for every document
+    # holding a and b; subtracting the occurrence totals from the diagonal
+    # leaves c_a * (c_a - 1), i.e. exactly the ordered pairs the old
+    # per-document pair expansion produced. Returns the binary adjacency
+    # and the per-entity pair totals (n_colab) before binarization.
+    def _cooccurrence_matrix(self, name, labels, skip_unknown = False):
+        store = self._entity_store()
+        rows  = None
+        if (skip_unknown):
+            family  = store[name]
+            indptr  = np.asarray(family.indptr)
+            unknown = np.array([item == 'unknown' for item in family.vocab], dtype = bool)
+            filled  = np.flatnonzero(indptr[1:] > indptr[:-1])
+            first   = np.asarray(family.indices)[indptr[filled]]
+            rows    = filled[~unknown[first]]
+        incidence  = store.incidence(name, labels, dtype = np.int64, rows = rows)
+        totals     = np.asarray(incidence.sum(axis = 0)).ravel()
+        adjacency  = (incidence.T @ incidence).tocsr()
+        adjacency.setdiag(adjacency.diagonal() - totals)
+        adjacency.eliminate_zeros()
+        n_colab        = np.asarray(adjacency.sum(axis = 0)).ravel()
+        adjacency.data = (adjacency.data > 0).astype(np.int8)
+        adjacency      = adjacency.astype(np.int8)
+        return adjacency, n_colab
+
     # Function: Authors Colaboration Adjacency Matrix   
     def __adjacency_matrix_aut(self, min_colab = 1):
-        tgt_entry      = self.aut
         tgt_entry_u    = self.u_aut
         tgt_label      = 'a_'
-        item_to_idx    = {tgt: idx for idx, tgt in enumerate(tgt_entry_u)} 
         n_items        = len(tgt_entry_u) 
-        item_idx_list  = []
-        for it in tgt_entry:
-            item_idx       = np.array([item_to_idx[i] for i in it], dtype = np.int32)
-            item_idx_list.append(item_idx)
-        item_idx_list_typed = List()
-        for arr in item_idx_list:
-            item_idx_list_typed.append(arr)
-        rows, cols     = build_edges(item_idx_list_typed)
-        data           = np.ones(len(rows), dtype = np.int8)
-        adjacency      = coo_matrix((data, (rows, cols)), shape = (n_items, n_items)).tocsr()
-        n_colab        = np.array(adjacency.sum(axis = 0)).flatten()
-        adjacency.data = (adjacency.data > 0).astype(np.int8)
+        adjacency, n_colab = self._cooccurrence_matrix('aut', tgt_entry_u)
         if (min_colab > 0):
             low_colab_mask = n_colab < min_colab
             if (np.any(low_colab_mask)):
@@ -6070,23 +6363,10 @@ class pbx_probe():
     
     # Function: Country Colaboration Adjacency Matrix
     def __adjacency_matrix_ctr(self, min_colab = 1):
-        tgt_entry      = self.ctr
         tgt_entry_u    = self.u_ctr
         tgt_label      = 'c_'
-        item_to_idx    = {tgt: idx for idx, tgt in enumerate(tgt_entry_u)} 
         n_items        = len(tgt_entry_u) 
-        item_idx_list  = []
-        for it in tgt_entry:
-            item_idx       = np.array([item_to_idx[i] for i in it], dtype = np.int32)
-            item_idx_list.append(item_idx)
-        item_idx_list_typed = List()
-        for arr in item_idx_list:
-            item_idx_list_typed.append(arr)
-        rows, cols     = build_edges(item_idx_list_typed)
-        data           = np.ones(len(rows), dtype = np.int8)
-        adjacency      = coo_matrix((data, (rows, cols)), shape = (n_items, n_items)).tocsr()
-        n_colab        = np.array(adjacency.sum(axis = 0)).flatten()
-        adjacency.data = (adjacency.data > 0).astype(np.int8)
+        adjacency, n_colab = self._cooccurrence_matrix('ctr', tgt_entry_u)
         if (min_colab > 0):
             low_colab_mask = n_colab < min_colab
             if (np.any(low_colab_mask)):
@@ -6101,23 +6381,10 @@ class pbx_probe():
 
     # Function: Institution Colaboration Adjacency Matrix   
     def __adjacency_matrix_inst(self, min_colab = 1):
-        tgt_entry      = self.uni
         tgt_entry_u    = self.u_uni
         tgt_label      = 'i_'
-        item_to_idx    = {tgt: idx for idx, tgt in enumerate(tgt_entry_u)} 
         n_items        = len(tgt_entry_u) 
-        item_idx_list  = []
-        for it in tgt_entry:
-            item_idx       = np.array([item_to_idx[i] for i in it], dtype = np.int32)
-            item_idx_list.append(item_idx)
-        item_idx_list_typed = List()
-        for arr in item_idx_list:
-            item_idx_list_typed.append(arr)
-        rows, cols     = build_edges(item_idx_list_typed)
-        data           = np.ones(len(rows), dtype = np.int8)
-        adjacency      = coo_matrix((data, (rows, cols)), shape = (n_items, n_items)).tocsr()
-        n_colab        = np.array(adjacency.sum(axis = 0)).flatten()
-        adjacency.data = (adjacency.data > 0).astype(np.int8)
+        adjacency, n_colab = self._cooccurrence_matrix('uni', tgt_entry_u)
         if (min_colab > 0):
             low_colab_mask = n_colab < min_colab
             if (np.any(low_colab_mask)):
@@ -6132,23 +6399,8 @@ class pbx_probe():
     
     # Function: KWA Colaboration Adjacency Matrix   
     def __adjacency_matrix_kwa(self, min_colab = 1):
-        tgt_entry      = self.auk
         tgt_entry_u    = self.u_auk
-        item_to_idx    = {tgt: idx for idx, tgt in enumerate(tgt_entry_u)} 
-        n_items        = len(tgt_entry_u) 
-        item_idx_list  = []
-        for it in tgt_entry:
-            if (it[0] != 'unknown'):
-                item_idx       = np.array([item_to_idx[i] for i in it], dtype = np.int32)
-                item_idx_list.append(item_idx)
-        item_idx_list_typed = List()
-        for arr in item_idx_list:
-            item_idx_list_typed.append(arr)
-        rows, cols     = build_edges(item_idx_list_typed)
-        data           = np.ones(len(rows), dtype = np.int8)
-        adjacency      = coo_matrix((data, (rows, cols)), shape = (n_items, n_items)).tocsr()
-        n_colab        = np.array(adjacency.sum(axis = 0)).flatten()
-        adjacency.data = (adjacency.data > 0).astype(np.int8)
+        adjacency, n_colab = self._cooccurrence_matrix('auk', tgt_entry_u, skip_unknown = True)
         if (min_colab > 0):
             low_colab_mask = n_colab < min_colab
             if (np.any(low_colab_mask)):
@@ -6163,23 +6415,8 @@ class pbx_probe():
     
     # Function: KWP Colaboration Adjacency Matrix
     def __adjacency_matrix_kwp(self, min_colab = 1):
-        tgt_entry      = self.kid
         tgt_entry_u    = self.u_kid
-        item_to_idx    = {tgt: idx for idx, tgt in enumerate(tgt_entry_u)} 
-        n_items        = len(tgt_entry_u) 
-        item_idx_list  = []
-        for it in tgt_entry:
-            if (it[0] != 'unknown'):
-                item_idx       = np.array([item_to_idx[i] for i in it], dtype = np.int32)
-                item_idx_list.append(item_idx)
-        item_idx_list_typed = List()
-        for arr in item_idx_list:
-            item_idx_list_typed.append(arr)
-        rows, cols     = build_edges(item_idx_list_typed)
-        data           = np.ones(len(rows), dtype = np.int8)
-        adjacency      = coo_matrix((data, (rows, cols)), shape = (n_items, n_items)).tocsr()
-        n_colab        = np.array(adjacency.sum(axis = 0)).flatten()
-        adjacency.data = (adjacency.data > 0).astype(np.int8)
+        adjacency, n_colab = self._cooccurrence_matrix('kid', tgt_entry_u, skip_unknown = True)
         if (min_colab > 0):
             low_colab_mask = n_colab < min_colab
             if (np.any(low_colab_mask)):
@@ -6194,7 +6431,6 @@ class pbx_probe():
 
     # Function: References Adjacency Matrix   
     def __adjacency_matrix_ref(self, min_cites = 2, local_nodes = False):
-        u_ref_map   = {ref: idx for idx, ref in enumerate(self.u_ref)}
         num_rows    = self.data.shape[0]
         num_cols    = len(self.u_ref)
         if num_rows <= 0 or num_cols <= 0:
@@ -6202,55 +6438,13 @@ class pbx_probe():
             self.labels_r = []
             self.dict_lbs = {}
             return
-        ref_indices = []
-        for refs in self.ref:
-            filtered = [u_ref_map[r] for r in refs if r in u_ref_map]
-            ref_indices.append(np.array(filtered, dtype = np.int32))
-        ref_idx_list_typed = List()
-        for arr in ref_indices:
-            ref_idx_list_typed.append(arr)
-        row_indices, col_indices = build_edges_ref(ref_idx_list_typed)
-        data                     = np.ones(len(row_indices), dtype = np.float32)
-        sparse_matrix            = csr_matrix((data, (row_indices, col_indices)), shape = (num_rows, num_cols), dtype = np.float32)
+        sparse_matrix = self._entity_store().incidence('ref', self.u_ref, dtype = np.float32)
         self.matrix_r            = pd.DataFrame.sparse.from_spmatrix(sparse_matrix, columns = self.u_ref)
         self.labels_r = [f'r_{i}' for i in range(0, num_cols)]
-        sources = self.data['source'].fillna('').astype(str).str.lower()
-        is_openalex = (
-            ('cr_openalex' in self.data.columns or 'CR_OPENALEX' in self.data.columns)
-            and ('openalex_id' in self.data.columns or 'UT' in self.data.columns)
-            and sources.eq('openalex').all()
-        )
-        if (is_openalex and hasattr(self, 'u_ref_id') and len(self.u_ref_id) == len(self.labels_r)):
-            self.dict_lbs = dict(zip(self.labels_r, self.u_ref_id))
-            self.labels_r = list(self.u_ref_id)
-        else:
-            keys_1 = self.data['title'].str.lower().str.replace('[', '', regex = False).str.replace(']', '', regex = False).tolist()
-            keys_2 = self.data['doi'].str.lower().tolist()
-            keys = np.where(sources.isin(['scopus', 'pubmed']), keys_1, np.where(sources == 'wos', keys_2, None))
-            corpus = ' '.join(ref.lower() for ref in self.u_ref)
-            matched_indices = []
-            for i, key in enumerate(keys):
-                if (key and key.strip()):
-                    try:
-                        compiled_regex = re.compile(key)
-                        if (re.search(compiled_regex, corpus)):
-                            matched_indices.append(i)
-                    except:
-                        pass
-            insd_r = []
-            insd_t = []
-            u_ref_lower = [ref.lower() for ref in self.u_ref]
-            for i in matched_indices:
-                key = keys[i]
-                for j, ref in enumerate(u_ref_lower):
-                    if (re.search(key, ref)):
-                        insd_r.append(f'r_{j}')
-                        insd_t.append(str(i))
-                        self.dy_ref[j] = int(self.dy[i])
-                        break
-            self.dict_lbs = dict(zip(insd_r, insd_t))
-            self.dict_lbs.update({label: label for label in self.labels_r if label not in self.dict_lbs})
-            self.labels_r = [self.dict_lbs.get(label, label) for label in self.labels_r]
+        # u_ref_id already holds the document each reference resolves to
+        # (see __get_ref_id), so the resolution is not repeated here.
+        self.dict_lbs = dict(zip(self.labels_r, self.u_ref_id))
+        self.labels_r = list(self.u_ref_id)
         self.matrix_r.columns = self.labels_r
         if (local_nodes):
             mask          = ~self.matrix_r.columns.str.contains('r_')
@@ -0,0 +1,552 @@
+############################################################################
+
+# pyBibX - Streaming readers for text exports.
+#
+# Record-level tokenizers for the BibTeX (Scopus / WoS) and MEDLINE
+# (PubMed) exports consumed by pbx_probe.__read_bib. Files are read
+# line by line and records are yielded one at a time, so peak memory
+# is bounded by the record (or chunk) size instead of the file size.
+# Scopus CSV exports are read in row chunks that are normalized as
+# they arrive (``stream_scopus_csv_frames``).
+#
+# Only the line-level grammar lives here. Column renames that depend
+# on the whole file are resolved by ``bib_column_map`` once the set of
+# raw keys is known; ``stream_bib_frames`` learns it in a first pass so
+# the chunks of the second one can be handed on as they are parsed.
+# Everything that works on the DataFrame (document type mapping, dedup,
+# affiliation rewriting) stays in pbx.py.
+
+############################################################################
+
+import codecs
+import os
+
+import chardet
+import pandas as pd
+
+from .batch import chunk_list
+
+############################################################################
+
+# Bump whenever this module or pbx_probe.__read_bib changes the frame
+# they produce; on-disk caches of parsed exports are keyed on it.
+PARSER_VERSION    = 1
+
+DEFAULT_ENCODINGS = ['utf-8', 'utf-8-sig', 'cp1252', 'latin-1']
+
+# Columns every bibliographic frame is guaranteed to carry.
+SANITY_COLUMNS    = [
+                     'abbrev_source_title', 'abstract', 'address', 'affiliation', 'art_number',
+                     'author', 'author_keywords', 'chemicals_cas', 'coden',
+                     'correspondence_address1', 'document_type', 'doi', 'editor', 'funding_details',
+                     'funding_text\xa01', 'funding_text\xa02', 'funding_text\xa03', 'isbn', 'issn',
+                     'journal', 'keywords', 'language', 'note', 'number', 'page_count', 'pages',
+                     'publisher', 'pubmed_id', 'references', 'source', 'sponsors', 'title',
+                     'tradenames', 'url', 'volume', 'year'
+                    ]
+
+_WOS_KEYS         = {
+                     'affiliation':      'affiliation_',
+                     'affiliations':     'affiliation',
+                     'article-number':   'art_number',
+                     'cited-references': 'references',
+                     'keywords':         'author_keywords',
+                     'journal-iso':      'abbrev_source_title',
+                     'keywords-plus':    'keywords',
+                     'note':             'note_',
+                     'times-cited':      'note',
+                     'type':             'document_type',
+                    }
+
+_PUBMED_KEYS      = {
+                     'ab':   'abstract',
+                     'ad':   'affiliation',
+                     'au':   'author',
+                     'auid': 'orcid',
+                     'fau':  'full_author',
+                     'lid':  'doi',
+                     'dp':   'year',
+                     'ed':   'editor',
+                     'ip':   'issue',
+                     'is':   'issn',
+                     'jt':   'journal',
+                     'la':   'language',
+                     'mh':   'keywords',
+                     'ot':   'author_keywords',
+                     'pg':   'pages',
+                     'pt':   'document_type',
+                     'pmid': 'pubmed_id',
+                     'ta':   'abbrev_source_title',
+                     'ti':   'title',
+                     'vi':   'volume',
+                    }
+
+_PUBMED_GROUPED   = ('fau - ', 'au  - ', 'auid- ', 'ad  - ')
+
+############################################################################
+
+_ENCODING_MEMO = {}
+
+def _sample_blocks(path, size, sample_size):
+    """Head, middle and tail samples of ``path`` (the whole file if small)."""
+    with open(path, 'rb') as f_file:
+        if (size <= 3 * sample_size):
+            return [f_file.read()], True
+        blocks = [f_file.read(sample_size)]
+        for offset in (size // 2, size - sample_size):
+            f_file.seek(offset)
+            blocks.append(f_file.read(sample_size))
+    return blocks, False
+
+
+def _decodes_sample(encoding, blocks, whole):
+    """True when every sample block decodes as ``encoding``.
+
+    Blocks taken from inside the file may start or end in the middle of
+    a multi-byte sequence, so up to three leading continuation bytes are
+    skipped and an unfinished trailing sequence is accepted.
+    """
+    for i, block in enumerate(blocks):
+        start = 0
+        if (i > 0):
+            while (start < 3 and start < len(block) and 0x80 <= block[start] <= 0xBF):
+                start = start + 1
+        final = whole or i == len(blocks) - 1
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(block[start:], final = final)
+        except UnicodeDecodeError:
+            return False
+    return True
+
+
+def _decodes_file(encoding, path, block_size):
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        with open(path, 'rb') as f_file:
+            for block in iter(lambda: f_file.read(block_size), b''):
+                decoder.decode(block)
+        decoder.decode(b'', final = True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_text_encoding(path, encodings = None, block_size = 1 << 20, sample_size = 1 << 16, full = False):
+    """Return the first encoding in ``encodings`` that decodes ``path``.
+
+    Candidates are tried on a head, middle and tail sample of
+    ``sample_size`` bytes each (the whole file when it is smaller than
+    that), so detection costs a few small reads instead of one full
+    pass per candidate. ``full = True`` validates each candidate over
+    the whole file in blocks of ``block_size`` bytes, as the legacy
+    reader did; callers use it when a sampled guess fails to decode.
+    If no candidate decodes, ``chardet`` is asked about the first block.
+
+    Verdicts are memoized per process on (path, size, mtime), so reading
+    an unchanged file again skips detection.
+    """
+    encodings = list(encodings or DEFAULT_ENCODINGS)
+    stat      = os.stat(path)
+    memo      = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, tuple(encodings))
+    cached    = _ENCODING_MEMO.get(memo)
+    if (cached is not None and (cached[1] or not full)):
+        return cached[0]
+    blocks, whole = _sample_blocks(path, stat.st_size, sample_size)
+    verdict       = None
+    for encoding in encodings:
+        if (full and not whole):
+            ok = _decodes_file(encoding, path, block_size)
+        else:
+            ok = _decodes_sample(encoding, blocks, whole)
+        if (ok):
+            verdict = encoding
+            break
+    if (verdict is None):
+        with open(path, 'rb') as f_file:
+            sample = f_file.read(block_size)
+        verdict = chardet.detect(sample).get('encoding') or 'latin-1'
+    _ENCODING_MEMO[memo] = (verdict, full or whole)
+    return verdict
+
+
+def _read_with_detection(read, path, encoding, encodings = None):
+    """Run ``read(encoding)``, re-detecting over the whole file if a
+    sampled encoding guess turns out not to decode it."""
+    if (encoding is not None):
+        return read(encoding)
+    encoding = detect_text_encoding(path, encodings = encodings)
+    try:
+        return read(encoding)
+    except UnicodeDecodeError:
+        checked = detect_text_encoding(path, encodings = encodings, full = True)
+        if (checked == encoding):
+            raise
+        return read(checked)
+
+
+def iter_text_lines(path, encoding = None):
+    """Yield the lines of ``path`` without their trailing newline.
+
+    Universal newlines are used, so CRLF exports produce the same lines
+    as ``text.split('\\n')`` on the decoded content. A final empty line
+    is yielded when the file ends with a newline, as ``split`` does.
+    """
+    if (encoding is None):
+        encoding = detect_text_encoding(path)
+    last = None
+    with open(path, 'r', encoding = encoding) as f_file:
+        for line in f_file:
+            last = line
+            yield line[:-1] if line.endswith('\n') else line
+    if (last is None or last.endswith('\n')):
+        yield ''
+
+############################################################################
+
+def _iter_wos_lines(lines):
+    """Glue WoS continuation lines (three leading blanks) to their field.
+
+    Continuations of ``Cited-References`` become new ``;``-separated
+    items (with inner ``;`` turned into ``,``); every other field is
+    concatenated as-is. Parts are joined once per field to keep long
+    reference lists linear instead of quadratic.
+    """
+    parts   = None
+    is_cref = False
+    for line in lines:
+        if (line[:3] != '   '):
+            if (parts is not None):
+                yield ''.join(parts)
+            parts   = [line]
+            is_cref = line.find('Cited-References') != -1
+        elif (parts is None):
+            continue
+        elif (is_cref):
+            parts.append(';' + line.replace(';', ','))
+        else:
+            parts.append(line)
+            is_cref = line.find('Cited-References') != -1
+    if (parts is not None):
+        yield ''.join(parts)
+
+
+def _glue_pubmed_record(f_list):
+    # Legacy MEDLINE gluing applied to a single record. ``f_list`` starts
+    # and ends with a blank line so the look-ahead loops stop inside it.
+    f_list_ = []
+    for i in range(0, len(f_list)):
+        tag = f_list[i][:6]
+        if (i == 0 and tag != '      '):
+            f_list_.append(f_list[i])
+        elif (i > 0 and tag != '      ' and tag != f_list[i-1][:6] and tag.lower() not in _PUBMED_GROUPED):
+            f_list_.append(f_list[i])
+        elif (i > 0 and tag != '      ' and tag == f_list[i-1][:6] and tag.lower() not in _PUBMED_GROUPED and tag.lower() != 'pt  - '):
+            f_list_[-1] = f_list_[-1] + '; ' + f_list[i][6:]
+        elif (tag == '      '):
+            if (len(f_list_) > 0):
+                f_list_[-1] = f_list_[-1] + f_list[i][6:]
+        elif (tag in ('FAU - ', 'AU  - ', 'AUID- ', 'AD  - ', 'PT  - ')):
+            f_list_.append(f_list[i])
+            joiner = {'FAU - ': '; ', 'AU  - ': ' and ', 'AUID- ': '; ', 'AD  - ': '', 'PT  - ': None}[tag]
+            j      = i + 1
+            while (j < len(f_list) - 1 and len(f_list[j]) != 0):
+                j = j + 1
+                if (f_list[j][:6].lower() == tag.lower()):
+                    if (joiner is not None):
+                        f_list_[-1] = f_list_[-1] + joiner + f_list[j][6:]
+                    f_list[j] = f_list[j][:6].lower() + f_list[j][6:]
+    for i in range(0, len(f_list_)):
+        if (len(f_list_[i]) > 4):
+            if (f_list_[i][4] == '-'):
+                f_list_[i] = f_list_[i][:4] + '=' + f_list_[i][5:]
+            if (f_list_[i][:3] == 'LID'):
+                f_list_[i] = f_list_[i].replace(' [doi]', '')
+    return f_list_
+
+
+def _iter_pubmed_lines(lines):
+    """Rewrite MEDLINE lines into ``TAG = value`` lines, record by record.
+
+    Records are delimited by blank lines (or a new ``PMID-`` tag) and
+    buffered one at a time, so only the current record is in memory.
+    """
+    buffer = []
+    for line in lines:
+        if (len(line) == 0 or (line[:5] == 'PMID-' and len(buffer) > 0)):
+            if (len(buffer) > 0):
+                for item in _glue_pubmed_record([''] + buffer + ['']):
+                    yield item
+                buffer = []
+            if (len(line) == 0):
+                continue
+        buffer.append(line)
+    if (len(buffer) > 0):
+        for item in _glue_pubmed_record([''] + buffer + ['']):
+            yield item
+
+############################################################################
+
+def _clean_value(text):
+    return text.replace('{', '').replace('},', '').replace('}', '').replace('}},', '').strip()
+
+
+def _finalize_record(record, db, language_names):
+    if (db == 'pubmed'):
+        if ('dp' in record):
+            record['dp'] = record['dp'][:4]
+        if ('la' in record and language_names is not None and record['la'] in language_names):
+            record['la'] = language_names[record['la']]
+    return record
+
+
+def iter_bib_records(path, db = 'scopus', encoding = None, language_names = None):
+    """Yield one ``{raw_key: value}`` dict per record of a text export.
+
+    ``db`` is one of ``'scopus'`` / ``'wos'`` (BibTeX) or ``'pubmed'``
+    (MEDLINE). Keys are the lowercased field names of the export; use
+    ``bib_column_map`` on the collected keys to obtain pyBibX columns.
+    ``language_names`` maps PubMed language codes to names.
+    """
+    db    = db.lower()
+    lines = iter_text_lines(path, encoding = encoding)
+    if (db == 'wos'):
+        lines = _iter_wos_lines(lines)
+    elif (db == 'pubmed'):
+        lines = _iter_pubmed_lines(lines)
+    record   = None
+    last_key = None
+    first    = True
+    for line in lines:
+        if (line.find('@') == 0 or line[:4].lower() == 'pmid'):
+            if (record is not None):
+                yield _finalize_record(record, db, language_names)
+            record   = {}
+            last_key = None
+            if (db == 'pubmed'):
+                record['note']   = '0'
+                record['source'] = 'PubMed'
+                last_key         = 'source'
+            if (db == 'wos'):
+                record['source'] = 'WoS'
+                last_key         = 'source'
+        if ((line.find('=') != -1 and line.find(' ') != 0) or (line.find('=') != -1 and line.find('=') == 15)): # DBLP
+            fields   = line.split('=')
+            key      = fields[0].lower().strip()
+            if (record is not None):
+                record[key] = _clean_value(fields[1])
+                last_key    = key
+        elif (line.find(' ') == 0 and not first and record is not None and last_key is not None):
+            record[last_key] = record[last_key] + ' ' + _clean_value(line)
+        first = False
+    if (record is not None):
+        yield _finalize_record(record, db, language_names)
+
+
+def iter_bib_frames(path, db = 'scopus', chunk_size = 10000, encoding = None, language_names = None):
+    """Yield raw-key ``DataFrame`` chunks of at most ``chunk_size`` records.
+
+    Every cell is kept as ``object`` dtype with NaN for absent fields,
+    the same layout the legacy reader produced before normalization.
+    """
+    records = iter_bib_records(path, db = db, encoding = encoding, language_names = language_names)
+    for chunk in chunk_list(records, max(int(chunk_size), 1)):
+        yield pd.DataFrame(chunk, dtype = object)
+
+
+def bib_column_map(keys, db = 'scopus'):
+    """Map raw export keys to pyBibX column names for ``db``.
+
+    ``keys`` is the set of raw keys seen across the *whole* file, since
+    a few renames only apply when a sibling key is absent everywhere
+    (e.g. Scopus ``journal`` stands in for ``abbrev_source_title``).
+    """
+    db      = db.lower()
+    keys    = set(keys)
+    mapping = {}
+    for key in keys:
+        new = key
+        if (db == 'scopus'):
+            if (key == 'journal' and 'abbrev_source_title' not in keys):
+                new = 'abbrev_source_title'
+            if (key == 'type'):
+                new = 'document_type'
+        elif (db == 'wos'):
+            if (key == 'journal' and 'journal-iso' not in keys):
+                new = 'journal-iso'
+            new = _WOS_KEYS.get(new, new).replace('-', '_')
+        elif (db == 'pubmed'):
+            if (key == 'jt' and 'ta' not in keys):
+                new = 'ta'
+            new = _PUBMED_KEYS.get(new, new)
+        mapping[key] = new
+    return mapping
+
+
+def _map_bib_columns(data, mapping, labels):
+    """Rename raw-key columns to pyBibX names and lay them out as ``labels``.
+
+    Raw keys mapped to the same column are merged, later keys (in column
+    order) taking precedence; every column ends up ``object`` dtype.
+    """
+    targets = {}
+    for key in data.columns:
+        targets.setdefault(mapping[key], []).append(key)
+    for new, olds in targets.items():
+        if (len(olds) > 1):
+            merged = data[olds[0]]
+            for old in olds[1:]:
+                merged = data[old].combine_first(merged)
+            data = data.drop(columns = olds[1:])
+            data[olds[0]] = merged
+    data = data.rename(columns = {olds[0]: new for new, olds in targets.items()})
+    data = data.reindex(columns = labels).reset_index(drop = True)
+    for col in labels:
+        if (data[col].dtype != object):
+            data[col] = data[col].astype(object)
+    return data
+
+
+def scan_bib_keys(path, db = 'scopus', encoding = None, language_names = None):
+    """Raw keys of a text export, in order of first appearance."""
+    keys = {}
+    for record in iter_bib_records(path, db = db, encoding = encoding, language_names = language_names):
+        keys.update(dict.fromkeys(record))
+    return list(keys)
+
+
+def stream_bib_frames(path, db = 'scopus', chunk_size = 10000, encoding = None, language_names = None):
+    """Column labels and pyBibX-named chunks of a text export.
+
+    A first pass collects the raw keys (and settles the encoding), so
+    every chunk of the second pass is renamed with the whole-file column
+    map and laid out on the same labels; the chunks concatenate to the
+    frame ``read_bib_frame`` returns. Returns ``(labels, frames)`` where
+    ``frames`` is a generator of at most ``chunk_size`` rows per chunk.
+    """
+    scan           = lambda enc: (enc, scan_bib_keys(path, db = db, encoding = enc, language_names = language_names))
+    encoding, keys = _read_with_detection(scan, path, encoding)
+    mapping        = bib_column_map(keys, db = db)
+    labels         = sorted(set(mapping.values()) | set(SANITY_COLUMNS))
+
+    def frames():
+        for chunk in iter_bib_frames(path, db = db, chunk_size = chunk_size, encoding = encoding, language_names = language_names):
+            yield _map_bib_columns(chunk.reindex(columns = keys), mapping, labels)
+
+    return labels, frames()
+
+
+def read_bib_frame(path, db = 'scopus', chunk_size = 10000, encoding = None, language_names = None):
+    """Assemble a text export into one frame with pyBibX column names.
+
+    Records are parsed in chunks of ``chunk_size``; only the chunk
+    frames are kept, never the decoded file or its line list. Columns
+    are the sorted union of the mapped keys and ``SANITY_COLUMNS``.
+    """
+    frames = _read_with_detection(lambda enc: list(iter_bib_frames(path, db = db, chunk_size = chunk_size, encoding = enc, language_names = language_names)), path, encoding)
+    if (len(frames) == 0):
+        data = pd.DataFrame(dtype = object)
+    elif (len(frames) == 1):
+        data = frames[0]
+    else:
+        data = pd.concat(frames, axis = 0, ignore_index = True, sort = False)
+    del frames
+    mapping = bib_column_map(data.columns, db = db)
+    labels  = sorted(set(mapping.values()) | set(SANITY_COLUMNS))
+    return _map_bib_columns(data, mapping, labels)
+
+
+############################################################################
+
+# Scopus CSV header renames, applied in order as (unless, old, new): the
+# lower-cased ``old`` column becomes ``new`` unless ``unless`` is present.
+_SCOPUS_CSV_RENAMES = [
+                       ('abbrev_source_title',    'abbreviated source title',      'abbrev_source_title'),
+                       ('abbrev_source_title',    'journal',                       'abbrev_source_title'),
+                       ('document_type',          'document type',                 'document_type'),
+                       ('art_number.',            'art. no.',                      'art_number'),
+                       ('author_keywords',        'author keywords',               'author_keywords'),
+                       ('author',                 'authors',                       'author'),
+                       ('chemicals_cas',          'chemicals/cas',                 'chemicals_cas'),
+                       ('correspondence_address', 'correspondence address',        'correspondence_address'),
+                       ('editor',                 'editors',                       'editor'),
+                       ('funding_details',        'funding details',               'funding_details'),
+                       ('keywords',               'index keywords',                'keywords'),
+                       ('language',               'language of original document', 'language'),
+                       ('note',                   'cited by',                      'note'),
+                       ('page_count',             'page count',                    'page_count'),
+                       ('pubmed_id',              'pubmed id',                     'pubmed_id'),
+                      ]
+
+def scopus_csv_column_map(columns):
+    """Map raw Scopus CSV headers to pyBibX column names.
+
+    The header is resolved once for the whole file, so every chunk is
+    renamed with the same mapping.
+    """
+    lowered = [str(col).lower() for col in columns]
+    current = list(lowered)
+    for unless, old, new in _SCOPUS_CSV_RENAMES:
+        if (unless not in current and old in current):
+            current = [new if col == old else col for col in current]
+    return dict(zip(columns, current))
+
+
+def iter_scopus_csv_frames(path, chunk_size = 10000, encoding = None):
+    """Yield normalized frames of at most ``chunk_size`` rows.
+
+    Each raw chunk is renamed, completed with ``SANITY_COLUMNS`` (filled
+    with ``'UNKNOWN'``), put in sorted column order and has its ``;``
+    author separators turned into `` and `` before it is yielded, so a
+    raw and a normalized copy of the file never coexist.
+    """
+    if (encoding is None):
+        encoding = detect_text_encoding(path, encodings = ['utf8', 'cp1252'])
+    reader  = pd.read_csv(path, encoding = encoding, dtype = str, chunksize = max(int(chunk_size), 1))
+    mapping = None
+    labels  = None
+    with reader:
+        for chunk in reader:
+            if (mapping is None):
+                mapping = scopus_csv_column_map(chunk.columns)
+                labels  = sorted(set(mapping.values()) | set(SANITY_COLUMNS))
+            chunk = chunk.rename(columns = mapping)
+            for col in SANITY_COLUMNS:
+                if (col not in chunk.columns):
+                    chunk[col] = 'UNKNOWN'
+            chunk           = chunk.reindex(labels, axis = 1)
+            chunk['author'] = chunk['author'].apply(lambda x: x.replace(';', ' and ') if isinstance(x, str) else x)
+            yield chunk
+
+
+def stream_scopus_csv_frames(path, chunk_size = 10000, encoding = None):
+    """Column labels and normalized chunks of a Scopus CSV export.
+
+    The streaming counterpart of ``read_scopus_csv_frame``: the labels
+    come from the header row alone, and the encoding is checked over the
+    whole file up front (a chunk already handed on cannot be re-read
+    with another one). Returns ``(labels, frames)`` where ``frames`` is
+    ``iter_scopus_csv_frames`` over the file.
+    """
+    if (encoding is None):
+        encoding = detect_text_encoding(path, encodings = ['utf8', 'cp1252'], full = True)
+    header  = pd.read_csv(path, encoding = encoding, dtype = str, nrows = 0)
+    mapping = scopus_csv_column_map(header.columns)
+    labels  = sorted(set(mapping.values()) | set(SANITY_COLUMNS))
+    return labels, iter_scopus_csv_frames(path, chunk_size = chunk_size, encoding = encoding)
+
+
+def read_scopus_csv_frame(path, chunk_size = 10000, encoding = None):
+    """Assemble a Scopus CSV export from ``iter_scopus_csv_frames``."""
+    read   = lambda enc: (enc, list(iter_scopus_csv_frames(path, chunk_size = chunk_size, encoding = enc)))
+    encoding, frames = _read_with_detection(read, path, encoding, encodings = ['utf8', 'cp1252'])
+    if (len(frames) == 0):
+        header  = pd.read_csv(path, encoding = encoding, dtype = str, nrows = 0)
+        mapping = scopus_csv_column_map(header.columns)
+        data    = header.rename(columns = mapping)
+        for col in SANITY_COLUMNS:
+            if (col not in data.columns):
+                data[col] = pd.Series(dtype = str)
+        return data.reindex(sorted(data.columns), axis = 1)
+    if (len(frames) == 1):
+        return frames[0]
+    return pd.concat(frames, axis = 0, ignore_index = True, sort = False)
@@ -0,0 +1,332 @@
+############################################################################
+
+# pyBibX - Reference-to-document resolution.
+#
+# A document of the collection is "cited" by the first reference (in
+# u_ref order) whose lowercase text contains the document's match key
+# (its title for Scopus/PubMed, its DOI for WoS). ReferenceResolver
+# answers that for every key at once: each key is anchored on one of its
+# interior word tokens, a token -> references posting list is built for
+# the anchors only, and the key is then checked as a plain substring
+# against the few references holding its anchor. Keys are literal text,
+# so titles containing regex metacharacters resolve like any other.
+#
+# canonical_reference_map collapses the surface variants of one cited
+# work (author format, abbreviated source, with or without DOI, as left
+# by merging Scopus and WoS exports). Every reference yields compact
+# keys -- first-author surname, year, volume and first page, and its DOI
+# when present -- and references sharing a key are one work.
+#
+# ReferenceIndex is an optional SQLite file, shared across projects, that
+# remembers which work (DOI, title, year) a reference was resolved to,
+# keyed by the hash of its canonical keys. Resolvers consult it before
+# any matching and record the resolutions they find.
+
+############################################################################
+
+import bisect
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+
+from collections import defaultdict
+
+############################################################################
+
+_TOKEN    = re.compile(r'\w+')
+_DOI      = re.compile(r'\b(10\.\d{4,9}/[^\s,;\[\]]+)', re.IGNORECASE)
+_DOI_GAP  = [
+             re.compile(r'(\b10\.\d{4,9}/j\.)\s+(?=[a-z])', re.IGNORECASE),        # Scopus: 10.1016/j. jclepro.2019...
+             re.compile(r'(\b10\.\d{4,9}/[^\s,;\[\]]+)\s+(?=\d[^\s,;\[\]]*\s*$)')   # Scopus: 10.1080/028 27589809382981
+            ]
+_YEAR     = [
+             re.compile(r'\(((?:1[6-9]|20)\d\d)[a-z]?\)'),                       # Scopus: (2002)
+             re.compile(r',\s*((?:1[6-9]|20)\d\d)[a-z]?\s*(?:,|\.?$)')            # WoS:    , 2002,
+            ]
+_VOLUME   = [
+             re.compile(r',\s*V(\d+)\b'),                                        # WoS:    , V127,
+             re.compile(r',\s*(\d+)\s*(?:\([^)]*\))?\s*,\s*pp?\.\s*\d')            # Scopus: , 37 (8-9), pp. 807
+            ]
+_PAGE     = [
+             re.compile(r',\s*P(\d+)\b'),                                        # WoS:    , P467,
+             re.compile(r'\bpp?\.\s*(\d+)')                                        # Scopus: pp. 807-816
+            ]
+_INITIALS = re.compile(r'^(?:[A-Z]{1,4}|(?:[A-Z]\.-?)+)$')
+
+############################################################################
+
+class ReferenceResolver:
+    """Find, for each match key, the first reference that contains it.
+
+    ``refs`` is the reference vocabulary (``u_ref``); matching is done on
+    its lowercase text. ``resolve`` returns, per key, the index of the
+    first reference containing the key or ``None``.
+    """
+
+    def __init__(self, refs):
+        self.refs       = list(refs)
+        self.refs_lower = [ref.lower() for ref in self.refs]
+        self._corpus    = None
+        self._starts    = None
+
+    @staticmethod
+    def _anchors(key):
+        # Only interior tokens are guaranteed to be whole tokens of any
+        # text containing the key; the first and last may be cut short.
+        tokens = _TOKEN.findall(key)
+        return tokens[1:-1]
+
+    def _corpus_index(self):
+        if (self._corpus is None):
+            self._corpus = '\n'.join(self.refs_lower)
+            starts       = []
+            position     = 0
+            for ref in self.refs_lower:
+                starts.append(position)
+                position = position + len(ref) + 1
+            self._starts = starts
+        return self._corpus, self._starts
+
+    def _scan(self, key):
+        # Short keys without interior tokens: one substring search over
+        # the joined references, skipping hits that span two of them.
+        corpus, starts = self._corpus_index()
+        position       = corpus.find(key)
+        while (position >= 0):
+            j = bisect.bisect_right(starts, position) - 1
+            if (position + len(key) <= starts[j] + len(self.refs_lower[j])):
+                return j
+            position = corpus.find(key, position + 1)
+        return None
+
+    def resolve(self, keys):
+        keys     = [key if (isinstance(key, str) and key.strip()) else None for key in keys]
+        anchors  = [self._anchors(key) if key is not None else [] for key in keys]
+        wanted   = {token for tokens in anchors for token in tokens}
+        postings = {}
+        for j, ref in enumerate(self.refs_lower):
+            for token in set(_TOKEN.findall(ref)):
+                if (token in wanted):
+                    postings.setdefault(token, []).append(j)
+        matches  = []
+        for key, tokens in zip(keys, anchors):
+            if (key is None):
+                matches.append(None)
+                continue
+            if (not tokens):
+                matches.append(self._scan(key))
+                continue
+            candidates = min((postings.get(token, []) for token in tokens), key = len)
+            matches.append(next((j for j in candidates if key in self.refs_lower[j]), None))
+        return matches
+
+    def match(self, keys):
+        """Like ``resolve`` but returns the matched reference strings."""
+        return [self.refs[j] if j is not None else None for j in self.resolve(keys)]
+
+
+############################################################################
+
+def _first(patterns, text):
+    for pattern in patterns:
+        found = pattern.search(text)
+        if found:
+            return found.group(1)
+    return None
+
+
+def _surname(ref):
+    # First field before a comma: 'De Wilde' (Scopus) or 'van Emmerik IJH'
+    # (WoS, initials trailing); reduced to its ASCII letters.
+    tokens = ref.split(',', 1)[0].split()
+    while (len(tokens) > 1 and _INITIALS.match(tokens[-1])):
+        tokens.pop()
+    text   = unicodedata.normalize('NFKD', ' '.join(tokens))
+    return ''.join(ch for ch in text.lower() if 'a' <= ch <= 'z')
+
+
+def _doi(ref):
+    # DOIs split by a space in the export are joined first; a suffix cut
+    # short ('10.1016/j', '10.1002/', '10.3850/978-') is no key, since it
+    # is shared by unrelated works of the same publisher.
+    for pattern in _DOI_GAP:
+        ref = pattern.sub(r'\1', ref)
+    found = _DOI.search(ref)
+    if (not found):
+        return None
+    doi    = found.group(1).rstrip('.').lower()
+    suffix = doi.split('/', 1)[1]
+    if (len(suffix) < 4 or suffix[-1] in '-/.'):
+        return None
+    return doi
+
+
+def reference_keys(ref):
+    """Canonical keys of a reference string.
+
+    ``'doi:<doi>'`` when a complete DOI is present and ``'<surname>|<year>|
+    <volume>|<first page>'`` when all four parts are found. A reference
+    with no key is never collapsed.
+    """
+    keys = []
+    doi  = _doi(ref)
+    if doi:
+        keys.append('doi:' + doi)
+    surname = _surname(ref)
+    year    = _first(_YEAR, ref)
+    volume  = _first(_VOLUME, ref)
+    page    = _first(_PAGE, ref)
+    if (surname and year and volume and page):
+        keys.append('|'.join([surname, year, str(int(volume)), str(int(page))]))
+    return keys
+
+
+def canonical_reference_map(refs, counts = None):
+    """Map each reference variant to the canonical form of its work.
+
+    References sharing any of their ``reference_keys`` (transitively) form
+    one group; its canonical form is the variant with the highest
+    ``counts`` (occurrences in the collection), the earliest in ``refs``
+    on ties. Returns ``{variant: canonical}`` for the non-canonical
+    variants only. Groups whose surname/year/volume/page keys disagree are
+    never joined, so a DOI misattributed by one export does not merge two
+    different works.
+    """
+    counts = {} if counts is None else counts
+    parent = list(range(0, len(refs)))
+    cite   = [None] * len(refs)
+
+    def find(i):
+        while (parent[i] != i):
+            parent[i] = parent[parent[i]]
+            i         = parent[i]
+        return i
+
+    owner = {}
+    for i, ref in enumerate(refs):
+        keys    = reference_keys(ref)
+        cite[i] = next((key for key in keys if not key.startswith('doi:')), None)
+        for key in keys:
+            j = owner.setdefault(key, i)
+            if (j != i):
+                a, b = find(i), find(j)
+                if (a != b and (cite[a] is None or cite[b] is None or cite[a] == cite[b])):
+                    a, b      = min(a, b), max(a, b)
+                    parent[b] = a
+                    cite[a]   = cite[a] if cite[a] is not None else cite[b]
+    groups = defaultdict(list)
+    for i in range(0, len(refs)):
+        groups[find(i)].append(i)
+    mapping = {}
+    for members in groups.values():
+        if (len(members) < 2):
+            continue
+        best = min(members, key = lambda i: (-counts.get(refs[i], 0), i))
+        for i in members:
+            if (i != best):
+                mapping[refs[i]] = refs[best]
+    return mapping
+
+
+############################################################################
+
+class ReferenceIndex:
+    """Persistent SQLite index of resolved references.
+
+    A reference is stored under the SHA-1 of its whitespace-normalized
+    lowercase text and of each of its ``reference_keys``, so the
+    variants of one work share rows. Each row holds
+    the ``doi``, ``title`` and ``year`` of the work the reference was
+    resolved to; later resolutions replace earlier ones. The index can be
+    pickled (it reopens by path).
+    """
+
+    _BATCH = 500
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self._open()
+
+    def _open(self):
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok = True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout = 60, check_same_thread = False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS refs (hash TEXT PRIMARY KEY, doi TEXT, title TEXT, year INTEGER)')
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    @staticmethod
+    def hashes(ref, exact = False):
+        keys = ['ref:' + ' '.join(ref.lower().split())]
+        if (not exact):
+            keys.extend(reference_keys(ref))
+        return [hashlib.sha1(key.encode('utf-8')).hexdigest() for key in keys]
+
+    def lookup(self, refs, exact = False):
+        """``(doi, title, year)`` of every reference in ``refs``, or None.
+
+        With ``exact = True`` only the reference text itself is looked up,
+        not the keys it shares with its variants.
+        """
+        hashes = [self.hashes(ref, exact) for ref in refs]
+        wanted = sorted({h for items in hashes for h in items})
+        found  = {}
+        with self._lock:
+            for k in range(0, len(wanted), self._BATCH):
+                batch = wanted[k:k + self._BATCH]
+                query = 'SELECT hash, doi, title, year FROM refs WHERE hash IN (' + ','.join('?' * len(batch)) + ')'
+                for row in self._conn.execute(query, batch):
+                    found[row[0]] = row[1:]
+        return [next((found[h] for h in items if h in found), None) for items in hashes]
+
+    def add(self, items):
+        """Record ``(ref, doi, title, year)`` resolutions in one transaction."""
+        rows = []
+        for ref, doi, title, year in items:
+            doi   = _known(doi)
+            doi   = doi.lower() if doi else None
+            title = _known(title)
+            year  = int(year) if year is not None and year == year else None
+            for h in self.hashes(ref):
+                rows.append((h, doi, title, year))
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO refs (hash, doi, title, year) VALUES (?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM refs').fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+
+def _known(value):
+    value = str(value).strip() if value is not None else ''
+    return None if value.lower() in ('', 'unknown', 'nan', 'none') else value
+
+
+def as_reference_index(reference_index):
+    """None stays None; a path opens a ``ReferenceIndex``."""
+    if isinstance(reference_index, (str, os.PathLike)):
+        return ReferenceIndex(reference_index)
+    return reference_index
+
+
+def normalize_title(title):
+    """Lowercase ASCII letters and digits of ``title``, single-spaced."""
+    text = unicodedata.normalize('NFKD', str(title).lower())
+    text = re.sub(r'[^a-z0-9 ]', ' ', text)
+    return ' '.join(text.split())
@@ -0,0 +1,300 @@
+############################################################################
+
+# pyBibX - Binary snapshot of the derived pbx_probe state.
+#
+# ``save_state`` writes everything __make_bib derives from the working
+# database into a directory, so ``load_state`` can bring a workspace
+# back without recomputing it:
+#
+#   manifest.json   scalars, small tables and the array inventory
+#   data.arrow      the working database (Arrow IPC, see cache.py)
+#   <name>.npy      one plain numpy array per stored field
+#
+# Lists of strings are kept as a UTF-8 blob plus int64 offsets. Lists of
+# lists (aut, ref, ref_id, ...) are kept CSR-style as int64 offsets into
+# an int32 array of codes into a per-field vocabulary. On load the arrays
+# are memory-mapped and the lists of lists are exposed through the
+# read-only ``RaggedList`` view, which decodes a row only when asked.
+
+############################################################################
+
+import json
+import os
+import re
+
+from collections     import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from .cache  import read_frame, write_frame
+from .entity import RaggedList, encode_ragged
+from .reader import PARSER_VERSION
+
+############################################################################
+
+STATE_FORMAT   = 'pybibx-state'
+STATE_VERSION  = 1
+
+RAGGED_FIELDS  = ('aut', 'ref', 'kid', 'auk', 'jou', 'lan', 'ctr', 'uni', 'ref_id')
+STRING_FIELDS  = ('u_aut', 'u_ref', 'u_kid', 'u_auk', 'u_jou', 'u_lan', 'u_ctr', 'u_uni', 'u_ref_id')
+NUMBER_FIELDS  = (
+                  'citation', 'aut_h', 'aut_g', 'aut_e', 'aut_j', 'aut_docs', 'aut_multi', 'aut_cit',
+                  'kid_count', 'auk_count', 'jou_count', 'jou_cit', 'lan_count', 'ctr_count', 'ctr_cit',
+                  'uni_count', 'uni_cit', 'doc_aut', 't_c', 's_c', 'r_c', 'dy_ref'
+                 )
+SCALAR_FIELDS  = ('date_str', 'date_end', 'av_d_year', 'av_c_doc', 'aut_single', 'av_doc_aut')
+PAIR_FIELDS    = (
+                  'author_country_map', 'corr_a_country_map', 'frst_a_country_map',
+                  'author_inst_map', 'corr_a_inst_map', 'frst_a_inst_map'
+                 )
+RESET_FIELDS   = (
+                  'ask_gpt_ap', 'ask_gpt_cp', 'ask_gpt_ip', 'ask_gpt_sp', 'ask_gpt_bp', 'ask_gpt_ct',
+                  'ask_gpt_ep', 'ask_gpt_ng', 'ask_gpt_rt', 'ask_gpt_sk', 'ask_gpt_wd',
+                  'top_y_x', 'heat_y_x', 'top_refs', 'rpys_pk', 'rpys_rs', 'top_co_c'
+                 )
+
+############################################################################
+
+def _encode_strings(items):
+    data    = [str(item).encode('utf-8') for item in items]
+    offsets = np.zeros(len(data) + 1, dtype = np.int64)
+    if data:
+        np.cumsum([len(item) for item in data], out = offsets[1:])
+    blob    = np.frombuffer(b''.join(data), dtype = np.uint8) if data else np.zeros(0, dtype = np.uint8)
+    return blob, offsets
+
+
+def _decode_strings(blob, offsets):
+    raw     = np.asarray(blob).tobytes()
+    offsets = np.asarray(offsets).tolist()
+    return [raw[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(0, len(offsets) - 1)]
+
+
+def _encode_int_ragged(rows):
+    indptr = np.zeros(len(rows) + 1, dtype = np.int64)
+    if rows:
+        np.cumsum([len(row) for row in rows], out = indptr[1:])
+    values = np.fromiter((int(item) for row in rows for item in row), dtype = np.int64, count = int(indptr[-1]))
+    return indptr, values
+
+
+def _decode_int_ragged(indptr, values):
+    indptr = np.asarray(indptr).tolist()
+    values = np.asarray(values).tolist()
+    return [values[indptr[i]:indptr[i + 1]] for i in range(0, len(indptr) - 1)]
+
+
+def _scalar_to_json(value):
+    if isinstance(value, np.generic):
+        return {'value': value.item(), 'dtype': value.dtype.str}
+    return {'value': value}
+
+
+def _scalar_from_json(item):
+    if 'dtype' in item:
+        return np.dtype(item['dtype']).type(item['value'])
+    return item['value']
+
+
+def _index_to_json(index):
+    return {'values': index.tolist(), 'dtype': str(index.dtype), 'name': index.name}
+
+
+def _index_from_json(item):
+    return pd.Index(item['values'], dtype = item['dtype'], name = item['name'])
+
+
+class _Writer:
+    def __init__(self, path):
+        self.path   = path
+        self.arrays = []
+
+    def array(self, name, values):
+        np.save(os.path.join(self.path, name + '.npy'), np.ascontiguousarray(values), allow_pickle = False)
+        self.arrays.append(name)
+
+    def strings(self, name, items):
+        blob, offsets = _encode_strings(items)
+        self.array(name + '.blob', blob)
+        self.array(name + '.offsets', offsets)
+
+
+class _Reader:
+    def __init__(self, path, mmap):
+        self.path = path
+        self.mode = 'r' if mmap else None
+
+    def array(self, name):
+        return np.load(os.path.join(self.path, name + '.npy'), mmap_mode = self.mode, allow_pickle = False)
+
+    def strings(self, name):
+        return _decode_strings(self.array(name + '.blob'), self.array(name + '.offsets'))
+
+############################################################################
+
+def save_state(pbx, path):
+    """Write the working database and all derived attributes of ``pbx``.
+
+    ``path`` is a directory (created if needed). The manifest is written
+    last, so an interrupted save is never mistaken for a valid snapshot.
+    Returns ``path``.
+    """
+    os.makedirs(path, exist_ok = True)
+    manifest_path = os.path.join(path, 'manifest.json')
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    writer        = _Writer(path)
+    manifest      = {
+                     'format':   STATE_FORMAT,
+                     'version':  STATE_VERSION,
+                     'parser':   PARSER_VERSION,
+                     'database': getattr(pbx, 'database', 'scopus'),
+                     'entries':  list(getattr(pbx, 'entries', [])),
+                     'vb':       list(getattr(pbx, 'vb', [])),
+                    }
+    manifest['object_columns'] = write_frame(os.path.join(path, 'data.arrow'), pbx.data)
+    manifest['scalars']        = {name: _scalar_to_json(getattr(pbx, name)) for name in SCALAR_FIELDS}
+    manifest['dy']             = {'name': pbx.dy.name, 'dtype': pbx.dy.dtype.str}
+    writer.array('dy', pbx.dy.to_numpy())
+    manifest['doc_types']      = {
+                                  'index':  _index_to_json(pbx.doc_types.index),
+                                  'values': pbx.doc_types.tolist(),
+                                  'dtype':  str(pbx.doc_types.dtype),
+                                  'name':   pbx.doc_types.name,
+                                 }
+    dy_c_year                  = pbx.dy_c_year
+    manifest['dy_c_year']      = {
+                                  'index':   _index_to_json(dy_c_year.index),
+                                  'columns': _index_to_json(dy_c_year.columns),
+                                  'values':  dy_c_year.to_numpy().tolist(),
+                                  'dtypes':  [str(dtype) for dtype in dy_c_year.dtypes],
+                                 }
+    for name in STRING_FIELDS:
+        writer.strings(name, getattr(pbx, name))
+    numbers = {}
+    for name in NUMBER_FIELDS:
+        values        = list(getattr(pbx, name))
+        array         = np.asarray(values)
+        if (array.dtype == object or array.ndim != 1):
+            array     = np.asarray(values, dtype = np.float64)
+        numbers[name] = 'numpy' if values and isinstance(values[0], np.generic) else 'python'
+        writer.array(name, array)
+    manifest['numbers'] = numbers
+    for name in RAGGED_FIELDS:
+        rows = getattr(pbx, name)
+        if isinstance(rows, RaggedList):
+            indptr, indices, vocab = rows.indptr, rows.indices, rows.vocab
+        else:
+            indptr, indices, vocab = encode_ragged(rows)
+        writer.array(name + '.indptr', indptr)
+        writer.array(name + '.indices', indices)
+        writer.strings(name + '.vocab', vocab)
+    authors            = list(pbx.author_to_papers.keys())
+    indptr, indices    = _encode_int_ragged([pbx.author_to_papers[a] for a in authors])
+    writer.strings('author_to_papers.keys', authors)
+    writer.array('author_to_papers.indptr', indptr)
+    writer.array('author_to_papers.indices', indices)
+    pairs = []
+    for name in PAIR_FIELDS:
+        mapping = getattr(pbx, name, -1)
+        if not isinstance(mapping, dict):
+            continue
+        keys         = list(mapping.keys())
+        rows         = [[row for row, _ in mapping[key]] for key in keys]
+        values       = [[value for _, value in mapping[key]] for key in keys]
+        indptr, row_codes            = _encode_int_ragged(rows)
+        _, value_codes, value_vocab  = encode_ragged(values)
+        writer.strings(name + '.keys', keys)
+        writer.array(name + '.indptr', indptr)
+        writer.array(name + '.rows', row_codes)
+        writer.array(name + '.values', value_codes)
+        writer.strings(name + '.vocab', value_vocab)
+        pairs.append(name)
+    manifest['pairs'] = pairs
+    variants                   = getattr(pbx, 'ref_variants', {})
+    manifest['canonical_refs'] = bool(getattr(pbx, 'canonical_refs', False))
+    writer.strings('ref_variants.keys', list(variants.keys()))
+    writer.strings('ref_variants.values', list(variants.values()))
+    table_id_doc      = getattr(pbx, 'table_id_doc', None)
+    documents         = table_id_doc['Document'].tolist() if table_id_doc is not None else []
+    writer.strings('table_id_doc', documents)
+    manifest['arrays'] = writer.arrays
+    with open(manifest_path + '.tmp', 'w', encoding = 'utf-8') as f_file:
+        json.dump(manifest, f_file)
+    os.replace(manifest_path + '.tmp', manifest_path)
+    return path
+
+
+def load_state(pbx, path, mmap = True):
+    """Restore onto ``pbx`` a snapshot written by ``save_state``.
+
+    With ``mmap = True`` (default) the arrays stay memory-mapped and the
+    lists of lists are ``RaggedList`` views; ``mmap = False`` loads them
+    into plain Python lists instead. The ``*_id_*`` lookup tables derived
+    from the unique lists are left to the caller to rebuild.
+    """
+    manifest_path = os.path.join(path, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError('No pyBibX state found at: ' + str(path))
+    with open(manifest_path, 'r', encoding = 'utf-8') as f_file:
+        manifest = json.load(f_file)
+    if (manifest.get('format') != STATE_FORMAT or manifest.get('version') != STATE_VERSION):
+        raise ValueError('Unsupported pyBibX state at: ' + str(path))
+    reader       = _Reader(path, mmap)
+    pbx.database = manifest['database']
+    pbx.entries  = manifest['entries']
+    pbx.vb       = manifest['vb']
+    pbx.data     = read_frame(os.path.join(path, 'data.arrow'), manifest['object_columns'])
+    for name in RESET_FIELDS:
+        setattr(pbx, name, -1)
+    pbx.natsort  = lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', s)]
+    if hasattr(pbx, '_internal_reference_doc_ids_cache'):
+        del pbx._internal_reference_doc_ids_cache
+    pbx._merge_state = None
+    for name, item in manifest['scalars'].items():
+        setattr(pbx, name, _scalar_from_json(item))
+    pbx.dy        = pd.Series(np.array(reader.array('dy'), dtype = manifest['dy']['dtype']), name = manifest['dy']['name'])
+    doc_types     = manifest['doc_types']
+    pbx.doc_types = pd.Series(doc_types['values'], index = _index_from_json(doc_types['index']), dtype = doc_types['dtype'], name = doc_types['name'])
+    dy_c_year     = manifest['dy_c_year']
+    columns       = _index_from_json(dy_c_year['columns'])
+    frame         = pd.DataFrame(dy_c_year['values'], index = _index_from_json(dy_c_year['index']), columns = columns) if len(columns) > 0 else pd.DataFrame(index = _index_from_json(dy_c_year['index']), columns = columns)
+    pbx.dy_c_year = frame.astype(dict(zip(columns, dy_c_year['dtypes']))) if len(columns) > 0 else frame
+    for name in STRING_FIELDS:
+        setattr(pbx, name, reader.strings(name))
+    for name, kind in manifest['numbers'].items():
+        array = reader.array(name)
+        setattr(pbx, name, list(array) if kind == 'numpy' else array.tolist())
+    for name in RAGGED_FIELDS:
+        indptr  = reader.array(name + '.indptr')
+        indices = reader.array(name + '.indices')
+        vocab   = reader.strings(name + '.vocab')
+        view    = RaggedList(indptr, indices, vocab)
+        setattr(pbx, name, view if mmap else view.tolist())
+    authors = reader.strings('author_to_papers.keys')
+    papers  = _decode_int_ragged(reader.array('author_to_papers.indptr'), reader.array('author_to_papers.indices'))
+    pbx.author_to_papers = defaultdict(list, zip(authors, papers))
+    for name in PAIR_FIELDS:
+        setattr(pbx, name, -1)
+    for name in manifest['pairs']:
+        keys    = reader.strings(name + '.keys')
+        indptr  = reader.array(name + '.indptr').tolist()
+        rows    = reader.array(name + '.rows').tolist()
+        codes   = reader.array(name + '.values').tolist()
+        vocab   = reader.strings(name + '.vocab')
+        mapping = {}
+        for k, key in enumerate(keys):
+            start, end   = indptr[k], indptr[k + 1]
+            mapping[key] = [(rows[j], vocab[codes[j]]) for j in range(start, end)]
+        setattr(pbx, name, mapping)
+    pbx.canonical_refs = manifest.get('canonical_refs', False)
+    pbx.ref_variants   = {}
+    if ('ref_variants.keys.blob' in manifest['arrays']):
+        pbx.ref_variants = dict(zip(reader.strings('ref_variants.keys'), reader.strings('ref_variants.values')))
+    documents        = reader.strings('table_id_doc')
+    doc_list         = [str(i) for i in range(0, len(documents))]
+    pbx.table_id_doc = pd.DataFrame(zip(doc_list, documents), columns = ['ID', 'Document'])
+    pbx.dict_id_doc  = dict(zip(doc_list, documents))
+    return pbx
+
@@ -127,15 +127,20 @@ def _col(df: pd.DataFrame, *names: str) -> Optional[str]:
 def _build_internal_ref_map(
     data: pd.DataFrame,
     u_ref: List[str],
+    index: Optional[Any] = None,
 ) -> Dict[str, int]:
     """
     Return {ref_string: paper_index} for every cited reference that can be
     matched to a paper inside the dataset.
 
     Match priority:
+      0. A ReferenceIndex entry (DOI or title of the indexed work), if given.
       1. Exact DOI match (if data has a 'doi' column and ref contains a DOI).
       2. Normalised-title match (≥ 0.85 similarity via shared trigrams).
       3. First-author + year substring match.
+
+    Matches found by 1-2 are added to ``index``; the looser first-author +
+    year matches are not.
     """
     matched: Dict[str, int] = {}
 
@@ -164,8 +169,22 @@ def _build_internal_ref_map(
     def _trigrams(s: str) -> Set[str]:
         return {s[i:i+3] for i in range(len(s) - 2)} if len(s) > 2 else set()
 
+    u_ref = [r for r in u_ref if r and r.lower() != "unknown"]
+    if index is not None:
+        for ref_str, hit in zip(u_ref, index.lookup(u_ref)):
+            if hit is None:
+                continue
+            doi, title, _ = hit
+            idx = doi_to_idx.get(doi.lower()) if doi else None
+            if idx is None and title:
+                idx = title_to_idx.get(_norm_title(title))
+            if idx is not None:
+                matched[ref_str] = idx
+    indexed = set(matched)
+    loose: Set[str] = set()
+
     for ref_str in u_ref:
-        if not ref_str or ref_str.lower() == "unknown":
+        if ref_str in indexed:
             continue
 
         # — DOI match ————————————————————————————————————
@@ -201,7 +220,18 @@ def _build_internal_ref_map(
             key = (fa_cand[:6], str(year_cand))
             if key in fy_to_idx:
                 matched[ref_str] = fy_to_idx[key]
-
+                loose.add(ref_str)
+
+    if index is not None:
+        index.add(
+            (
+                ref_str,
+                data.at[idx, doi_col] if doi_col else None,
+                data.at[idx, title_col] if title_col else None,
+                pd.to_numeric(data.at[idx, "year"], errors="coerce") if "year" in data.columns else None,
+            )
+            for ref_str, idx in matched.items() if ref_str not in indexed and ref_str not in loose
+        )
     return matched
 
 
@@ -374,7 +404,7 @@ def build_temporal_sg(pbx, cfg: TSGConfig):
             if r and _safe_str(r, "").lower() != "unknown":
                 ref_freq[r] += 1
 
-    internal_map = _build_internal_ref_map(data, list(u_ref))
+    internal_map = _build_internal_ref_map(data, list(u_ref), getattr(pbx, "ref_index", None))
     internal_paper_ids: Set[int] = set(internal_map.values())
 
     if topics is not None and len(topics) >= n_docs: